@@ -1,6 +1,27 @@
-import streamlit as st
-from game import SnakeAndLadder
+import os
 import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+
+import metrics
+from board import DEFAULT_BOARD, Board
+from history import apply_delta
+
+# The game engine (NumPy, Markov analysis) and stores are imported when first needed,
+# so the welcome screen paints without loading them
+if TYPE_CHECKING:
+    from game import SnakeAndLadder
+    from pool import GamePool
+    from session_store import SessionStore
+    from stats import StatsStore
+
+# Timed until the end of the script; runs cut short by st.rerun() are not recorded
+rerun_timer = metrics.start_timer()
+metrics.serve()
 
 # Set page configuration
 st.set_page_config(
@@ -30,78 +51,257 @@ PLAYER_ICONS = {
     "🍕": "Pizza",
 }
 
-# Custom CSS for green-based theme
-st.markdown("""
-    <style>
-    :root {
-        --primary-color: #2ecc71;
-        --secondary-color: #27ae60;
-        --background-color: #f0fdf4;
-    }
+# Moves kept in memory per game; older moves spill to a temporary file
+HISTORY_LIMIT = 4096
+
+# Games of this many players or more are large lobbies: no per-player setup, paginated standings and
+# no position map in the status (game.LOBBY_MIN_PLAYERS, not imported so the welcome screen skips the engine)
+LOBBY_MIN_PLAYERS = 5
+STANDINGS_PAGE_SIZE = 20
+
+ANIMATION_MODES = {
+    "client": "Instant (client-side animation)",
+    "server": "Classic (server-side delays)",
+}
+
+
+def show_dice(dice_value: int, animated: bool = False) -> None:
+    """
+    Show the dice result.
+    
+    Args:
+        dice_value (int): Value rolled.
+        animated (bool): Whether the browser plays the roll animation.
+    """
+    css_class = " class='dice-roll'" if animated else ""
+    st.markdown(f"<div{css_class} style='background: #2ecc71; color: white; padding: 20px; "
+                f"border-radius: 10px; text-align: center;'>"
+                f"<h2 style='margin: 0;'>Dice: {dice_value}</h2>"
+                f"</div>", unsafe_allow_html=True)
+
+
+def show_move_result(game: "SnakeAndLadder", move_result: dict) -> None:
+    """
+    Show the outcome of a move.
+    
+    Args:
+        game (SnakeAndLadder): Game the move was made in.
+        move_result (dict): Movement details returned by ``move_player``.
+    """
+    if "error" in move_result:
+        st.error(move_result["error"])
+        return
+    
+    current_player_name = game.get_player_name(move_result['player'])
+    current_player_icon = game.get_player_icon(move_result['player'])
+    
+    if "out_of_bounds" in move_result and move_result["out_of_bounds"]:
+        st.warning(f"⚠️ {current_player_icon} {current_player_name} moved from {move_result['old_position']} + "
+                   f"{move_result['dice_value']} = {move_result['position_after_roll']} (exceeds {game.board_size}) "
+                   f"❌ Turn skipped!")
+    elif move_result.get("forfeit"):
+        st.warning(f"⚠️ {current_player_icon} {current_player_name} rolled too many sixes in a row ❌ Turn forfeited!")
+    else:
+        st.success(f"✅ {current_player_icon} {current_player_name} moved from {move_result['old_position']} "
+                   f"to {move_result['final_position']}")
+        
+        if move_result['snake_or_ladder']:
+            if "Snake" in move_result['snake_or_ladder']:
+                st.error(f"🐍 {move_result['snake_or_ladder']} - Oh no!")
+            else:
+                st.success(f"🪜 {move_result['snake_or_ladder']} - Great luck!")
+        
+        if move_result.get("bounced"):
+            st.info(f"↩️ Bounced back from {game.board_size} to {move_result['position_after_roll']}")
+        if move_result.get("extra_roll"):
+            st.info(f"🎲 Six! {current_player_icon} {current_player_name} rolls again")
+        
+        if move_result.get('won'):
+            st.balloons()
+
+
+def show_autoplay_summary(game: "SnakeAndLadder", summary: dict) -> None:
+    """
+    Show the compressed move summary of an auto-played game; large lobbies show the leaders only.
+    
+    Args:
+        game (SnakeAndLadder): Game that was auto-played.
+        summary (dict): Summary returned by ``bots.play_game``.
+    """
+    rows = ["| Player | Moves | 🐍 Snakes | 🪜 Ladders | ❌ Skipped | Position |",
+            "|---|---:|---:|---:|---:|---:|"]
+    if game.num_players >= LOBBY_MIN_PLAYERS:
+        player_ids = [player_id for _, player_id, _ in game.standings(0, STANDINGS_PAGE_SIZE)]
+    else:
+        player_ids = summary["players"]
+    for player_id in player_ids:
+        counts = summary["players"][player_id]
+        rows.append(f"| {game.get_player_icon(player_id)} {game.get_player_name(player_id)} | {counts['moves']} | "
+                    f"{counts['snakes']} | {counts['ladders']} | {counts['skipped']} | {counts['position']} |")
+    st.markdown(f"<h3 style='color: #2ecc71;'>🤖 Auto-played {summary['moves']} moves</h3>", unsafe_allow_html=True)
+    st.markdown("\n".join(rows))
+
+
+def show_standings(game: "SnakeAndLadder", key: str) -> None:
+    """
+    Show one page of a large lobby's standings, read from the game's occupancy index.
+    
+    Args:
+        game (SnakeAndLadder): Current game.
+        key (str): Widget key of the page selector.
+    """
+    pages = -(-game.num_players // STANDINGS_PAGE_SIZE)
+    page = st.number_input(f"Page (of {pages}):", min_value=1, max_value=pages, value=1, step=1, key=key)
+    rows = ["| # | Player | Square |", "|---:|---|---:|"]
+    for rank, player_id, square in game.standings((page - 1) * STANDINGS_PAGE_SIZE, STANDINGS_PAGE_SIZE):
+        is_current = " 👉" if player_id == game.current_player and not game.game_over else ""
+        rows.append(f"| {rank} | {game.get_player_icon(player_id)} {game.get_player_name(player_id)}{is_current} | "
+                    f"{square}/{game.board_size} |")
+    st.markdown("\n".join(rows))
+
+
+@st.cache_resource
+def load_css() -> str:
+    """
+    Read the app stylesheet once per process.
     
-    .main {
-        background-color: #f0fdf4;
-    }
+    Returns:
+        str: Contents of static/style.css.
+    """
+    return (Path(__file__).parent / "static" / "style.css").read_text(encoding="utf-8")
+
+
+# Green theme: with static serving the browser fetches and caches the stylesheet once,
+# otherwise it is inlined from the copy read at startup
+if st.get_option("server.enableStaticServing"):
+    st.markdown("<link rel='stylesheet' href='app/static/style.css'>", unsafe_allow_html=True)
+else:
+    st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+@st.cache_resource
+def get_session_store() -> "SessionStore":
+    """
+    Get the process-wide game store, configured by the SNL_SESSION_STORE environment variable.
     
-    .stButton>button {
-        background-color: #2ecc71;
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 10px 20px;
-        font-weight: bold;
-        transition: background-color 0.3s;
-    }
+    Returns:
+        SessionStore: Write-behind store over "memory" (default), "sqlite:<path>" or "file:<directory>".
+    """
+    from session_store import WriteBehindStore, create_store
+    return WriteBehindStore(create_store(os.environ.get("SNL_SESSION_STORE", "memory")))
+
+
+@st.cache_resource
+def get_game_pool() -> "GamePool":
+    """
+    Get the process-wide pool of reset games, shared by all sessions.
     
-    .stButton>button:hover {
-        background-color: #27ae60;
-    }
+    Returns:
+        GamePool: Pool handing out games at START GAME and taking them back at NEW GAME
+        or when the session expires.
+    """
+    from pool import GamePool
+    return GamePool()
+
+
+@st.cache_resource
+def get_stats_store() -> "StatsStore":
+    """
+    Get the process-wide leaderboard database, configured by the SNL_STATS_DB environment variable.
     
-    .player-box {
-        background: linear-gradient(135deg, #2ecc71 0%, #27ae60 100%);
-        color: white;
-        padding: 20px;
-        border-radius: 10px;
-        margin: 10px 0;
-        text-align: center;
-    }
+    Returns:
+        StatsStore: SQLite statistics store, "stats.db" by default.
+    """
+    from stats import open_stats_store
+    return open_stats_store()
+
+
+@st.cache_resource
+def get_board() -> Board:
+    """
+    Get the board for new games, loaded from the SNL_BOARD file (.json or .toml) if set.
     
-    .game-board {
-        background: linear-gradient(135deg, #e8f8f5 0%, #d5f4e6 100%);
-        padding: 20px;
-        border-radius: 10px;
-        border: 3px solid #2ecc71;
-    }
+    Returns:
+        Board: Shared board instance.
+    """
+    path = os.environ.get("SNL_BOARD")
+    return Board.load(path) if path else DEFAULT_BOARD
+
+
+@metrics.timed("save_game")
+def save_game() -> None:
+    """
+    Save the current game to the session store under the key in the page URL.
     
-    .player-info {
-        font-weight: bold;
-        font-size: 18px;
-    }
+    Moves since this session last saved the game are appended to that save, so a roll
+    writes a few bytes however long the game and lobby are; a new or reset game is saved whole.
+    """
+    game, key = st.session_state.game, st.session_state.game_key
+    saved = st.session_state.get("saved")
+    moves = game.to_bytes_since(saved[2]) if saved and saved[0] == key and saved[1] is game else None
+    if moves is None:
+        get_session_store().save(key, game.to_bytes())
+    elif saved[2] != game.version:
+        get_session_store().append(key, moves)
+    st.session_state.saved = (key, game, game.version)
+
+
+def load_stored_game(game_key: str) -> Optional["SnakeAndLadder"]:
+    """
+    Load a game from the session store, treating one that cannot be read as never saved.
     
-    .snake-color {
-        color: #d32f2f;
-    }
+    Args:
+        game_key (str): Key from the page URL.
+        
+    Returns:
+        Optional[SnakeAndLadder]: Stored game, or None if there is none, the key is invalid or
+        the saved state is corrupt or from an unsupported version.
+    """
+    from game import SnakeAndLadder
+    try:
+        stored_game = get_session_store().load(game_key)
+        return SnakeAndLadder.from_bytes(stored_game, history_limit=HISTORY_LIMIT) if stored_game else None
+    except ValueError:
+        return None
+
+
+def record_finished_game(game: "SnakeAndLadder") -> None:
+    """
+    Add a finished game to the leaderboard, once: reruns of the winner view skip it.
     
-    .ladder-color {
-        color: #1976d2;
-    }
+    Games finished by AUTO-PLAY bots and games with seats still named like "Player 17"
+    are not recorded, so the leaderboard only counts people playing under their own names.
     
-    .board-cell {
-        border: 1px solid #27ae60;
-        padding: 0px;
-        border-radius: 3px;
-        text-align: center;
-        font-weight: bold;
-        height: 50px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 12px;
-        margin: 0px;
-        gap: 0px;
-    }
-    </style>
-""", unsafe_allow_html=True)
+    Args:
+        game (SnakeAndLadder): Game that just ended.
+    """
+    # The version changes with every reset, so each finished game of a session gets its own key
+    key = f"{st.session_state.game_key}-{game.version}"
+    if st.session_state.get("recorded_game") == key:
+        return
+    from stats import game_summary, is_ranked
+    # The summary stays set until the game is reset, so it marks a game the bots finished
+    if not st.session_state.get("autoplay_summary") and is_ranked(game):
+        with metrics.timer("record_stats"):
+            get_stats_store().record_game(key, game_summary(game))
+    st.session_state.recorded_game = key
+
+
+def get_status(game: "SnakeAndLadder") -> dict:
+    """
+    Get the game status, updating the session's copy with only the moves made since the last run.
+    
+    Args:
+        game (SnakeAndLadder): Current game.
+        
+    Returns:
+        dict: Status in the shape returned by ``get_game_status``.
+    """
+    cached = st.session_state.get("status")
+    if cached is None or cached[0] is not game:
+        st.session_state.status = (game, game.get_game_status())
+        return st.session_state.status[1]
+    return apply_delta(cached[1], game.events_since(cached[1]["version"]))
+
 
 # Initialize session state
 if 'game' not in st.session_state:
@@ -111,12 +311,30 @@ if 'game' not in st.session_state:
     st.session_state.players_setup = False
     st.session_state.player_names = {}
     st.session_state.player_icons = {}
+    st.session_state.last_move = None
+    st.session_state.game_key = None
+    
+    # Resume a stored game when the URL names one (after a restart or on another replica)
+    game_key = st.query_params.get("game")
+    game = load_stored_game(game_key) if game_key else None
+    if game is not None:
+        st.session_state.saved = (game_key, game, game.version)
+        st.session_state.game = game
+        st.session_state.game_initialized = True
+        st.session_state.players_setup = True
+        st.session_state.num_players = game.num_players
+        st.session_state.player_names = dict(game.player_names)
+        st.session_state.player_icons = dict(game.player_icons)
+        st.session_state.game_key = game_key
+
+# Board of the current game, or the board new games will use
+board = st.session_state.game.board if st.session_state.game else get_board()
 
 # Main Title
 st.markdown("<h1 style='text-align: center; color: #2ecc71;'>🐍 SNAKE & LADDER GAME 🪜</h1>", 
             unsafe_allow_html=True)
 st.markdown("<p style='text-align: center; color: #27ae60; font-size: 16px;'>"
-            "A challenging game where snakes outnumber ladders - will you reach 100?</p>",
+            f"A challenging game where snakes outnumber ladders - will you reach {board.size}?</p>",
             unsafe_allow_html=True)
 
 # Sidebar for game settings
@@ -124,14 +342,25 @@ with st.sidebar:
     st.markdown("<h2 style='color: #2ecc71;'>⚙️ GAME SETTINGS</h2>", unsafe_allow_html=True)
     
     if not st.session_state.players_setup:
-        num_players = st.slider(
-            "Select number of players (2-4):",
-            min_value=2,
-            max_value=4,
-            value=2,
-            step=1,
-            help="Choose how many players will play the game"
-        )
+        if st.toggle("🏟️ Large lobby", key="large_lobby", help="Classroom or audience games with many players"):
+            from game import MAX_PLAYERS
+            num_players = st.number_input(
+                f"Number of players ({LOBBY_MIN_PLAYERS}-{MAX_PLAYERS}):",
+                min_value=LOBBY_MIN_PLAYERS,
+                max_value=MAX_PLAYERS,
+                value=30,
+                step=1,
+                key="lobby_size"
+            )
+        else:
+            num_players = st.slider(
+                "Select number of players (2-4):",
+                min_value=2,
+                max_value=4,
+                value=2,
+                step=1,
+                help="Choose how many players will play the game"
+            )
         
         if st.button("➡️ NEXT: Setup Players", key="next_setup", use_container_width=True):
             st.session_state.num_players = num_players
@@ -144,39 +373,69 @@ with st.sidebar:
         st.markdown("---")
         st.markdown("<h3 style='color: #2ecc71;'>👤 PLAYER SETUP</h3>", unsafe_allow_html=True)
         
-        # Player setup form
-        for i in range(1, st.session_state.num_players + 1):
-            st.markdown(f"<p style='color: #27ae60; font-weight: bold;'>Player {i}</p>", 
-                       unsafe_allow_html=True)
-            
-            player_name = st.text_input(
-                f"Name for Player {i}:",
-                value=st.session_state.player_names.get(i, f"Player {i}"),
-                key=f"player_name_{i}",
-                placeholder=f"Enter Player {i} name"
-            )
-            
-            icon_selection = st.selectbox(
-                f"Choose icon for Player {i}:",
-                options=list(PLAYER_ICONS.keys()),
-                format_func=lambda x: f"{x} - {PLAYER_ICONS[x]}",
-                key=f"player_icon_{i}",
-                index=i-1 if i <= len(PLAYER_ICONS) else 0
-            )
-            
-            st.session_state.player_names[i] = player_name
-            st.session_state.player_icons[i] = icon_selection
+        # Large lobbies skip the form: players are numbered and take the icons in turn
+        if st.session_state.num_players >= LOBBY_MIN_PLAYERS:
+            icons = list(PLAYER_ICONS)
+            st.session_state.player_names = {i: f"Player {i}" for i in range(1, st.session_state.num_players + 1)}
+            st.session_state.player_icons = {i: icons[(i - 1) % len(icons)]
+                                             for i in range(1, st.session_state.num_players + 1)}
+            st.info("Lobby players are numbered and take the icons in turn.")
             st.markdown("---")
+        else:
+            # Player setup form
+            for i in range(1, st.session_state.num_players + 1):
+                st.markdown(f"<p style='color: #27ae60; font-weight: bold;'>Player {i}</p>", 
+                           unsafe_allow_html=True)
+                
+                player_name = st.text_input(
+                    f"Name for Player {i}:",
+                    value=st.session_state.player_names.get(i, f"Player {i}"),
+                    key=f"player_name_{i}",
+                    placeholder=f"Enter Player {i} name"
+                )
+                
+                icon_selection = st.selectbox(
+                    f"Choose icon for Player {i}:",
+                    options=list(PLAYER_ICONS.keys()),
+                    format_func=lambda x: f"{x} - {PLAYER_ICONS[x]}",
+                    key=f"player_icon_{i}",
+                    index=i-1 if i <= len(PLAYER_ICONS) else 0
+                )
+                
+                st.session_state.player_names[i] = player_name
+                st.session_state.player_icons[i] = icon_selection
+                st.markdown("---")
+            
+        from rules import RULE_PRESETS
+        rule_preset = st.selectbox(
+            "🎲 Rules:",
+            options=list(RULE_PRESETS),
+            format_func=str.capitalize,
+            key="rule_preset",
+            help="Bounce: rolls past the end count back down. Quick finish: passing the end wins. "
+                 "Sixes: a six rolls again, three in a row forfeit the turn."
+        )
         
         if st.button("🎮 START GAME", key="start_game", use_container_width=True, help="Begin the game with selected players"):
             try:
-                game = SnakeAndLadder(
+                from pool import PoolLease
+                # The lease returns the game to the pool if this session expires mid-game
+                st.session_state.game_lease = PoolLease()
+                game = get_game_pool().acquire(
                     num_players=st.session_state.num_players,
                     player_names=st.session_state.player_names,
-                    player_icons=st.session_state.player_icons
+                    player_icons=st.session_state.player_icons,
+                    history_level="packed",
+                    board=get_board(),
+                    history_limit=HISTORY_LIMIT,
+                    rules=RULE_PRESETS[rule_preset],
+                    lease=st.session_state.game_lease
                 )
                 st.session_state.game = game
                 st.session_state.game_initialized = True
+                st.session_state.game_key = uuid.uuid4().hex
+                st.query_params["game"] = st.session_state.game_key
+                save_game()
                 st.rerun()
             except Exception as e:
                 st.error(f"Error initializing game: {str(e)}")
@@ -189,37 +448,119 @@ with st.sidebar:
         st.markdown(f"<p style='color: #27ae60;'><b>👥 Players:</b> {st.session_state.num_players}</p>", 
                     unsafe_allow_html=True)
         
-        for i in range(1, st.session_state.num_players + 1):
-            player_icon = st.session_state.game.get_player_icon(i)
-            player_name = st.session_state.game.get_player_name(i)
-            st.markdown(f"<p style='color: #27ae60; margin: 5px 0;'>{player_icon} <b>{player_name}</b></p>", 
-                       unsafe_allow_html=True)
+        # Large lobbies list their players in the paginated standings instead
+        if st.session_state.num_players < LOBBY_MIN_PLAYERS:
+            for i in range(1, st.session_state.num_players + 1):
+                player_icon = st.session_state.game.get_player_icon(i)
+                player_name = st.session_state.game.get_player_name(i)
+                st.markdown(f"<p style='color: #27ae60; margin: 5px 0;'>{player_icon} <b>{player_name}</b></p>", 
+                           unsafe_allow_html=True)
+        
+        from rules import CLASSIC_RULES
+        # The Markov analysis models the classic rules only, and per-seat odds suit small games
+        if st.session_state.game.rules == CLASSIC_RULES and st.session_state.num_players < LOBBY_MIN_PLAYERS:
+            st.markdown("---")
+            st.markdown("<h3 style='color: #2ecc71;'>📈 ODDS</h3>", unsafe_allow_html=True)
+            analysis = st.session_state.game.get_board_analysis()
+            st.markdown(f"<p style='color: #27ae60; margin: 5px 0;'>Expected game length: "
+                        f"<b>{analysis.expected_game_length(st.session_state.num_players):.0f} rolls</b></p>",
+                        unsafe_allow_html=True)
+            for player_id, probability in analysis.win_probabilities(st.session_state.num_players).items():
+                player_icon = st.session_state.game.get_player_icon(player_id)
+                st.markdown(f"<p style='color: #27ae60; margin: 5px 0;'>{player_icon} Win chance: <b>{probability:.1%}</b></p>",
+                           unsafe_allow_html=True)
         
         st.markdown("---")
         
+        st.radio(
+            "🎬 Animation:",
+            options=list(ANIMATION_MODES.keys()),
+            format_func=lambda x: ANIMATION_MODES[x],
+            key="animation_mode",
+            help="Instant mode animates in the browser; classic mode pauses on the server like a live dice roll"
+        )
+        
         if st.button("🔄 RESET GAME", use_container_width=True, key="reset_game"):
             st.session_state.game.reset_game()
+            st.session_state.last_move = None
+            st.session_state.autoplay_summary = None
+            save_game()
             st.rerun()
         
         if st.button("🏠 NEW GAME", use_container_width=True, key="new_game"):
+            get_session_store().delete(st.session_state.game_key)
+            st.query_params.pop("game", None)
+            # Hand the game back for reuse; this session keeps no reference to it
+            get_game_pool().release(st.session_state.game)
+            st.session_state.game_lease = None
+            st.session_state.status = None
+            st.session_state.game_key = None
             st.session_state.game_initialized = False
             st.session_state.players_setup = False
             st.session_state.game = None
             st.session_state.player_names = {}
             st.session_state.player_icons = {}
+            st.session_state.last_move = None
+            st.session_state.autoplay_summary = None
             st.rerun()
     
     # Display Snakes and Ladders info
     if st.session_state.game_initialized or st.session_state.players_setup:
         st.markdown("---")
     st.markdown("<h3 style='color: #2ecc71;'>📋 BOARD INFO</h3>", unsafe_allow_html=True)
-    st.info("🎯 **Objective:** Be the first to reach square 100!")
-    st.warning("⚠️ **Difficulty:** More snakes (15) than ladders (8) - This game is challenging!")
+    st.info(f"🎯 **Objective:** Be the first to reach square {board.size}!")
+    st.warning(f"⚠️ **Difficulty:** More snakes ({len(board.snakes)}) than ladders ({len(board.ladders)}) - "
+               f"This game is challenging!")
 
-# Main game area
-if st.session_state.game_initialized and st.session_state.game:
+
+def roll_and_move(game: "SnakeAndLadder") -> None:
+    """
+    ROLL button callback in instant mode: play the current player's roll and save the game.
+    
+    Args:
+        game (SnakeAndLadder): Current game.
+    """
+    st.session_state.last_move = game.move_player(game.roll_dice())
+    save_game()
+
+
+def autoplay(game: "SnakeAndLadder") -> None:
+    """
+    AUTO-PLAY button callback: bots play every remaining turn in the engine, so the page
+    renders once, at the end.
+    
+    Args:
+        game (SnakeAndLadder): Current game.
+    """
+    from bots import play_game
+    st.session_state.autoplay_summary = play_game(game)
+    st.session_state.last_move = None
+    save_game()
+
+
+def rerun_game_area() -> None:
+    """
+    Rerun only the game area when it is running as a fragment, the whole script otherwise.
+    
+    A click can also arrive in a full-script run, e.g. when it is merged with a pending
+    full rerun or under ``streamlit.testing``, where a fragment-scoped rerun is not allowed.
+    """
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+
+@st.fragment
+def game_area() -> None:
+    """
+    Show the game: standings or positions, turn, progress, board and the ROLL button.
+    
+    A roll reruns only this fragment; the sidebar, stylesheet and reference stay as sent.
+    """
+    from board_render import render_board
     game = st.session_state.game
-    status = game.get_game_status()
+    status = get_status(game)
     
     # Check for winner
     if status['game_over']:
@@ -229,39 +570,50 @@ if st.session_state.game_initialized and st.session_state.game:
                    f"<h1 style='color: white;'>🎉 {winner_icon} {winner_name} WINS! 🏆</h1>"
                    f"</div>", unsafe_allow_html=True)
         st.balloons()
+        record_finished_game(game)
         
         # Show final rankings
         st.markdown("<h3 style='color: #2ecc71;'>Final Standings:</h3>", unsafe_allow_html=True)
-        sorted_positions = sorted(status['players_position'].items(), key=lambda x: x[1], reverse=True)
+        if game.num_players >= LOBBY_MIN_PLAYERS:
+            show_standings(game, "final_standings_page")
+        else:
+            sorted_positions = sorted(status['players_position'].items(), key=lambda x: x[1], reverse=True)
+            
+            cols = st.columns(len(sorted_positions))
+            for idx, (player_id, position) in enumerate(sorted_positions):
+                player_name = game.get_player_name(player_id)
+                player_icon = game.get_player_icon(player_id)
+                with cols[idx]:
+                    if player_id == status['winner']:
+                        st.markdown(f"<div class='player-box'><h2>🥇 {player_icon} {player_name}</h2><p>Position: {position}</p></div>",
+                                  unsafe_allow_html=True)
+                    else:
+                        place = ["🥈", "🥉"][idx - 1] if idx < 3 else f"{idx + 1}."
+                        st.markdown(f"<div class='player-box' style='background: linear-gradient(135deg, #95a5a6 0%, #7f8c8d 100%);'>"
+                                  f"<h2>{place} {player_icon} {player_name}</h2><p>Position: {position}</p></div>",
+                                  unsafe_allow_html=True)
         
-        cols = st.columns(len(sorted_positions))
-        for idx, (player_id, position) in enumerate(sorted_positions):
-            player_name = game.get_player_name(player_id)
-            player_icon = game.get_player_icon(player_id)
-            with cols[idx]:
-                if player_id == status['winner']:
-                    st.markdown(f"<div class='player-box'><h2>🥇 {player_icon} {player_name}</h2><p>Position: {position}</p></div>",
-                              unsafe_allow_html=True)
-                else:
-                    place = ["🥈", "🥉"][idx - 1] if idx < 3 else f"{idx + 1}."
-                    st.markdown(f"<div class='player-box' style='background: linear-gradient(135deg, #95a5a6 0%, #7f8c8d 100%);'>"
-                              f"<h2>{place} {player_icon} {player_name}</h2><p>Position: {position}</p></div>",
-                              unsafe_allow_html=True)
+        if st.session_state.get("autoplay_summary"):
+            show_autoplay_summary(game, st.session_state.autoplay_summary)
     
     else:
         # Display current game state
         col1, col2, col3 = st.columns([1, 2, 1])
         
+        lobby = game.num_players >= LOBBY_MIN_PLAYERS
         with col1:
             st.markdown("<h3 style='color: #2ecc71;'>📊 POSITIONS</h3>", unsafe_allow_html=True)
-            for player_id in range(1, st.session_state.num_players + 1):
-                pos = status['players_position'][player_id]
-                player_name = game.get_player_name(player_id)
-                player_icon = game.get_player_icon(player_id)
-                is_current = " 👉" if player_id == status['current_player'] else ""
-                st.markdown(f"<p style='font-size: 16px; color: #27ae60;'>"
-                          f"{player_icon} <b>{player_name}:</b> {pos}/100{is_current}</p>",
-                          unsafe_allow_html=True)
+            if lobby:
+                show_standings(game, "standings_page")
+            else:
+                for player_id in range(1, st.session_state.num_players + 1):
+                    pos = status['players_position'][player_id]
+                    player_name = game.get_player_name(player_id)
+                    player_icon = game.get_player_icon(player_id)
+                    is_current = " 👉" if player_id == status['current_player'] else ""
+                    st.markdown(f"<p style='font-size: 16px; color: #27ae60;'>"
+                              f"{player_icon} <b>{player_name}:</b> {pos}/{game.board_size}{is_current}</p>",
+                              unsafe_allow_html=True)
         
         with col2:
             st.markdown("<h3 style='color: #2ecc71;'>🎲 CURRENT TURN</h3>", unsafe_allow_html=True)
@@ -274,50 +626,30 @@ if st.session_state.game_initialized and st.session_state.game:
         
         with col3:
             st.markdown("<h3 style='color: #2ecc71;'>🎯 PROGRESS</h3>", unsafe_allow_html=True)
-            for player_id in range(1, st.session_state.num_players + 1):
-                pos = status['players_position'][player_id]
-                progress = (pos / 100) * 100
-                player_icon = game.get_player_icon(player_id)
-                st.progress(progress / 100, text=f"{player_icon} {int(progress)}%")
+            if lobby:
+                # Leader and players still waiting to enter the board, read from the occupancy index
+                leader = game.standings(0, 1)[0]
+                st.progress(leader[2] / game.board_size,
+                            text=f"Leader {game.get_player_icon(leader[1])} {int(leader[2] / game.board_size * 100)}%")
+                st.metric("👥 Not yet on the board", game.count_on(0))
+            else:
+                for player_id in range(1, st.session_state.num_players + 1):
+                    pos = status['players_position'][player_id]
+                    progress = (pos / game.board_size) * 100
+                    player_icon = game.get_player_icon(player_id)
+                    st.progress(progress / 100, text=f"{player_icon} {int(progress)}%")
         
         # Game board visualization (without gaps)
         st.markdown("<h3 style='color: #2ecc71;'>🎮 GAME BOARD</h3>", unsafe_allow_html=True)
+        # Read from the engine's running counters and the cached exact odds, never from move history
+        heatmap = st.toggle("🌡️ Landing heatmap", key="show_heatmap",
+                            help="Color each square by how often moves on this server end on it, "
+                                 "compared with the exact odds")
         
-        for row in range(10):
-            cols = st.columns(10, gap="small")
-            for col_idx in range(10):
-                i = row * 10 + col_idx + 1
-                
-                cell_content = str(i)
-                cell_color = "#f0fdf4"
-                player_here = None
-                
-                # Check if any player is on this square
-                for player_id, pos in status['players_position'].items():
-                    if pos == i:
-                        player_icon = game.get_player_icon(player_id)
-                        cell_content = player_icon
-                        cell_color = "#2ecc71"
-                        break
-                
-                # Check for snakes
-                if i in game.snakes:
-                    cell_color = "#ffebee"
-                    cell_content = "🐍"
-                # Check for ladders
-                elif i in game.ladders:
-                    cell_color = "#e3f2fd"
-                    cell_content = "🪜"
-                
-                with cols[col_idx]:
-                    st.markdown(
-                        f"<div style='background: {cell_color}; border: 1px solid #27ae60; "
-                        f"padding: 0px; border-radius: 3px; text-align: center; "
-                        f"font-weight: bold; width: 100%; height: 50px; display: flex; "
-                        f"align-items: center; justify-content: center; "
-                        f"font-size: 20px; margin: 0px; line-height: 50px;'>{cell_content}</div>",
-                        unsafe_allow_html=True
-                    )
+        animation_mode = st.session_state.get("animation_mode", "client")
+        last_move = st.session_state.last_move if animation_mode == "client" else None
+        with metrics.timer("board_render"):
+            render_board(game, last_move["final_position"] if last_move else None, heatmap)
         
         # Dice roll button
         st.markdown("---")
@@ -326,51 +658,44 @@ if st.session_state.game_initialized and st.session_state.game:
         
         col1, col2, col3 = st.columns([1, 1, 1])
         with col2:
-            if st.button("🎲 ROLL", use_container_width=True, key="roll_button"):
+            # Instant mode plays the roll in the button callback, before this fragment reruns,
+            # so one fragment run both makes and shows the move
+            roll_clicked = st.button("🎲 ROLL", use_container_width=True, key="roll_button",
+                                     on_click=roll_and_move if animation_mode == "client" else None, args=(game,))
+            if roll_clicked and animation_mode == "server":
+                # Classic timing for demos: holds the script thread for about 1.3 s per roll
+                st.session_state.last_move = None
                 with st.spinner("Rolling dice..."):
                     time.sleep(0.3)
                     dice_value = game.roll_dice()
-                    
-                    # Show dice result
-                    st.markdown(f"<div style='background: #2ecc71; color: white; padding: 20px; "
-                              f"border-radius: 10px; text-align: center;'>"
-                              f"<h2 style='margin: 0;'>Dice: {dice_value}</h2>"
-                              f"</div>", unsafe_allow_html=True)
-                    
-                    # Process move
+                    show_dice(dice_value)
                     move_result = game.move_player(dice_value)
+                    save_game()
                     
-                    # Display move results
-                    if "error" in move_result:
-                        st.error(move_result["error"])
-                    else:
+                    if "error" not in move_result:
                         time.sleep(0.5)
-                        
-                        current_player_name = game.get_player_name(move_result['player'])
-                        current_player_icon = game.get_player_icon(move_result['player'])
-                        
-                        if "out_of_bounds" in move_result and move_result["out_of_bounds"]:
-                            st.warning(f"⚠️ {current_player_icon} {current_player_name} moved from {move_result['old_position']} + "
-                                     f"{move_result['dice_value']} = {move_result['position_after_roll']} (exceeds 100) "
-                                     f"❌ Turn skipped!")
-                        else:
-                            st.success(f"✅ {current_player_icon} {current_player_name} moved from {move_result['old_position']} "
-                                     f"to {move_result['final_position']}")
-                            
-                            if move_result['snake_or_ladder']:
-                                if "Snake" in move_result['snake_or_ladder']:
-                                    st.error(f"🐍 {move_result['snake_or_ladder']} - Oh no!")
-                                else:
-                                    st.success(f"🪜 {move_result['snake_or_ladder']} - Great luck!")
-                            
-                            if move_result.get('won'):
-                                st.balloons()
+                    show_move_result(game, move_result)
                     
                     time.sleep(0.5)
-                    st.rerun()
+                    rerun_game_area()
+            
+            st.button("🤖 AUTO-PLAY", use_container_width=True, key="autoplay_button", on_click=autoplay,
+                      args=(game,), help="Let bots finish the game at full speed and show the result")
+            
+            if last_move:
+                show_dice(last_move["dice_value"], animated=True)
+                show_move_result(game, last_move)
+
+
+@st.fragment
+def snakes_and_ladders_reference(game: "SnakeAndLadder") -> None:
+    """
+    Show every snake and ladder, built only while the toggle is on.
     
-    # Show snakes and ladders reference
-    with st.expander("📋 View All Snakes & Ladders"):
+    Args:
+        game (SnakeAndLadder): Current game.
+    """
+    if st.toggle("📋 View All Snakes & Ladders", key="show_reference"):
         col1, col2 = st.columns(2)
         
         with col1:
@@ -391,25 +716,33 @@ if st.session_state.game_initialized and st.session_state.game:
                 ladders_info += f"**{start}** → {end}\n\n"
             st.markdown(ladders_info)
 
+
+# Main game area
+if st.session_state.game_initialized and st.session_state.game:
+    game_area()
+    snakes_and_ladders_reference(st.session_state.game)
+
 else:
     # Initial screen
     st.markdown("<div class='game-board'>", unsafe_allow_html=True)
     st.markdown("<h2 style='text-align: center; color: #2ecc71;'>Welcome to Snake & Ladder! 🎮</h2>", 
                unsafe_allow_html=True)
-    st.markdown("""
+    # The rules are built only while the toggle is on
+    if st.toggle("📖 How to Play", key="show_rules"):
+        st.markdown(f"""
     ### How to Play:
-    1. **Select Players**: Choose 2-4 players
-    2. **Setup Players**: Enter names and choose icons for each player
+    1. **Select Players**: Choose 2-4 players, or a large lobby of up to a thousand
+    2. **Setup Players**: Enter names and choose icons for each player (lobby players are numbered)
     3. **Start Game**: Click the "START GAME" button
     4. **Roll Dice**: Players take turns rolling the dice
     5. **Move Pieces**: Move according to dice value (1-6) with your chosen icon
     6. **Snakes & Ladders**: 
        - 🪜 Ladder takes you UP (good luck!)
        - 🐍 Snake takes you DOWN (watch out!)
-    7. **Win**: First player to reach square 100 wins!
+    7. **Win**: First player to reach square {board.size} wins!
     
     ### Game Difficulty:
-    - **15 Snakes** vs **8 Ladders** - This game is CHALLENGING!
+    - **{len(board.snakes)} Snakes** vs **{len(board.ladders)} Ladders** - This game is CHALLENGING!
     - Strategic play and luck are both important
     
     ### Features:
@@ -422,17 +755,19 @@ else:
     # Show statistics
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("🎯 Board Size", "100 Squares")
+        st.metric("🎯 Board Size", f"{board.size} Squares")
     with col2:
-        st.metric("🐍 Snakes", "15 (Difficult)")
+        st.metric("🐍 Snakes", f"{len(board.snakes)} (Difficult)")
     with col3:
-        st.metric("🪜 Ladders", "8 (Rare)")
+        st.metric("🪜 Ladders", f"{len(board.ladders)} (Rare)")
 
 
 # Footer
 st.markdown("---")
-st.markdown("""
+st.markdown(f"""
 <p style='text-align: center; color: #7f8c8d; font-size: 12px;'>
-🐍 Snake & Ladder Game | Made with ❤️ using Streamlit | 2-4 Players | Board Size: 1-100 | Custom Icons & Names
+🐍 Snake & Ladder Game | Made with ❤️ using Streamlit | 2-4 Players or Large Lobbies | Board Size: 1-{board.size} | Custom Icons & Names
 </p>
 """, unsafe_allow_html=True)
+
+metrics.stop_timer("app_rerun", rerun_timer)
@@ -0,0 +1,39 @@
+"""
+Measure headless bot games per minute on one core against a throughput target.
+
+Usage:
+    python benchmarks/bench_bots.py [--games N] [--players 2] [--target 100000]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bots import play_games  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=20_000, help="Games to play per run")
+    parser.add_argument("--players", type=int, default=2, help="Players per game")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs; the fastest is reported")
+    parser.add_argument("--target", type=float, default=100_000, help="Required games per minute")
+    args = parser.parse_args()
+
+    best = float("inf")
+    for run in range(args.repeat):
+        start = time.perf_counter()
+        play_games(args.games, args.players, seed=run * args.games)
+        best = min(best, time.perf_counter() - start)
+
+    rate = args.games / best * 60
+    print(f"{args.players}-player bot games: {rate:,.0f} games/min/core ({best / args.games * 1e6:.1f} µs/game)")
+    if rate < args.target:
+        print(f"Below the target of {args.target:,.0f} games/min")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
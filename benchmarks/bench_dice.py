@@ -0,0 +1,35 @@
+"""
+Compare dice rolls per second for the global ``random`` module and each dice source.
+
+Usage:
+    python benchmarks/bench_dice.py [--rolls N]
+"""
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dice import BufferedDice, RandomDice  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rolls", type=int, default=1_000_000, help="Rolls to time per source")
+    args = parser.parse_args()
+
+    sources = {
+        "random.randint (previous)": lambda: random.randint(1, 6),
+        "RandomDice": RandomDice(1).roll,
+        "BufferedDice numpy": BufferedDice(1).roll,
+        "BufferedDice urandom": BufferedDice(backend="urandom").roll,
+    }
+    for name, roll in sources.items():
+        seconds = timeit.timeit(roll, number=args.rolls)
+        print(f"{name:>26}: {args.rolls / seconds / 1e6:6.2f} M rolls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Measure how per-move, turn, standings and occupancy costs scale with lobby size.
+
+Every cost should stay flat from a 2-player game to a 1000-player lobby: moves update
+the occupancy index in O(1) and a standings page is read from it in O(board size + page).
+
+Usage:
+    python benchmarks/bench_lobby.py [--players 2 100 1000] [--moves 20000]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from game import HISTORY_PACKED, SnakeAndLadder  # noqa: E402
+
+
+def per_call(func, calls: int) -> float:
+    """
+    Time a function call, best of three runs.
+
+    Args:
+        func: Function taking no arguments.
+        calls (int): Calls per run.
+
+    Returns:
+        float: Microseconds per call.
+    """
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--players", type=int, nargs="+", default=[2, 100, 1000], help="Lobby sizes")
+    parser.add_argument("--moves", type=int, default=20_000, help="Moves to time per lobby size")
+    parser.add_argument("--page", type=int, default=20, help="Standings page size")
+    args = parser.parse_args()
+
+    print(f"{'players':>8} {'move µs':>9} {'standings page µs':>18} {'occupancy scan µs':>18}")
+    for num_players in args.players:
+        game = SnakeAndLadder(num_players, history_level=HISTORY_PACKED, seed=1)
+        dice = [(i * 7 + 3) % 6 + 1 for i in range(args.moves)]
+        start = time.perf_counter()
+        for dice_value in dice:
+            if game.game_over:
+                game.reset_game()
+            game.move_player(dice_value)
+        move = (time.perf_counter() - start) / args.moves * 1e6
+        # A middle page, as a paginated standings view would request
+        page = per_call(lambda: game.standings(num_players // 2, args.page), 2_000)
+        # What the board renderer reads: the count and first tokens of every square
+        scan = per_call(lambda: [game.players_on(square, 3) for square in range(1, game.board_size + 1)
+                                 if game.count_on(square)], 500)
+        print(f"{num_players:>8} {move:>9.2f} {page:>18.1f} {scan:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
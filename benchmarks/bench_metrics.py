@@ -0,0 +1,61 @@
+"""
+Measure the per-move overhead of the metrics layer when disabled and enabled.
+
+Each configuration runs in a fresh interpreter because metrics are configured at import.
+
+Usage:
+    python benchmarks/bench_metrics.py [--moves N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+
+MOVE_LOOP = """
+import time
+from game import SnakeAndLadder
+
+game = SnakeAndLadder(4, history_level="off", seed=1)
+start = time.perf_counter()
+for _ in range({moves}):
+    if game.game_over:
+        game.reset_game()
+    game.move_player(game.roll_dice())
+    game.get_game_status()
+print((time.perf_counter() - start) / {moves} * 1e9)
+"""
+
+
+def time_moves(moves: int, metrics_enabled: bool) -> float:
+    """
+    Time a loop of roll, move and status calls in a fresh interpreter.
+
+    Args:
+        moves (int): Moves to play.
+        metrics_enabled (bool): Value of SNL_METRICS for the run.
+
+    Returns:
+        float: Nanoseconds per move.
+    """
+    env = dict(os.environ, SNL_METRICS="1" if metrics_enabled else "0")
+    output = subprocess.run([sys.executable, "-c", MOVE_LOOP.format(moves=moves)], cwd=REPO, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return float(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--moves", type=int, default=200_000, help="Moves per run")
+    args = parser.parse_args()
+
+    disabled = min(time_moves(args.moves, False) for _ in range(3))
+    enabled = min(time_moves(args.moves, True) for _ in range(3))
+    print(f"metrics disabled: {disabled:8.0f} ns/move")
+    print(f"metrics enabled:  {enabled:8.0f} ns/move ({enabled / disabled - 1:+.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measure session create/teardown throughput and peak RSS with and without the game pool.
+
+Each session starts a game the way START GAME does (packed history with a memory
+limit), plays a few moves and is torn down, as on NEW GAME, while ``--live`` other
+sessions stay open. Without the pool every session builds a new game and drops it;
+with it, games are acquired from and released to a ``GamePool``. Each mode runs in its
+own process so peak RSS is measured separately.
+
+Usage:
+    python benchmarks/bench_pool.py [--sessions 100000] [--live 500] [--moves 20]
+"""
+import argparse
+import gc
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from game import HISTORY_PACKED, SnakeAndLadder  # noqa: E402
+from pool import GamePool  # noqa: E402
+
+MODES = ("new", "pool")
+
+
+def run(mode: str, sessions: int, live: int, moves: int) -> dict:
+    """
+    Run the session workload in this process.
+
+    Args:
+        mode (str): "new" to build a game per session, "pool" to use a ``GamePool``.
+        sessions (int): Sessions to create and tear down.
+        live (int): Sessions open at the same time.
+        moves (int): Moves played per session.
+
+    Returns:
+        dict: ``sessions_per_s``, ``peak_rss_mib``, ``gc_collections`` and, with the pool, its ``stats``.
+    """
+    pool = GamePool(max_idle=live) if mode == "pool" else None
+    open_games = [None] * live
+    collections = sum(stat["collections"] for stat in gc.get_stats())
+    start = time.perf_counter()
+    for session in range(sessions):
+        slot = session % live
+        # Tear down the oldest open session
+        if open_games[slot] is not None and pool is not None:
+            pool.release(open_games[slot])
+        num_players = 2 + session % 3
+        names = {i: f"Player {i}" for i in range(1, num_players + 1)}
+        icons = {i: "🔵" for i in range(1, num_players + 1)}
+        if pool is not None:
+            game = pool.acquire(num_players, names, icons, HISTORY_PACKED, seed=session, history_limit=4096)
+        else:
+            game = SnakeAndLadder(num_players, names, icons, HISTORY_PACKED, seed=session, history_limit=4096)
+        for _ in range(moves):
+            if game.game_over:
+                break
+            game.move_player(game.roll_dice())
+        open_games[slot] = game
+    elapsed = time.perf_counter() - start
+    result = {
+        "sessions_per_s": sessions / elapsed,
+        "peak_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "gc_collections": sum(stat["collections"] for stat in gc.get_stats()) - collections
+    }
+    if pool is not None:
+        result["stats"] = pool.stats()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100_000, help="Sessions to create and tear down")
+    parser.add_argument("--live", type=int, default=500, help="Sessions open at the same time")
+    parser.add_argument("--moves", type=int, default=20, help="Moves played per session")
+    parser.add_argument("--mode", choices=MODES, help="Run one mode in this process and print JSON")
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run(args.mode, args.sessions, args.live, args.moves)))
+        return
+
+    print(f"{args.sessions:,} sessions, {args.live} open at a time, {args.moves} moves each")
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--sessions", str(args.sessions),
+             "--live", str(args.live), "--moves", str(args.moves)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output)
+        print(f"  {mode:>4}: {result['sessions_per_s']:9,.0f} sessions/s, peak RSS {result['peak_rss_mib']:6.1f} MiB, "
+              f"{result['gc_collections']:5} GC collections")
+        if "stats" in result:
+            print(f"        pool: {result['stats']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Measure server CPU time and bytes sent per ROLL click against a live ``streamlit run`` server.
+
+A headless client speaks Streamlit's WebSocket protocol the way the browser does: it
+starts a two-player game, then clicks ROLL (resetting finished games) and records
+the server process's CPU time (from /proc, so Linux only) and the bytes of the
+messages sent back for every roll. Point ``--app`` at an older checkout of app.py
+to compare before and after a change. Requires ``pip install websockets``.
+
+Usage:
+    python benchmarks/bench_reruns.py [--rolls 50] [--app path/to/app.py]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.asyncio.client import connect
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+def cpu_seconds(pid: int) -> float:
+    """
+    Get the user plus system CPU time a process has used.
+
+    Args:
+        pid (int): Process ID.
+
+    Returns:
+        float: Seconds of CPU time.
+    """
+    with open(f"/proc/{pid}/stat") as f:
+        # Fields after the parenthesised command name; utime and stime are the 12th and 13th
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+class Client:
+    """
+    Minimal Streamlit browser stand-in: sends reruns and button clicks, tracks buttons.
+    """
+
+    def __init__(self, websocket):
+        """
+        Wrap an open connection to ``/_stcore/stream``.
+
+        Args:
+            websocket: Client connection from ``websockets``.
+        """
+        self.websocket = websocket
+        self.page_script_hash = ""
+        # Button key to (widget ID, fragment ID), as last sent by the server
+        self.buttons: Dict[str, Tuple[str, str]] = {}
+        # Keys of the buttons sent during the last run
+        self.seen = set()
+
+    async def run(self, widget_id: Optional[str] = None, fragment_id: str = "") -> int:
+        """
+        Request a script run, optionally clicking a button, and wait for it to finish.
+
+        Args:
+            widget_id (str): Button to click. Defaults to None, a plain rerun.
+            fragment_id (str): Fragment the button belongs to, for a fragment-scoped run.
+
+        Returns:
+            int: Bytes of the messages the server sent for the run.
+        """
+        message = BackMsg()
+        state = message.rerun_script
+        state.page_script_hash = self.page_script_hash
+        state.fragment_id = fragment_id
+        if widget_id:
+            widget = state.widget_states.widgets.add()
+            widget.id = widget_id
+            widget.trigger_value = True
+        await self.websocket.send(message.SerializeToString())
+
+        received = 0
+        self.seen = set()
+        while True:
+            data = await self.websocket.recv()
+            received += len(data)
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            kind = forward.WhichOneof("type")
+            if kind == "new_session":
+                self.page_script_hash = self.page_script_hash or forward.new_session.main_script_hash
+            elif kind == "delta" and forward.delta.new_element.WhichOneof("type") == "button":
+                button = forward.delta.new_element.button
+                key = button.id.rsplit("-", 1)[-1]
+                self.buttons[key] = (button.id, forward.delta.fragment_id)
+                self.seen.add(key)
+            elif kind == "script_finished":
+                # A run cut short by st.rerun() is followed by the rerun itself
+                if forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return received
+                self.seen = set()
+
+    async def click(self, key: str) -> int:
+        """
+        Click a button by its widget key.
+
+        Args:
+            key (str): Widget key.
+
+        Returns:
+            int: Bytes of the messages the server sent for the resulting run.
+        """
+        widget_id, fragment_id = self.buttons[key]
+        return await self.run(widget_id, fragment_id)
+
+
+async def measure(port: int, pid: int, rolls: int) -> Tuple[List[float], List[int]]:
+    """
+    Start a game on a running server and click ROLL repeatedly.
+
+    Args:
+        port (int): Server port.
+        pid (int): Server process ID.
+        rolls (int): ROLL clicks to measure.
+
+    Returns:
+        Tuple[List[float], List[int]]: Server CPU seconds and bytes received for every roll.
+    """
+    async with connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"],
+                       max_size=None) as websocket:
+        client = Client(websocket)
+        await client.run()
+        await client.click("next_setup")
+        await client.click("start_game")
+
+        cpu, sent = [], []
+        while len(sent) < rolls:
+            before = cpu_seconds(pid)
+            sent.append(await client.click("roll_button"))
+            cpu.append(cpu_seconds(pid) - before)
+            # No ROLL button in the new screen means the game is over
+            if "roll_button" not in client.seen:
+                await client.click("reset_game")
+        return cpu, sent
+
+
+def wait_for_port(port: int, timeout: float = 60) -> None:
+    """
+    Wait until a local server accepts connections.
+
+    Args:
+        port (int): Port to probe.
+        timeout (float): Seconds to wait. Defaults to 60.
+
+    Raises:
+        RuntimeError: If the port does not open in time.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.2)
+    raise RuntimeError(f"Streamlit did not start on port {port}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--app", type=Path, default=REPO / "app.py", help="App script to serve")
+    parser.add_argument("--rolls", type=int, default=50, help="ROLL clicks to measure")
+    parser.add_argument("--port", type=int, default=8599, help="Port for the Streamlit server")
+    args = parser.parse_args()
+
+    app = args.app.resolve()
+    env = dict(os.environ, SNL_METRICS="0")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(app), "--server.headless", "true",
+         "--server.port", str(args.port), "--browser.gatherUsageStats", "false"],
+        cwd=app.parent, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_port(args.port)
+        cpu, sent = asyncio.run(measure(args.port, server.pid, args.rolls))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{app}: {len(sent)} rolls")
+    print(f"  server CPU per roll: mean {statistics.mean(cpu) * 1e3:7.1f} ms, "
+          f"median {statistics.median(cpu) * 1e3:7.1f} ms")
+    print(f"  bytes sent per roll: mean {statistics.mean(sent):9,.0f}, median {statistics.median(sent):9,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Measure how many ROLL clicks one app process can serve per second in each animation mode.
+
+Usage:
+    python benchmarks/bench_roll.py [--rolls N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = Path(__file__).resolve().parents[1] / "app.py"
+sys.path.insert(0, str(APP_PATH.parent))
+
+
+def start_game() -> AppTest:
+    """
+    Run the app headlessly up to the first roll of a two-player game.
+
+    Returns:
+        AppTest: App ready for ROLL clicks.
+    """
+    app = AppTest.from_file(str(APP_PATH), default_timeout=60).run()
+    app.button(key="next_setup").click().run()
+    app.button(key="start_game").click().run()
+    return app
+
+
+def bench_mode(mode: str, rolls: int) -> float:
+    """
+    Click ROLL repeatedly in one animation mode.
+
+    Args:
+        mode (str): "client" or "server".
+        rolls (int): Number of rolls to time.
+
+    Returns:
+        float: Rolls per second.
+    """
+    app = start_game()
+    app.session_state["animation_mode"] = mode
+    done = 0
+    start = time.perf_counter()
+    while done < rolls:
+        if app.session_state["game"].game_over:
+            app.button(key="reset_game").click().run()
+        app.button(key="roll_button").click().run()
+        done += 1
+    return done / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rolls", type=int, default=20, help="Rolls to time per mode")
+    args = parser.parse_args()
+
+    for mode in ("server", "client"):
+        print(f"{mode:>6}: {bench_mode(mode, args.rolls):8.2f} rolls/s")
+
+
+if __name__ == "__main__":
+    main()
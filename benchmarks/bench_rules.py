@@ -0,0 +1,52 @@
+"""
+Compare move throughput of every rule preset with the classic rules.
+
+Each preset is compiled into a move table once per game, so variant games should move
+as fast as classic ones, both through ``move_player`` and in ``simulate_batch``.
+
+Usage:
+    python benchmarks/bench_rules.py [--moves N] [--games N]
+"""
+import argparse
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from game import HISTORY_PACKED, SnakeAndLadder  # noqa: E402
+from rules import RULE_PRESETS  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--moves", type=int, default=100_000, help="Moves to time per preset and run")
+    parser.add_argument("--games", type=int, default=20_000, help="Games per batch simulation")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs; the fastest is reported")
+    args = parser.parse_args()
+
+    games = {name: SnakeAndLadder(4, history_level=HISTORY_PACKED, seed=0, rules=rules)
+             for name, rules in RULE_PRESETS.items()}
+    per_move = dict.fromkeys(games, float("inf"))
+    # Presets take turns within each run, so noise on a busy machine hits them alike
+    for _ in range(args.repeat):
+        for name, game in games.items():
+            move_player, roll_dice, reset_game = game.move_player, game.roll_dice, game.reset_game
+            start = time.perf_counter()
+            for _ in range(args.moves):
+                if game.game_over:
+                    reset_game()
+                move_player(roll_dice())
+            per_move[name] = min(per_move[name], (time.perf_counter() - start) / args.moves)
+
+    print(f"{'rules':>18} {'move_player':>14} {'vs classic':>11} {'simulate_batch':>16} {'rolls/game':>11}")
+    for name, game in games.items():
+        batch = min(timeit.repeat(lambda: game.simulate_batch(args.games, seed=0), number=1, repeat=3))
+        turns = game.simulate_batch(args.games, seed=0)["turns"].mean()
+        # Variants change game length, so batch throughput is compared per roll, not per game
+        print(f"{name:>18} {per_move[name] * 1e6:11.2f} µs {per_move[name] / per_move['classic']:10.2f}x "
+              f"{args.games * turns / batch / 1e6:9.2f} M rolls/s {turns:11.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Measure the cost of serializing and restoring a game as its move history grows.
+
+Usage:
+    python benchmarks/bench_serialization.py [--moves 10 100 1000]
+"""
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from game import HISTORY_LEVELS, SnakeAndLadder  # noqa: E402
+
+
+def play(moves: int, history_level: str) -> SnakeAndLadder:
+    """
+    Play a game for a number of moves, starting over whenever someone wins.
+
+    Args:
+        moves (int): Moves to record.
+        history_level (str): History level of the game.
+
+    Returns:
+        SnakeAndLadder: Game holding the moves.
+    """
+    random.seed(0)
+    game = SnakeAndLadder(4, history_level=history_level)
+    for _ in range(moves):
+        # Keep playing past a win so the history reaches the requested length
+        if game.game_over:
+            game.game_over = False
+        game.move_player(game.roll_dice())
+    return game
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--moves", type=int, nargs="+", default=[10, 100, 1000], help="History lengths to test")
+    args = parser.parse_args()
+
+    print(f"{'level':>7} {'moves':>6} {'bytes':>7} {'save µs':>9} {'load µs':>9} {'µs/move':>8}")
+    for history_level in HISTORY_LEVELS:
+        for moves in args.moves:
+            game = play(moves, history_level)
+            data = game.to_bytes()
+            runs = 200
+            save = timeit.timeit(game.to_bytes, number=runs) / runs * 1e6
+            load = timeit.timeit(lambda: SnakeAndLadder.from_bytes(data), number=runs) / runs * 1e6
+            print(f"{history_level:>7} {moves:>6} {len(data):>7} {save:>9.1f} {load:>9.1f} "
+                  f"{(save + load) / moves:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
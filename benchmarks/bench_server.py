@@ -0,0 +1,135 @@
+"""
+Load-test the multiplayer game server with many concurrent rooms and report move latency.
+
+Every room is played to the end by bot clients that roll as soon as it is their turn.
+Latency is measured from sending a roll to receiving the broadcast move. By default
+clients talk to the server through in-memory queues, which isolates the server's own
+cost; ``--websocket`` runs the same load over real localhost WebSocket connections.
+
+Usage:
+    python benchmarks/bench_server.py [--rooms 2000] [--players 2] [--websocket]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from server import GameServer  # noqa: E402
+
+
+class MemoryConnection:
+    """
+    In-process stand-in for a WebSocket connection, as seen from the server.
+    """
+
+    def __init__(self):
+        self.inbox = asyncio.Queue()
+        self.outbox = asyncio.Queue()
+
+    async def send(self, text: str) -> None:
+        self.inbox.put_nowait(text)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        text = await self.outbox.get()
+        if text is None:
+            raise StopAsyncIteration
+        return text
+
+
+async def play(room: str, players: int, send, receive, latencies: list) -> None:
+    """
+    Join a room and roll whenever it is this client's turn until the game ends.
+
+    Args:
+        room (str): Room to join.
+        players (int): Seats in the room.
+        send: Coroutine function sending a text message to the server.
+        receive: Coroutine function returning the next text message from the server.
+        latencies (list): Receives the roll-to-move latency of each of this client's moves, in seconds.
+    """
+    await send(json.dumps({"type": "join", "room": room, "players": players}))
+    joined = json.loads(await receive())
+    me = joined["player"]
+    seated = len(joined["state"]["seated"])
+    current = joined["state"]["current_player"]
+    sent_at = None
+
+    while True:
+        if seated == players and current == me and sent_at is None:
+            sent_at = time.perf_counter()
+            await send('{"type":"roll"}')
+        message = json.loads(await receive())
+        if message["type"] == "player_joined":
+            seated += 1
+        elif message["type"] == "move":
+            if message["player"] == me:
+                latencies.append(time.perf_counter() - sent_at)
+                sent_at = None
+            if message["winner"]:
+                return
+            current = message["next"]
+        elif message["type"] == "error":
+            raise RuntimeError(message["message"])
+
+
+async def run_memory(rooms: int, players: int, latencies: list) -> None:
+    server = GameServer()
+    tasks = []
+    for room in range(rooms):
+        for _ in range(players):
+            connection = MemoryConnection()
+            tasks.append(asyncio.create_task(server.handle_connection(connection)))
+            tasks.append(asyncio.create_task(
+                play(str(room), players, connection.outbox.put, connection.inbox.get, latencies)
+            ))
+    await asyncio.gather(*tasks[1::2])
+    for task in tasks[::2]:
+        task.cancel()
+
+
+async def run_websocket(rooms: int, players: int, latencies: list) -> None:
+    from websockets.asyncio.client import connect
+    from server import serve
+
+    async def client(room: str) -> None:
+        async with connect(f"ws://localhost:{port}", max_queue=None) as connection:
+            await play(room, players, connection.send, connection.recv, latencies)
+
+    port = 8765
+    server_task = asyncio.create_task(serve("localhost", port))
+    await asyncio.sleep(0.2)
+    try:
+        await asyncio.gather(*(client(str(room)) for room in range(rooms) for _ in range(players)))
+    finally:
+        server_task.cancel()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=2000, help="Concurrent rooms")
+    parser.add_argument("--players", type=int, default=2, help="Players per room")
+    parser.add_argument("--websocket", action="store_true", help="Use localhost WebSocket connections")
+    args = parser.parse_args()
+
+    latencies = []
+    start = time.perf_counter()
+    run = run_websocket if args.websocket else run_memory
+    asyncio.run(run(args.rooms, args.players, latencies))
+    elapsed = time.perf_counter() - start
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"{args.rooms} rooms, {args.rooms * args.players} clients, {len(latencies)} moves in {elapsed:.1f} s "
+          f"({len(latencies) / elapsed:,.0f} moves/s)")
+    print(f"move latency p50 {cuts[49] * 1e3:.2f} ms, p99 {cuts[98] * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Measure cold-start cost: import time of the app's modules and time to first render.
+
+Every measurement runs in a fresh interpreter. Import times come from
+``python -X importtime``; render times come from a headless ``streamlit.testing``
+AppTest run of the welcome screen and of the first game screen, after Streamlit's own
+one-time setup has been paid on an empty script.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+REPO = Path(__file__).resolve().parents[1]
+
+MODULES = ("streamlit", "metrics", "board", "history", "session_store", "board_render", "game")
+
+FIRST_RENDER = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+
+# Pay Streamlit's own one-time setup (component discovery, runtime) on an empty script first
+AppTest.from_string("import streamlit as st").run()
+
+start = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=120).run()
+welcome = time.perf_counter() - start
+engine_loaded = "game" in sys.modules
+
+start = time.perf_counter()
+at.run()
+rerun = time.perf_counter() - start
+
+at.button(key="next_setup").click().run()
+start = time.perf_counter()
+at.button(key="start_game").click().run()
+game_screen = time.perf_counter() - start
+print(json.dumps({"welcome": welcome, "rerun": rerun, "game_screen": game_screen, "engine_loaded": engine_loaded}))
+"""
+
+
+def import_time(module: str) -> float:
+    """
+    Get the cumulative import time of a module in a fresh interpreter.
+
+    Args:
+        module (str): Module to import.
+
+    Returns:
+        float: Milliseconds, including the module's own imports.
+    """
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=REPO,
+                            capture_output=True, text=True, check=True).stderr
+    for line in stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def first_render() -> Dict:
+    """
+    Time the first renders of the app in a fresh interpreter.
+
+    Returns:
+        Dict: Seconds for the welcome screen, a rerun of it and the first game screen, and
+        whether the game engine was imported for the welcome screen.
+    """
+    env = dict(os.environ, SNL_METRICS="0")
+    output = subprocess.run([sys.executable, "-c", FIRST_RENDER, str(REPO / "app.py")], cwd=REPO, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the fastest is reported")
+    args = parser.parse_args()
+
+    print("import time (cumulative)")
+    for module in MODULES:
+        print(f"  {module:14} {min(import_time(module) for _ in range(args.repeat)):8.1f} ms")
+
+    runs = [first_render() for _ in range(args.repeat)]
+    print("first render (AppTest)")
+    for key in ("welcome", "rerun", "game_screen"):
+        print(f"  {key:14} {min(run[key] for run in runs) * 1e3:8.1f} ms")
+    print(f"  game engine imported for welcome screen: {runs[0]['engine_loaded']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measure leaderboard and player lookups after recording many games in the statistics database.
+
+Games are synthetic summaries of 2-4 players drawn from a pool of names, recorded in
+batches through ``StatsStore.record_games``. Lookups should stay in the millisecond
+range however many games were recorded.
+
+Usage:
+    python benchmarks/bench_stats.py [--games 1000000] [--names 10000] [--db stats-bench.db]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from stats import StatsStore  # noqa: E402
+
+
+def synthetic_games(count: int, names: int, seed: int):
+    """
+    Generate game summaries in the shape returned by ``stats.game_summary``.
+
+    Args:
+        count (int): Games to generate.
+        names (int): Size of the player name pool.
+        seed (int): Random seed.
+
+    Yields:
+        Tuple[str, Dict]: (key, summary) pairs.
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        players = {}
+        for name in rng.sample(range(names), rng.randint(2, 4)):
+            players[f"Player {name}"] = {"turns": rng.randint(5, 60), "snakes": rng.randint(0, 6),
+                                         "ladders": rng.randint(0, 4), "skipped": rng.randint(0, 5), "won": 0}
+        winner = rng.choice(list(players))
+        players[winner]["won"] = 1
+        yield f"bench-{seed}-{i}", {"moves": sum(p["turns"] for p in players.values()), "winner": winner,
+                                    "players": players}
+
+
+def best_ms(func, repeat: int = 200) -> float:
+    """
+    Time a call, best of ``repeat`` runs.
+
+    Args:
+        func: Function taking no arguments.
+        repeat (int): Runs.
+
+    Returns:
+        float: Milliseconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=1_000_000, help="Games to record")
+    parser.add_argument("--names", type=int, default=10_000, help="Distinct player names")
+    parser.add_argument("--batch", type=int, default=10_000, help="Games per transaction")
+    parser.add_argument("--db", help="Database file. Defaults to a temporary file")
+    args = parser.parse_args()
+
+    directory = tempfile.TemporaryDirectory()
+    store = StatsStore(args.db or os.path.join(directory.name, "stats.db"))
+    games = synthetic_games(args.games, args.names, seed=0)
+    start = time.perf_counter()
+    recorded = 0
+    while recorded < args.games:
+        batch = [next(games) for _ in range(min(args.batch, args.games - recorded))]
+        recorded += store.record_games(batch)
+    elapsed = time.perf_counter() - start
+    print(f"recorded {recorded:,} games in {elapsed:.1f} s ({recorded / elapsed:,.0f} games/s)")
+
+    # One more game through the single-game path the app uses
+    key, summary = next(synthetic_games(1, args.names, seed=1))
+    timings = {
+        "record_game": best_ms(lambda: store.record_game(key, summary), 1),
+        "top_players(10)": best_ms(lambda: store.top_players(10)),
+        "top_players(10, 'games')": best_ms(lambda: store.top_players(10, "games")),
+        "player(name)": best_ms(lambda: store.player("Player 42")),
+        "recent_games(10)": best_ms(lambda: store.recent_games(10)),
+    }
+    for name, ms in timings.items():
+        print(f"  {name:<26} {ms:8.3f} ms")
+    store.close()
+    directory.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Performance regression suite for the engine and the app's render path.
+
+Runs every registered benchmark, compares it with a stored baseline and exits with
+status 1 when any result is worse than the baseline by more than the threshold.
+Baselines depend on the machine, so record one on the machine that runs the checks.
+
+Usage:
+    python benchmarks/suite.py --save                 # record benchmarks/baseline.json
+    python benchmarks/suite.py [--threshold 25]       # compare against it
+    python benchmarks/suite.py --only moves status    # run some benchmarks only
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from game import HISTORY_FULL, HISTORY_OFF, HISTORY_PACKED, SnakeAndLadder  # noqa: E402
+
+REPO = Path(__file__).resolve().parents[1]
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+class Benchmark(NamedTuple):
+    func: Callable[[], float]
+    unit: str
+    higher_is_better: bool
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, unit: str, higher_is_better: bool = False) -> Callable:
+    """
+    Register a function returning one measurement.
+
+    Args:
+        name (str): Benchmark name, the key in the baseline file.
+        unit (str): Unit of the measurement.
+        higher_is_better (bool): Whether larger results are improvements. Defaults to False.
+
+    Returns:
+        Callable: Decorator registering the function unchanged.
+    """
+    def register(func: Callable[[], float]) -> Callable[[], float]:
+        BENCHMARKS[name] = Benchmark(func, unit, higher_is_better)
+        return func
+    return register
+
+
+def best_time(func: Callable[[], None], number: int, repeat: int = 5) -> float:
+    """
+    Time a function, keeping the fastest of several runs to filter out noise.
+
+    Args:
+        func (Callable[[], None]): Function to time.
+        number (int): Calls per run.
+        repeat (int): Runs. Defaults to 5.
+
+    Returns:
+        float: Seconds per call in the fastest run.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def play(moves: int, history_level: str) -> SnakeAndLadder:
+    """
+    Play a seeded 4-player game for a number of moves, continuing past wins.
+
+    Args:
+        moves (int): Moves to play.
+        history_level (str): History level of the game.
+
+    Returns:
+        SnakeAndLadder: Game holding the moves.
+    """
+    game = SnakeAndLadder(4, history_level=history_level, seed=0)
+    for _ in range(moves):
+        if game.game_over:
+            game.game_over = False
+        game.move_player(game.roll_dice())
+    return game
+
+
+@benchmark("moves", "moves/s", higher_is_better=True)
+def bench_moves() -> float:
+    game = SnakeAndLadder(4, history_level=HISTORY_PACKED, seed=0)
+
+    def move() -> None:
+        if game.game_over:
+            game.reset_game()
+        game.move_player(game.roll_dice())
+    return 1 / best_time(move, 20_000)
+
+
+@benchmark("status", "µs/call")
+def bench_status() -> float:
+    game = play(100, HISTORY_PACKED)
+    return best_time(game.get_game_status, 20_000) * 1e6
+
+
+@benchmark("simulate_batch", "games/s", higher_is_better=True)
+def bench_simulate_batch() -> float:
+    game = SnakeAndLadder(4, history_level=HISTORY_OFF)
+    return 20_000 / best_time(lambda: game.simulate_batch(20_000, seed=0), 1, repeat=3)
+
+
+@benchmark("bot_games", "games/min", higher_is_better=True)
+def bench_bot_games() -> float:
+    from bots import play_games
+    return 60 / best_time(lambda: play_games(2000), 1, repeat=3) * 2000
+
+
+def memory_per_game(history_level: str, moves: int = 1000) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    game = play(moves, history_level)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del game
+    return used / 1024
+
+
+@benchmark("memory_full_1000", "KiB")
+def bench_memory_full() -> float:
+    return memory_per_game(HISTORY_FULL)
+
+
+@benchmark("memory_packed_1000", "KiB")
+def bench_memory_packed() -> float:
+    return memory_per_game(HISTORY_PACKED)
+
+
+@benchmark("serialize_1000", "µs/round trip")
+def bench_serialize() -> float:
+    game = play(1000, HISTORY_PACKED)
+    return best_time(lambda: SnakeAndLadder.from_bytes(game.to_bytes()), 200) * 1e6
+
+
+@benchmark("render_roll", "ms/rerun")
+def bench_render_roll() -> float:
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(REPO / "app.py"), default_timeout=60).run()
+    at.button(key="next_setup").click().run()
+    at.button(key="start_game").click().run()
+    at.button(key="roll_button").click().run()
+
+    def roll() -> None:
+        if at.session_state.game.game_over:
+            at.session_state.game.reset_game()
+        at.button(key="roll_button").click().run()
+    return best_time(roll, 5) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline file")
+    parser.add_argument("--save", action="store_true", help="Record the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=25.0, help="Allowed slowdown in percent")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    results = {}
+    regressions = []
+    print(f"{'benchmark':20} {'result':>12} {'baseline':>12} {'change':>8}  unit")
+    for name in args.only or BENCHMARKS:
+        func, unit, higher_is_better = BENCHMARKS[name]
+        results[name] = value = func()
+        reference = baseline.get(name)
+        if reference:
+            # Positive change means slower (or bigger), whichever way the metric points
+            change = (reference / value - 1 if higher_is_better else value / reference - 1) * 100
+            flag = "  REGRESSION" if change > args.threshold else ""
+            if flag:
+                regressions.append(name)
+            print(f"{name:20} {value:12.2f} {reference:12.2f} {change:+7.1f}%  {unit}{flag}")
+        else:
+            print(f"{name:20} {value:12.2f} {'-':>12} {'-':>8}  {unit}")
+
+    if args.save:
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=2) + "\n")
+        print(f"Baseline saved to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:g}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
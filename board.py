@@ -0,0 +1,286 @@
+import hashlib
+import json
+import random
+import threading
+import weakref
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+class Board:
+    """
+    Immutable, validated Snake and Ladder board.
+
+    The layout is checked once and compiled into a flat ``jump`` tuple mapping every
+    square to where a player landing on it ends up, so resolving a landing is a
+    single index. Boards are cached by content hash: games with the same layout
+    share one instance instead of copying the snake and ladder dictionaries. The
+    cache holds boards weakly, so random or uploaded layouts are dropped once
+    nothing uses them.
+    """
+
+    MAX_SIZE = 10_000
+
+    __slots__ = ("size", "snakes", "ladders", "jump", "key", "__weakref__")
+
+    _cache = weakref.WeakValueDictionary()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, size: int, snakes: Mapping[int, int], ladders: Mapping[int, int], strict: bool = False):
+        """
+        Validate and compile a layout. Prefer ``Board.create``, which reuses cached boards.
+
+        Args:
+            size (int): Number of squares (2 to ``MAX_SIZE``).
+            snakes (Mapping[int, int]): Snake head to tail squares.
+            ladders (Mapping[int, int]): Ladder foot to top squares.
+            strict (bool): Also reject chains. Defaults to False.
+
+        Raises:
+            ValueError: If the layout is invalid.
+        """
+        snakes = {int(head): int(tail) for head, tail in snakes.items()}
+        ladders = {int(foot): int(top) for foot, top in ladders.items()}
+        self._validate(size, snakes, ladders, strict)
+
+        jump = list(range(size + 1))
+        for start, end in list(snakes.items()) + list(ladders.items()):
+            jump[start] = end
+
+        self.size = size
+        self.snakes = MappingProxyType(dict(sorted(snakes.items())))
+        self.ladders = MappingProxyType(dict(sorted(ladders.items())))
+        self.jump = tuple(jump)
+        self.key = self.content_key(size, snakes, ladders)
+
+    @staticmethod
+    def _validate(size: int, snakes: Dict[int, int], ladders: Dict[int, int], strict: bool = False) -> None:
+        """
+        Check a layout for out-of-range squares, overlapping heads and feet, cycles and, if
+        strict, chains.
+
+        A chain is a jump ending where another starts. The game resolves one jump per
+        landing, so chains are allowed by default (the classic board has three), but
+        jumps that lead back to their own start are rejected. Whether players can get
+        stuck short of the last square depends on the overshoot rule, so that is checked
+        when rules are compiled for the board (see ``rules.CompiledRules``).
+
+        Raises:
+            ValueError: Describing the first problem found.
+        """
+        if size < 2 or size > Board.MAX_SIZE:
+            raise ValueError(f"Board size must be between 2 and {Board.MAX_SIZE}")
+        for head, tail in snakes.items():
+            if not 1 <= tail < head < size:
+                raise ValueError(f"Snake {head} → {tail} must go down between squares 1 and {size - 1}")
+        for foot, top in ladders.items():
+            if not 1 <= foot < top <= size:
+                raise ValueError(f"Ladder {foot} → {top} must go up between squares 1 and {size}")
+
+        overlap = snakes.keys() & ladders.keys()
+        if overlap:
+            raise ValueError(f"Square {min(overlap)} has both a snake head and a ladder foot")
+
+        jumps = {**snakes, **ladders}
+        for start, end in jumps.items():
+            if end in jumps and strict:
+                raise ValueError(f"Jump {start} → {end} ends where another starts (chains are not allowed)")
+            seen = {start}
+            while end in jumps:
+                if end in seen:
+                    raise ValueError(f"Jumps starting at square {start} form a cycle")
+                seen.add(end)
+                end = jumps[end]
+
+    @staticmethod
+    def content_key(size: int, snakes: Mapping[int, int], ladders: Mapping[int, int]) -> str:
+        """
+        Hash a layout independently of dictionary order.
+
+        Returns:
+            str: Hex SHA-256 digest of the canonical layout.
+        """
+        canonical = json.dumps([size, sorted(snakes.items()), sorted(ladders.items())], separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def create(cls, size: int, snakes: Mapping[int, int], ladders: Mapping[int, int],
+               strict: bool = False) -> "Board":
+        """
+        Get the board for a layout, compiling it only the first time it is seen.
+
+        Args:
+            size (int): Number of squares.
+            snakes (Mapping[int, int]): Snake head to tail squares.
+            ladders (Mapping[int, int]): Ladder foot to top squares.
+            strict (bool): Also reject chains. Defaults to False.
+
+        Returns:
+            Board: Shared board instance.
+
+        Raises:
+            ValueError: If the layout is invalid.
+        """
+        snakes = {int(head): int(tail) for head, tail in snakes.items()}
+        ladders = {int(foot): int(top) for foot, top in ladders.items()}
+        key = cls.content_key(size, snakes, ladders)
+        with cls._cache_lock:
+            board = cls._cache.get(key)
+        if board is not None and strict:
+            cls._validate(size, snakes, ladders, strict)
+        if board is None:
+            board = cls(size, snakes, ladders, strict)
+            with cls._cache_lock:
+                board = cls._cache.setdefault(key, board)
+        return board
+
+    def __reduce__(self):
+        # Mapping proxies cannot be pickled; rebuild through the cache instead
+        return Board.create, (self.size, dict(self.snakes), dict(self.ladders))
+
+    def __repr__(self) -> str:
+        return f"Board(size={self.size}, snakes={len(self.snakes)}, ladders={len(self.ladders)}, key={self.key[:12]})"
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Board":
+        """
+        Create a board from a dictionary with ``size``, ``snakes`` and ``ladders`` keys.
+
+        Snakes and ladders may be mappings (keys may be strings, as in JSON and TOML)
+        or lists of [start, end] pairs.
+
+        Args:
+            data (Mapping): Board definition.
+
+        Returns:
+            Board: Shared board instance.
+
+        Raises:
+            ValueError: If the definition is incomplete or invalid.
+        """
+        try:
+            size = int(data["size"])
+            snakes, ladders = data.get("snakes", {}), data.get("ladders", {})
+            snakes = dict(snakes.items() if isinstance(snakes, Mapping) else snakes)
+            ladders = dict(ladders.items() if isinstance(ladders, Mapping) else ladders)
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid board definition: {e}") from e
+        return cls.create(size, snakes, ladders)
+
+    def to_dict(self) -> Dict:
+        """
+        Get the board definition in the shape accepted by ``from_dict``.
+
+        Returns:
+            Dict: ``size``, ``snakes`` and ``ladders``.
+        """
+        return {"size": self.size, "snakes": dict(self.snakes), "ladders": dict(self.ladders)}
+
+    def to_json(self) -> str:
+        """
+        Serialize the board definition as JSON.
+
+        Returns:
+            str: JSON text readable by ``load``.
+        """
+        return json.dumps(self.to_dict(), indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "Board":
+        """
+        Load a board definition from a ``.json`` or ``.toml`` file.
+
+        Args:
+            path (str): Path to the file.
+
+        Returns:
+            Board: Shared board instance.
+
+        Raises:
+            ValueError: If the file type is unsupported or the definition is invalid.
+        """
+        if path.endswith(".toml"):
+            if tomllib is None:
+                raise ValueError("Reading TOML boards needs Python 3.11+ or the tomli package")
+            with open(path, "rb") as f:
+                return cls.from_dict(tomllib.load(f))
+        if path.endswith(".json"):
+            with open(path, encoding="utf-8") as f:
+                return cls.from_dict(json.load(f))
+        raise ValueError("Board files must end in .json or .toml")
+
+    @classmethod
+    def generate(cls, size: int = 100, num_snakes: int = 15, num_ladders: int = 8,
+                 seed: Optional[int] = None) -> "Board":
+        """
+        Generate a random valid board on which no player gets stuck under the classic rules.
+
+        Args:
+            size (int): Number of squares. Defaults to 100.
+            num_snakes (int): Number of snakes. Defaults to 15.
+            num_ladders (int): Number of ladders. Defaults to 8.
+            seed (int): Seed for a reproducible layout.
+
+        Returns:
+            Board: Shared board instance.
+
+        Raises:
+            ValueError: If the board is too small for the requested jumps.
+        """
+        # Imported here: rules compiles boards, so it imports this module
+        from rules import CLASSIC_RULES
+        if 2 * (num_snakes + num_ladders) > size - 2:
+            raise ValueError("Board is too small for the requested snakes and ladders")
+        rng = random.Random(seed)
+
+        while True:
+            used = set()
+            snakes, ladders = {}, {}
+
+            def free_square(low: int, high: int) -> Optional[int]:
+                if all(square in used for square in range(low, high + 1)):
+                    return None
+                while True:
+                    square = rng.randint(low, high)
+                    if square not in used:
+                        used.add(square)
+                        return square
+
+            # Starts and ends never share a square, which rules out chains
+            for _ in range(num_snakes):
+                head = free_square(3, size - 1)
+                snakes[head] = free_square(1, head - 1)
+            for _ in range(num_ladders):
+                foot = free_square(1, size - 2)
+                ladders[foot] = free_square(foot + 1, size - 1)
+
+            # Retry in the rare cases a start was drawn with no free square left for its end,
+            # or snakes trap players short of the last square
+            if None not in snakes.values() and None not in ladders.values():
+                try:
+                    board = cls.create(size, snakes, ladders, strict=True)
+                    CLASSIC_RULES.compile(board)
+                    return board
+                except ValueError:
+                    continue
+
+
+DEFAULT_BOARD = Board.create(
+    100,
+    # More snakes than ladders for difficulty
+    snakes={
+        16: 6, 47: 26, 49: 11, 56: 53, 62: 19, 73: 58, 87: 64,
+        93: 73, 95: 75, 98: 79, 92: 71, 78: 52, 84: 74, 59: 38, 77: 45
+    },
+    ladders={
+        2: 38, 7: 15, 21: 42, 28: 84, 36: 55, 51: 67, 72: 91, 80: 98
+    }
+)
@@ -0,0 +1,124 @@
+import math
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import streamlit as st
+
+if TYPE_CHECKING:
+    from game import SnakeAndLadder
+
+
+@st.cache_data
+def render_static_cells(board_size: int, snakes: Tuple[Tuple[int, int], ...],
+                        ladders: Tuple[Tuple[int, int], ...]) -> List[str]:
+    """
+    Render the cells that do not change during a game, once per board definition.
+
+    Args:
+        board_size (int): Number of squares on the board.
+        snakes (Tuple[Tuple[int, int], ...]): Sorted (head, tail) pairs.
+        ladders (Tuple[Tuple[int, int], ...]): Sorted (foot, top) pairs.
+
+    Returns:
+        List[str]: HTML for each square, indexed by square number (index 0 is unused).
+    """
+    snake_heads = dict(snakes)
+    ladder_feet = dict(ladders)
+    cells = [""]
+    for i in range(1, board_size + 1):
+        if i in snake_heads:
+            cells.append(f"<div class='board-cell snake-cell' title='Snake: {i} → {snake_heads[i]}'>🐍</div>")
+        elif i in ladder_feet:
+            cells.append(f"<div class='board-cell ladder-cell' title='Ladder: {i} → {ladder_feet[i]}'>🪜</div>")
+        else:
+            cells.append(f"<div class='board-cell'>{i}</div>")
+    return cells
+
+
+# Tokens drawn per cell; further players on the square are summarized as "+N"
+MAX_TOKENS_PER_CELL = 3
+
+# Heatmap colors: squares used more often than expected, less often, or without an expectation
+HEAT_HOT = (231, 76, 60)
+HEAT_COLD = (52, 152, 219)
+HEAT_OBSERVED = (230, 126, 34)
+
+
+def render_heat_cells(game: "SnakeAndLadder") -> Tuple[List[str], int]:
+    """
+    Render every square colored by the process-wide landing counters of the game's board and rules.
+
+    Under the classic rules squares used more often than expected are red and less
+    often blue; other variants are shaded by use alone. See ``landings.square_heat``.
+
+    Args:
+        game (SnakeAndLadder): Game whose board is drawn.
+
+    Returns:
+        Tuple[List[str], int]: HTML for each square, indexed by square number (index 0 is
+        unused), and the number of moves counted.
+    """
+    from landings import square_heat
+    heat = square_heat(game.board, game.rules)
+    observed, expected = heat["observed"], heat["expected"]
+    snakes, ladders = game.snakes, game.ladders
+    cells = [""]
+    for square in range(1, game.board_size + 1):
+        if square in snakes:
+            label, title = "🐍", f"Snake {square} → {snakes[square]}: taken on {observed[square]:.2%} of moves"
+        elif square in ladders:
+            label, title = "🪜", f"Ladder {square} → {ladders[square]}: taken on {observed[square]:.2%} of moves"
+        else:
+            label, title = square, f"Square {square}: {observed[square]:.2%} of moves end here"
+        level = heat["heat"][square]
+        if expected is None:
+            red, green, blue = HEAT_OBSERVED
+        else:
+            title += f" (expected {expected[square]:.2%})"
+            red, green, blue = HEAT_HOT if level > 0 else HEAT_COLD
+        cells.append(f"<div class='board-cell' style='background: rgba({red}, {green}, {blue}, {abs(level):.2f});' "
+                     f"title='{title}'>{label}</div>")
+    return cells, heat["moves"]
+
+
+def render_board(game: "SnakeAndLadder", arrived_square: Optional[int] = None, heatmap: bool = False) -> None:
+    """
+    Draw the board as a single HTML grid, overlaying player tokens on the cached static cells.
+
+    Tokens come from the game's occupancy index, so drawing costs O(squares) however
+    many players are in the lobby. Crowded cells stack their first tokens and show a
+    count of the rest.
+
+    Args:
+        game (SnakeAndLadder): Game whose board is drawn.
+        arrived_square (int): Square a token just moved to; the browser animates its arrival.
+        heatmap (bool): Color the squares by the process-wide landing counters instead of
+            drawing the static cells. Defaults to False.
+    """
+    if heatmap:
+        cells, moves = render_heat_cells(game)
+    else:
+        cells = render_static_cells(game.board_size, tuple(sorted(game.snakes.items())),
+                                    tuple(sorted(game.ladders.items())))
+    # Players start off the board at square 0
+    for square in range(1, game.board_size + 1):
+        count = game.count_on(square)
+        if not count:
+            continue
+        icons = "".join(game.get_player_icon(player_id)
+                        for player_id in game.players_on(square, MAX_TOKENS_PER_CELL))
+        if count > MAX_TOKENS_PER_CELL:
+            icons += f"<span class='token-more'>+{count - MAX_TOKENS_PER_CELL}</span>"
+        arrived = " token-arrive" if square == arrived_square else ""
+        cells[square] = f"<div class='board-cell player-cell{arrived}' title='{count} on square {square}'>{icons}</div>"
+    columns = math.isqrt(game.board_size)
+    if columns * columns != game.board_size:
+        columns = 10
+    st.markdown(f"<div class='board-grid' style='grid-template-columns: repeat({columns}, 1fr);'>"
+                f"{''.join(cells[1:])}</div>", unsafe_allow_html=True)
+    if heatmap and not moves:
+        st.caption("No moves counted on this board yet.")
+    elif heatmap:
+        from rules import CLASSIC_RULES
+        legend = "🟥 more often than expected, 🟦 less often" if game.rules == CLASSIC_RULES else "darker is more often"
+        st.caption(f"Share of {moves:,} moves counted on this board since the server started: {legend}. "
+                   f"Hover a square for its numbers.")
@@ -0,0 +1,135 @@
+from typing import Dict, Iterable, List, Optional
+
+from board import DEFAULT_BOARD, Board
+from game import HISTORY_OFF, SnakeAndLadder
+from rules import CLASSIC_RULES, Rules
+
+
+class Bot:
+    """
+    Computer player that takes its turns directly on the engine.
+
+    The default bot rolls and moves, which is all the classic rules allow. Subclasses
+    override ``take_turn`` to plug in strategies or house rules.
+    """
+
+    name = "Bot"
+    icon = "🤖"
+
+    def take_turn(self, game: SnakeAndLadder) -> Dict:
+        """
+        Play the current player's turn.
+
+        Args:
+            game (SnakeAndLadder): Game to play in; it is this bot's turn.
+
+        Returns:
+            Dict: Movement details returned by ``move_player``.
+        """
+        return game.move_player(game.roll_dice())
+
+
+class ScriptedBot(Bot):
+    """
+    Bot that plays a fixed sequence of dice values, e.g. to reproduce a reported game.
+    """
+
+    name = "Scripted Bot"
+
+    def __init__(self, rolls: Iterable[int]):
+        """
+        Create a bot that plays the given rolls in order.
+
+        Args:
+            rolls (Iterable[int]): Dice values (1-6).
+        """
+        self._rolls = iter(rolls)
+
+    def take_turn(self, game: SnakeAndLadder) -> Dict:
+        return game.move_player(next(self._rolls))
+
+
+DEFAULT_BOT = Bot()
+
+
+def play_game(game: SnakeAndLadder, bots: Optional[Dict[int, Bot]] = None,
+              max_moves: Optional[int] = None) -> Dict:
+    """
+    Finish a game headlessly, with bots taking every remaining turn.
+
+    Args:
+        game (SnakeAndLadder): Game to finish; it may already be in progress.
+        bots (Dict[int, Bot]): Bot per player ID. Players without one use the default bot.
+        max_moves (int): Stop after this many moves even if nobody has won.
+
+    Returns:
+        Dict: Compressed summary of the moves played, see ``summarize``.
+    """
+    bots = bots or {}
+    # Moves, snake hits, ladder climbs and skipped turns per player ID
+    counts = [[0, 0, 0, 0] for _ in range(game.num_players + 1)]
+    moves = 0
+
+    while not game.game_over and (max_moves is None or moves < max_moves):
+        player_id = game.current_player
+        move = bots.get(player_id, DEFAULT_BOT).take_turn(game)
+        moves += 1
+        row = counts[player_id]
+        row[0] += 1
+        if "out_of_bounds" in move or "forfeit" in move:
+            row[3] += 1
+        elif move["snake_or_ladder"]:
+            row[1 if move["final_position"] < move["position_after_roll"] else 2] += 1
+    return summarize(game, counts)
+
+
+def summarize(game: SnakeAndLadder, counts: List[List[int]]) -> Dict:
+    """
+    Build the compressed summary of an auto-played game.
+
+    Args:
+        game (SnakeAndLadder): Game that was played.
+        counts (List[List[int]]): Moves, snake hits, ladder climbs and skipped turns, indexed by player ID.
+
+    Returns:
+        Dict: ``moves`` in total, ``winner`` and, per player ID, ``moves``, ``snakes``,
+        ``ladders``, ``skipped`` and final ``position``.
+    """
+    positions = game.players_position
+    return {
+        "moves": sum(row[0] for row in counts),
+        "winner": game.winner,
+        "players": {
+            player_id: {
+                "moves": counts[player_id][0],
+                "snakes": counts[player_id][1],
+                "ladders": counts[player_id][2],
+                "skipped": counts[player_id][3],
+                "position": positions[player_id]
+            }
+            for player_id in range(1, game.num_players + 1)
+        }
+    }
+
+
+def play_games(n_games: int, num_players: int = 2, seed: int = 0, board: Board = DEFAULT_BOARD,
+               rules: Rules = CLASSIC_RULES) -> List[int]:
+    """
+    Play many independent bot games, e.g. for soak tests.
+
+    Args:
+        n_games (int): Games to play.
+        num_players (int): Players per game (2-4). Defaults to 2.
+        seed (int): Seed of the first game; game i uses seed + i. Defaults to 0.
+        board (Board): Board to play on. Defaults to the classic board.
+        rules (Rules): Rule variant to play by. Defaults to the classic rules.
+
+    Returns:
+        List[int]: Winner of each game.
+    """
+    winners = []
+    for i in range(n_games):
+        game = SnakeAndLadder(num_players, history_level=HISTORY_OFF, seed=seed + i, board=board, rules=rules)
+        play_game(game)
+        winners.append(game.winner)
+    return winners
@@ -0,0 +1,181 @@
+import os
+import random
+import secrets
+from typing import Optional
+
+import numpy as np
+
+# Backends that a dice source can be rebuilt from when a game is restored
+BACKEND_RANDOM = "random"
+BACKEND_NUMPY = "numpy"
+BACKEND_URANDOM = "urandom"
+BACKENDS = (BACKEND_RANDOM, BACKEND_NUMPY, BACKEND_URANDOM)
+
+
+class DiceSource:
+    """
+    Source of six-sided dice rolls owned by a single game.
+
+    Seeded sources produce the same rolls for the same seed, so a game can be
+    replayed or audited from its recorded seed and roll count. Subclasses set
+    ``backend`` to one of ``BACKENDS`` so a saved game can rebuild its dice.
+    """
+
+    backend = None
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Create a dice source.
+
+        Args:
+            seed (int): Seed for the random stream, or None for an unseeded source.
+        """
+        self.seed = seed
+        self.rolls = 0
+
+    def roll(self) -> int:
+        """
+        Roll the dice.
+
+        Returns:
+            int: Random number between 1 and 6.
+        """
+        raise NotImplementedError
+
+    def skip(self, count: int) -> None:
+        """
+        Discard rolls, e.g. to continue a restored game where it left off.
+
+        Args:
+            count (int): Number of rolls to discard.
+        """
+        for _ in range(count):
+            self.roll()
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        """
+        Restart the stream from a new seed, reusing the source, e.g. for a pooled game.
+
+        Args:
+            seed (int): New seed. Defaults to a freshly drawn one.
+        """
+        raise NotImplementedError
+
+
+class RandomDice(DiceSource):
+    """
+    Dice backed by a private ``random.Random`` instance.
+    """
+
+    backend = BACKEND_RANDOM
+
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(seed)
+        self._random = random.Random(seed)
+
+    def roll(self) -> int:
+        self.rolls += 1
+        return self._random.randint(1, 6)
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        self.seed = secrets.randbits(63) if seed is None else seed
+        self.rolls = 0
+        self._random.seed(self.seed)
+
+
+class BufferedDice(DiceSource):
+    """
+    Dice that draw rolls in blocks and hand them out from a reusable buffer.
+
+    Blocks come from ``numpy.random.Generator`` (seedable) or ``os.urandom``
+    (unseeded, rejection-sampled so every face is equally likely). Refilling a
+    block costs one call, so a roll is a single buffer index.
+    """
+
+    def __init__(self, seed: Optional[int] = None, backend: str = BACKEND_NUMPY, block_size: int = 4096):
+        """
+        Create a buffered dice source.
+
+        Args:
+            seed (int): Seed for the numpy backend. Ignored by the urandom backend.
+            backend (str): "numpy" or "urandom". Defaults to "numpy".
+            block_size (int): Rolls drawn per refill. Defaults to 4096.
+
+        Raises:
+            ValueError: If the backend is unknown.
+        """
+        if backend not in (BACKEND_NUMPY, BACKEND_URANDOM):
+            raise ValueError(f"Buffered dice backend must be {BACKEND_NUMPY} or {BACKEND_URANDOM}")
+        self.seed = seed if backend == BACKEND_NUMPY else None
+        self.backend = backend
+        self.block_size = block_size
+        self._generator = np.random.default_rng(seed) if backend == BACKEND_NUMPY else None
+        self._buffer = bytearray(block_size)
+        self._index = block_size
+        self._blocks = 0
+
+    @property
+    def rolls(self) -> int:
+        # Derived from the buffer position so a roll does not pay for a counter update
+        return (self._blocks - 1) * self.block_size + self._index if self._blocks else 0
+
+    def _refill(self) -> None:
+        if self._generator is not None:
+            self._buffer[:] = self._generator.integers(1, 7, size=self.block_size, dtype=np.uint8).tobytes()
+        else:
+            filled = 0
+            while filled < self.block_size:
+                # 252 is the largest multiple of 6 below 256; higher bytes would bias the faces
+                chunk = bytes(byte % 6 + 1 for byte in os.urandom(self.block_size - filled) if byte < 252)
+                self._buffer[filled:filled + len(chunk)] = chunk
+                filled += len(chunk)
+        self._index = 0
+        self._blocks += 1
+
+    def roll(self) -> int:
+        if self._index == self.block_size:
+            self._refill()
+        value = self._buffer[self._index]
+        self._index += 1
+        return value
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        # The buffer is kept; the next roll refills it from the new stream
+        if self.backend == BACKEND_NUMPY:
+            self.seed = secrets.randbits(63) if seed is None else seed
+            self._generator = np.random.default_rng(self.seed)
+        self._index = self.block_size
+        self._blocks = 0
+
+    def skip(self, count: int) -> None:
+        # Whole blocks are drawn exactly as during play so the stream lines up
+        remaining = count
+        while remaining:
+            if self._index == self.block_size:
+                self._refill()
+            step = min(remaining, self.block_size - self._index)
+            self._index += step
+            remaining -= step
+
+
+def create_dice(seed: Optional[int] = None, backend: str = BACKEND_NUMPY) -> DiceSource:
+    """
+    Create a dice source, drawing a fresh seed for seedable backends when none is given.
+
+    Args:
+        seed (int): Seed for the random stream.
+        backend (str): "random", "numpy" or "urandom". Defaults to "numpy".
+
+    Returns:
+        DiceSource: The dice source.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Dice backend must be one of {', '.join(BACKENDS)}")
+    if seed is None and backend != BACKEND_URANDOM:
+        seed = secrets.randbits(63)
+    if backend == BACKEND_RANDOM:
+        return RandomDice(seed)
+    return BufferedDice(seed, backend)
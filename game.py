@@ -1,51 +1,242 @@
-import random
-from typing import Dict, List, Tuple
+import struct
+from array import array
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from board import DEFAULT_BOARD, Board
+from dice import BACKENDS, DiceSource, create_dice
+from history import EVENT_EXTRA_ROLL, EVENT_FIELDS, EVENT_LADDER, EVENT_SNAKE, EVENT_WON, MoveLog
+from landings import LandingCounters, counters_for
+from markov import BoardAnalysis, get_board_analysis
+from metrics import timed
+from rules import CLASSIC_RULES, OVERSHOOT_RULES, Rules
+
+# Move history levels: dictionaries per move, packed records decoded on demand, or no logging
+HISTORY_FULL = "full"
+HISTORY_PACKED = "packed"
+HISTORY_OFF = "off"
+HISTORY_LEVELS = (HISTORY_FULL, HISTORY_PACKED, HISTORY_OFF)
+
+# Largest lobby; games of more than 255 players log moves in 16-bit lobby records
+MAX_PLAYERS = 1000
+# Games of this many players or more are lobbies, whose status leaves out the position map
+LOBBY_MIN_PLAYERS = 5
+
+# Binary state format: magic, version, players, board size, current player, game over, winner, history level
+STATE_MAGIC = b"SNL"
+STATE_VERSION = 6
+_STATE_HEADER = struct.Struct("<3sBHHHBHB")
+# Header of versions 1 to 4, which held at most 4 players
+_LEGACY_STATE_HEADER = struct.Struct("<3sBBHBBBB")
+_LENGTH = struct.Struct("<I")
+# Version 2 trailer: dice backend, has seed, seed, rolls drawn
+_DICE_STATE = struct.Struct("<BBQQ")
+# Version 3 trailer: state version, state version at which the move log starts
+_VERSION_STATE = struct.Struct("<II")
+# Version 4 trailer: overshoot rule, extra roll on six, sixes forfeit, sixes rolled so far this turn
+_RULES_STATE = struct.Struct("<BBBB")
+# Version 6 states may be followed by moves appended by to_bytes_since: magic, state version before
+# and after the moves, current player, game over, winner, sixes rolled so far this turn, rolls drawn;
+# then the packed moves
+MOVES_MAGIC = b"SNM"
+_MOVES_HEADER = struct.Struct("<3sIIHBHBQ")
+
 
 class SnakeAndLadder:
     """
     A class to manage the Snake and Ladder game logic.
     
-    The board has 100 squares. More snakes than ladders are placed to make the game difficult.
+    The default board has 100 squares. More snakes than ladders are placed to make the game difficult.
+    Other layouts are passed in as a shared, immutable ``Board``.
     """
     
-    def __init__(self, num_players: int = 2, player_names: Dict[int, str] = None, player_icons: Dict[int, str] = None):
+    __slots__ = (
+        "num_players", "board", "current_player", "game_over", "winner",
+        "player_names", "player_icons", "history_level",
+        "dice", "rules", "version", "_version_base", "_positions", "_squares", "_move_history", "_move_log",
+        "_outcomes", "_stride", "_streak", "_counters", "__weakref__"
+    )
+    
+    def __init__(self, num_players: int = 2, player_names: Dict[int, str] = None, player_icons: Dict[int, str] = None,
+                 history_level: str = HISTORY_FULL, dice: Optional[DiceSource] = None, seed: Optional[int] = None,
+                 board: Optional[Board] = None, history_limit: Optional[int] = None, rules: Optional[Rules] = None):
         """
         Initialize the game with specified number of players.
         
         Args:
-            num_players (int): Number of players (2-4). Defaults to 2.
+            num_players (int): Number of players, from 2 up to ``MAX_PLAYERS`` for large lobbies.
+                Defaults to 2.
             player_names (Dict[int, str]): Dictionary mapping player ID to player name.
             player_icons (Dict[int, str]): Dictionary mapping player ID to player icon/emoji.
+            history_level (str): How moves are logged: "full" keeps a dictionary per move,
+                "packed" keeps compact records expanded only when read, "off" keeps nothing.
+                Both "full" and "packed" keep the ordered log used by ``events_since``.
+                Defaults to "full".
+            dice (DiceSource): Dice used by ``roll_dice``. Defaults to buffered NumPy dice.
+            seed (int): Seed for the default dice; a random seed is drawn and recorded if omitted.
+                Ignored when ``dice`` is given.
+            board (Board): Board layout. Defaults to the classic 100-square board.
+            history_limit (int): Most packed moves kept in memory; older moves spill to a
+                temporary file and are streamed back when history is read. Defaults to None,
+                keeping every move in memory.
+            rules (Rules): Rule variant, compiled with the board into a move table once.
+                Defaults to the classic rules.
             
         Raises:
-            ValueError: If num_players is not between 2 and 4.
+            ValueError: If num_players is not between 2 and ``MAX_PLAYERS``, history_level is unknown or
+                history_limit is combined with "full" history, whose dictionaries stay in memory.
         """
-        if num_players < 2 or num_players > 4:
-            raise ValueError("Number of players must be between 2 and 4")
+        if num_players < 2 or num_players > MAX_PLAYERS:
+            raise ValueError(f"Number of players must be between 2 and {MAX_PLAYERS}")
+        if history_level not in HISTORY_LEVELS:
+            raise ValueError(f"History level must be one of {', '.join(HISTORY_LEVELS)}")
+        if history_limit is not None and history_level == HISTORY_FULL:
+            raise ValueError("A history limit needs the packed or off history level")
         
         self.num_players = num_players
-        self.board_size = 100
-        self.players_position = {i: 0 for i in range(1, num_players + 1)}
+        self.board = board or DEFAULT_BOARD
+        self.history_level = history_level
+        self.dice = dice or create_dice(seed)
+        self._set_rules(rules or CLASSIC_RULES)
+        # Positions indexed by player ID; slot 0 is unused
+        self._positions = array("B" if self.board.size <= 255 else "H", [0]) * (num_players + 1)
+        self._index_squares()
         self.current_player = 1
         self.game_over = False
         self.winner = None
+        # Incremented by every move and reset; the move log holds the moves since _version_base
+        self.version = 0
+        self._version_base = 0
         
         # Player names and icons
         self.player_names = player_names or {i: f"Player {i}" for i in range(1, num_players + 1)}
         self.player_icons = player_icons or {i: "🔵" for i in range(1, num_players + 1)}
         
-        # More snakes than ladders for difficulty
-        self.snakes = {
-            16: 6, 47: 26, 49: 11, 56: 53, 62: 19, 73: 58, 87: 64,
-            93: 73, 95: 75, 98: 79, 92: 71, 78: 52, 84: 74, 59: 38, 77: 45
-        }  # 15 snakes
+        self._move_history = {i: [] for i in range(1, num_players + 1)}
+        self._move_log = MoveLog(wide=self.board.size > 255, limit=history_limit, wide_players=num_players > 255)
+    
+    def _index_squares(self, records: Iterable[Tuple[int, int, int, int, int]] = ()) -> None:
+        """
+        Rebuild the occupancy index from the positions.
+        
+        ``_squares[square]`` holds the IDs of the players on that square as the keys of
+        a dictionary, an insertion-ordered set, so ``move_player`` updates it in O(1).
+        
+        Args:
+            records (Iterable[Tuple[int, int, int, int, int]]): Every move since the game
+                started, replayed to restore the order in which players arrived on each
+                square. Defaults to none, ordering players on a square by ID.
+        """
+        squares = [{} for _ in range(self.board.size + 1)]
+        if records:
+            squares[0] = dict.fromkeys(range(1, self.num_players + 1))
+            for player_id, _, old_position, final_position, _ in records:
+                if final_position != old_position:
+                    del squares[old_position][player_id]
+                    squares[final_position][player_id] = None
+        else:
+            for player_id in range(1, self.num_players + 1):
+                squares[self._positions[player_id]][player_id] = None
+        self._squares = squares
+    
+    def _set_rules(self, rules: Rules) -> None:
+        """
+        Switch to a rule variant, compiling it with the board, and start a fresh turn.
+        
+        Args:
+            rules (Rules): Rules to play by.
+        """
+        compiled = rules.compile(self.board)
+        self.rules = rules
+        self._outcomes = compiled.outcomes
+        self._stride = compiled.stride
+        self._counters = counters_for(self.board, rules, self.num_players)
+        # Sixes the current player has rolled in a row this turn
+        self._streak = 0
+    
+    @property
+    def board_size(self) -> int:
+        """
+        Number of squares on the board; reaching the last one wins.
+        
+        Returns:
+            int: Board size.
+        """
+        return self.board.size
+    
+    @property
+    def snakes(self) -> Mapping[int, int]:
+        """
+        Snakes on the board (read-only, shared by every game on the board).
+        
+        Returns:
+            Mapping[int, int]: Snake head to tail squares.
+        """
+        return self.board.snakes
+    
+    @property
+    def ladders(self) -> Mapping[int, int]:
+        """
+        Ladders on the board (read-only, shared by every game on the board).
+        
+        Returns:
+            Mapping[int, int]: Ladder foot to top squares.
+        """
+        return self.board.ladders
+    
+    @property
+    def players_position(self) -> Dict[int, int]:
+        """
+        Current position of every player, built on each access in O(players).
         
-        self.ladders = {
-            2: 38, 7: 15, 21: 42, 28: 84, 36: 55, 51: 67, 72: 91, 80: 98
-        }  # 8 ladders
+        Returns:
+            Dict[int, int]: Player ID to square (0 before entering the board).
+        """
+        return {i: self._positions[i] for i in range(1, self.num_players + 1)}
+    
+    @property
+    def move_history(self) -> Dict[int, List[Dict]]:
+        """
+        Moves made by every player, in the dictionary shape returned by ``move_player``.
         
-        self.move_history = {i: [] for i in range(1, num_players + 1)}
+        Returns:
+            Dict[int, List[Dict]]: Player ID to list of moves.
+        """
+        return {i: self.get_player_move_history(i) for i in range(1, self.num_players + 1)}
     
+    @property
+    def history_limit(self) -> Optional[int]:
+        """
+        Most packed moves kept in memory, as given to the constructor.
+        
+        Returns:
+            Optional[int]: The limit, or None if every move stays in memory.
+        """
+        return self._move_log.limit
+    
+    @property
+    def landing_counters(self) -> LandingCounters:
+        """
+        Process-wide landing, snake and ladder counters this game's moves are added to.
+        
+        Returns:
+            LandingCounters: Counters shared by every game with the same board, rules and player count.
+        """
+        return self._counters
+    
+    @property
+    def seed(self) -> Optional[int]:
+        """
+        Seed of this game's dice; replaying it reproduces every roll.
+        
+        Returns:
+            Optional[int]: The seed, or None for unseeded dice.
+        """
+        return self.dice.seed
+    
+    @timed("roll_dice")
     def roll_dice(self) -> int:
         """
         Simulate rolling a standard 6-sided dice.
@@ -53,89 +244,198 @@ class SnakeAndLadder:
         Returns:
             int: Random number between 1 and 6.
         """
-        return random.randint(1, 6)
+        return self.dice.roll()
     
+    @timed("move_player")
     def move_player(self, dice_value: int) -> Dict:
         """
         Move the current player based on the dice value.
-        Handles snakes and ladders landing.
+        Handles snakes and ladders landing and the game's rule variant.
         
         Args:
             dice_value (int): Value from dice roll (1-6).
             
         Returns:
             Dict: Movement details including new position and any snake/ladder encountered.
+            
+        Raises:
+            ValueError: If dice_value is not between 1 and 6.
         """
         if self.game_over:
             return {"error": "Game is already over"}
         
+        if not 1 <= dice_value <= 6:
+            raise ValueError("Dice value must be between 1 and 6")
+        
         player_id = self.current_player
-        old_position = self.players_position[player_id]
-        new_position = old_position + dice_value
+        old_position = self._positions[player_id]
+        self.version += 1
+        # Every rule variant is resolved by one lookup in the compiled move table
+        position_after_roll, new_position, event, self._streak, snake_or_ladder = \
+            self._outcomes[self._streak * self._stride + old_position * 7 + dice_value]
         move_result = {
             "player": player_id,
             "old_position": old_position,
             "dice_value": dice_value,
-            "position_after_roll": new_position,
-            "snake_or_ladder": None,
+            "position_after_roll": position_after_roll,
+            "snake_or_ladder": snake_or_ladder,
             "final_position": new_position
         }
-        
-        # Check if position exceeds board size
-        if new_position > self.board_size:
-            move_result["final_position"] = old_position
-            move_result["out_of_bounds"] = True
-            self.move_history[player_id].append(move_result)
-            self._next_player()
-            return move_result
-        
-        # Check for snakes
-        if new_position in self.snakes:
-            ladder_or_snake_end = self.snakes[new_position]
-            move_result["snake_or_ladder"] = f"Snake: {new_position} → {ladder_or_snake_end}"
-            new_position = ladder_or_snake_end
-        
-        # Check for ladders
-        elif new_position in self.ladders:
-            ladder_or_snake_end = self.ladders[new_position]
-            move_result["snake_or_ladder"] = f"Ladder: {new_position} → {ladder_or_snake_end}"
-            new_position = ladder_or_snake_end
-        
-        move_result["final_position"] = new_position
-        self.players_position[player_id] = new_position
-        self.move_history[player_id].append(move_result)
+        move_result.update(EVENT_FIELDS[event])
+        self._positions[player_id] = new_position
+        if new_position != old_position:
+            del self._squares[old_position][player_id]
+            self._squares[new_position][player_id] = None
+        self._counters.record(position_after_roll, new_position, event)
         
         # Check if player won
-        if new_position == self.board_size:
+        if event & EVENT_WON:
             self.game_over = True
             self.winner = player_id
-            move_result["won"] = True
         
-        # Move to next player
-        if not self.game_over:
+        self._record_move(move_result, player_id, dice_value, old_position, new_position, event)
+        
+        # Move to next player, unless the rules give this one another roll
+        if not self.game_over and not event & EVENT_EXTRA_ROLL:
             self._next_player()
         
         return move_result
     
+    def _record_move(self, move_result: Dict, player_id: int, dice_value: int,
+                     old_position: int, final_position: int, event: int) -> None:
+        """
+        Log a move according to the history level.
+        
+        Args:
+            move_result (Dict): Movement details returned by ``move_player``.
+            player_id (int): ID of the player who moved.
+            dice_value (int): Value rolled.
+            old_position (int): Position before the move.
+            final_position (int): Position after snakes and ladders.
+            event (int): Combination of the ``EVENT_*`` flags from ``history``.
+        """
+        if self.history_level == HISTORY_OFF:
+            return
+        self._move_log.append(player_id, dice_value, old_position, final_position, event)
+        if self.history_level == HISTORY_FULL:
+            self._move_history[player_id].append(move_result)
+    
     def _next_player(self) -> None:
         """
         Move to the next player's turn in round-robin fashion.
         """
         self.current_player = (self.current_player % self.num_players) + 1
     
+    @timed("get_game_status")
     def get_game_status(self) -> Dict:
         """
-        Get the current game status.
+        Get the current game status in O(1) for lobbies.
+        
+        Lobbies of ``LOBBY_MIN_PLAYERS`` or more leave out ``players_position``, which
+        would cost O(players) per query; read them with ``standings``, ``players_on`` and
+        ``count_on`` instead, or ``players_position`` when the full map is really needed.
         
         Returns:
-            Dict: Current positions of all players, current player, and game state.
+            Dict: Current positions of all players (not in lobbies), current player, game
+            state, dice seed and state version.
         """
-        return {
-            "players_position": self.players_position.copy(),
+        status = {"players_position": self.players_position} if self.num_players < LOBBY_MIN_PLAYERS else {}
+        status.update(
+            current_player=self.current_player,
+            game_over=self.game_over,
+            winner=self.winner,
+            seed=self.seed,
+            version=self.version
+        )
+        return status
+    
+    def events_since(self, version: int) -> Dict:
+        """
+        Get what changed since a state version, for clients that keep their own copy of the state.
+        
+        Applying the result with ``history.apply_delta`` costs O(moves since ``version``)
+        instead of rebuilding from a full snapshot, and ``history.pack_delta`` encodes it
+        in a few bytes per move.
+        
+        Args:
+            version (int): Version of the client's copy, as reported by ``get_game_status``.
+            
+        Returns:
+            Dict: ``version``, ``current_player``, ``game_over`` and ``winner``, plus either
+            ``moves``, the (player, dice, old position, final position, event) records made
+            after ``version`` in order, or ``positions`` of every player in seat order when
+            those moves are no longer known (the game was reset since, history is off or
+            the version is not from this game).
+        """
+        delta = {
+            "version": self.version,
             "current_player": self.current_player,
             "game_over": self.game_over,
             "winner": self.winner
         }
+        start = version - self._version_base
+        if version == self.version:
+            delta["moves"] = []
+        elif self.history_level != HISTORY_OFF and 0 <= start < len(self._move_log):
+            delta["moves"] = list(self._move_log.records(start))
+        else:
+            delta["positions"] = self._positions[1:].tolist()
+        return delta
+    
+    def players_on(self, square: int, limit: Optional[int] = None) -> List[int]:
+        """
+        Get the players on a square from the occupancy index, in order of arrival.
+        
+        Args:
+            square (int): Square to look up (0 before entering the board).
+            limit (int): Return at most this many players. Defaults to None, all of them.
+            
+        Returns:
+            List[int]: Player IDs.
+        """
+        return list(islice(self._squares[square], limit))
+    
+    def count_on(self, square: int) -> int:
+        """
+        Count the players on a square in O(1).
+        
+        Args:
+            square (int): Square to look up (0 before entering the board).
+            
+        Returns:
+            int: Number of players on the square.
+        """
+        return len(self._squares[square])
+    
+    def standings(self, start: int = 0, count: int = 10) -> List[Tuple[int, int, int]]:
+        """
+        Get one page of the standings, furthest player first.
+        
+        The page is read from the occupancy index, so it costs O(board size + count)
+        however many players are in the lobby. Players on the same square share a
+        rank and are listed in order of arrival.
+        
+        Args:
+            start (int): Rows to skip, e.g. ``page * count``. Defaults to 0.
+            count (int): Rows to return. Defaults to 10.
+            
+        Returns:
+            List[Tuple[int, int, int]]: (rank, player ID, square) rows.
+        """
+        page = []
+        ahead = 0
+        for square in range(self.board.size, -1, -1):
+            occupants = self._squares[square]
+            if not occupants:
+                continue
+            if ahead + len(occupants) > start:
+                skip = max(start - ahead, 0)
+                for player_id in islice(occupants, skip, skip + count - len(page)):
+                    page.append((ahead + 1, player_id, square))
+                if len(page) == count:
+                    break
+            ahead += len(occupants)
+        return page
     
     def get_all_snakes_and_ladders(self) -> Tuple[Dict, Dict]:
         """
@@ -146,6 +446,17 @@ class SnakeAndLadder:
         """
         return self.snakes, self.ladders
     
+    def get_board_analysis(self) -> BoardAnalysis:
+        """
+        Get the exact Markov-chain analysis of this game's board.
+        
+        The analysis is cached per board layout, so repeated calls are instant.
+        
+        Returns:
+            BoardAnalysis: Expected turns, finish-time CDF and per-seat win probabilities.
+        """
+        return get_board_analysis(self.snakes, self.ladders, self.board_size)
+    
     def get_player_move_history(self, player_id: int) -> List[Dict]:
         """
         Get the move history of a specific player.
@@ -156,17 +467,54 @@ class SnakeAndLadder:
         Returns:
             List[Dict]: List of moves made by the player.
         """
-        return self.move_history.get(player_id, [])
+        if self.history_level == HISTORY_PACKED:
+            return list(self.iter_move_history(player_id))
+        return self._move_history.get(player_id, [])
+    
+    def iter_move_history(self, player_id: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Stream moves in play order without building the whole history in memory.
+        
+        Args:
+            player_id (int): Only yield this player's moves. Defaults to every player.
+            
+        Returns:
+            Iterator[Dict]: Moves in the dictionary shape returned by ``move_player``.
+        """
+        for record in self._move_log.records():
+            if player_id is None or record[0] == player_id:
+                yield MoveLog.to_dict(record, self.board_size)
     
-    def reset_game(self) -> None:
+    def move_records(self) -> Iterator[Tuple[int, int, int, int, int]]:
+        """
+        Get the moves since the game started or was last reset, in play order.
+        
+        Returns:
+            Iterator[Tuple[int, int, int, int, int]]: (player, dice, old position, final position, event)
+            records; empty when the history level is "off".
+        """
+        return self._move_log.records()
+    
+    def reset_game(self, rules: Optional[Rules] = None) -> None:
         """
         Reset the game to initial state.
+        
+        Args:
+            rules (Rules): Rule variant for the next game. Defaults to keeping the current rules.
         """
-        self.players_position = {i: 0 for i in range(1, self.num_players + 1)}
+        if rules is not None and rules != self.rules:
+            self._set_rules(rules)
+        for i in range(self.num_players + 1):
+            self._positions[i] = 0
+        self._index_squares()
         self.current_player = 1
         self.game_over = False
         self.winner = None
-        self.move_history = {i: [] for i in range(1, self.num_players + 1)}
+        self._streak = 0
+        self.version += 1
+        self._version_base = self.version
+        self._move_history = {i: [] for i in range(1, self.num_players + 1)}
+        self._move_log.clear()
     
     def get_player_name(self, player_id: int) -> str:
         """
@@ -203,3 +551,269 @@ class SnakeAndLadder:
         """
         self.player_names[player_id] = name
         self.player_icons[player_id] = icon
+    
+    def simulate_batch(self, n_games: int, num_players: Optional[int] = None, seed: Optional[int] = None,
+                       count_jumps: bool = False) -> Dict:
+        """
+        Simulate many complete games at once on this board using NumPy arrays.
+        
+        All games advance in lockstep, one dice roll per step, through the same
+        compiled move table as ``move_player``, so rule variants are simulated too. At step ``t`` a single block of
+        ``n_games`` dice is drawn from ``numpy.random.default_rng(seed)`` and game
+        ``g`` uses ``dice[g]``; feeding that column of rolls to ``move_player``
+        on a fresh game gives the same winner, turn count and positions.
+        The live state of this instance is not touched.
+        
+        Args:
+            n_games (int): Number of games to simulate.
+            num_players (int): Players per game (2 to ``MAX_PLAYERS``). Defaults to this game's player count.
+            seed (int): Seed for the NumPy random generator.
+            count_jumps (bool): Also count snake and ladder hits per square. Defaults to False.
+            
+        Returns:
+            Dict: ``winner`` (player ID per game), ``turns`` (dice rolls per game)
+            and ``positions`` (final square per game and player, shape
+            ``(n_games, num_players)``; column 0 is Player 1). With ``count_jumps``,
+            also ``snake_hits`` and ``ladder_hits``: totals over all games indexed by
+            the head or foot square.
+            
+        Raises:
+            ValueError: If num_players is not between 2 and ``MAX_PLAYERS`` or n_games is negative.
+        """
+        num_players = num_players or self.num_players
+        if num_players < 2 or num_players > MAX_PLAYERS:
+            raise ValueError(f"Number of players must be between 2 and {MAX_PLAYERS}")
+        if n_games < 0:
+            raise ValueError("Number of games must not be negative")
+        
+        rng = np.random.default_rng(seed)
+        compiled = self.rules.compile(self.board)
+        table = compiled.array()
+        positions = np.zeros((n_games, num_players), dtype=np.int16)
+        winner = np.zeros(n_games, dtype=np.int16)
+        turns = np.zeros(n_games, dtype=np.int32)
+        # Seat to move and sixes rolled in a row, per game; extra rolls let games drift apart
+        seat = np.zeros(n_games, dtype=np.int64)
+        streak = np.zeros(n_games, dtype=np.int64)
+        active = np.arange(n_games)
+        snake_hits = np.zeros(self.board_size + 1, dtype=np.int64)
+        ladder_hits = np.zeros(self.board_size + 1, dtype=np.int64)
+        
+        step = 0
+        while active.size:
+            dice = rng.integers(1, 7, size=n_games, dtype=np.int16)[active]
+            player = seat[active]
+            current = positions[active, player].astype(np.int64)
+            # Same compiled move table as move_player, one row per game
+            outcome = table[streak[active] * compiled.stride + current * 7 + dice]
+            event = outcome[:, 2]
+            positions[active, player] = outcome[:, 1]
+            streak[active] = outcome[:, 3]
+            seat[active] = np.where(event & EVENT_EXTRA_ROLL, player, (player + 1) % num_players)
+            
+            if count_jumps:
+                landed = outcome[:, 0]
+                snake_hits += np.bincount(landed[event & EVENT_SNAKE != 0], minlength=self.board_size + 1)
+                ladder_hits += np.bincount(landed[event & EVENT_LADDER != 0], minlength=self.board_size + 1)
+            
+            finished = event & EVENT_WON != 0
+            if finished.any():
+                done = active[finished]
+                winner[done] = player[finished] + 1
+                turns[done] = step + 1
+                active = active[~finished]
+            step += 1
+        
+        result = {
+            "winner": winner,
+            "turns": turns,
+            "positions": positions
+        }
+        if count_jumps:
+            result["snake_hits"] = snake_hits
+            result["ladder_hits"] = ladder_hits
+        return result
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the game state into a compact versioned binary format.
+        
+        Moves are stored as packed records, so the size grows by a few bytes per move.
+        
+        Returns:
+            bytes: Serialized game, readable by ``from_bytes``.
+        """
+        parts = [_STATE_HEADER.pack(
+            STATE_MAGIC, STATE_VERSION, self.num_players, self.board_size, self.current_player,
+            self.game_over, self.winner or 0, HISTORY_LEVELS.index(self.history_level)
+        ), self._positions[1:].tobytes()]
+        
+        for player_id in range(1, self.num_players + 1):
+            for text in (self.get_player_name(player_id), self.get_player_icon(player_id)):
+                encoded = text.encode("utf-8")
+                parts.append(_LENGTH.pack(len(encoded)))
+                parts.append(encoded)
+        
+        for jumps in (self.snakes, self.ladders):
+            parts.append(_LENGTH.pack(len(jumps)))
+            parts.append(array("H", [square for pair in jumps.items() for square in pair]).tobytes())
+        
+        records = self._move_log.to_bytes()
+        parts.append(_LENGTH.pack(len(records)))
+        parts.append(records)
+        parts.append(_DICE_STATE.pack(
+            BACKENDS.index(self.dice.backend), self.seed is not None, self.seed or 0, self.dice.rolls
+        ))
+        parts.append(_VERSION_STATE.pack(self.version, self._version_base))
+        parts.append(_RULES_STATE.pack(
+            OVERSHOOT_RULES.index(self.rules.overshoot), self.rules.extra_roll_on_six, self.rules.sixes_forfeit,
+            self._streak
+        ))
+        return b"".join(parts)
+    
+    def to_bytes_since(self, version: int) -> Optional[bytes]:
+        """
+        Serialize the moves made since a saved state version, to be appended to that save.
+        
+        ``from_bytes`` reads a ``to_bytes`` save followed by any number of these as the
+        game is now. Each costs a few bytes per move, where ``to_bytes`` grows with the
+        whole move log and every player's name.
+        
+        Args:
+            version (int): State version of the game when it was saved.
+            
+        Returns:
+            Optional[bytes]: The moves and turn state, or None when they cannot be appended
+            (the game was reset since, history is off or the version is not from this game).
+        """
+        start = version - self._version_base
+        if self.history_level == HISTORY_OFF or not 0 <= start <= len(self._move_log):
+            return None
+        record = MoveLog.record_format(self.board_size > 255, self.num_players > 255)
+        return _MOVES_HEADER.pack(
+            MOVES_MAGIC, version, self.version, self.current_player, self.game_over, self.winner or 0,
+            self._streak, self.dice.rolls
+        ) + b"".join(record.pack(*move) for move in self._move_log.records(start))
+    
+    @classmethod
+    def from_bytes(cls, data: bytes, history_limit: Optional[int] = None) -> "SnakeAndLadder":
+        """
+        Restore a game serialized by ``to_bytes``, with any ``to_bytes_since`` output appended.
+        
+        Args:
+            data (bytes): Serialized game.
+            history_limit (int): Most packed moves to keep in memory, as in the constructor.
+            
+        Returns:
+            SnakeAndLadder: Game in the serialized state.
+            
+        Raises:
+            ValueError: If the data is not a serialized game, is truncated or corrupt, or uses an
+                unsupported version.
+        """
+        try:
+            return cls._read_state(data, history_limit)
+        except (struct.error, IndexError) as e:
+            raise ValueError("Serialized game is truncated or corrupt") from e
+    
+    @classmethod
+    def _read_state(cls, data: bytes, history_limit: Optional[int] = None) -> "SnakeAndLadder":
+        """
+        Parse the state written by ``to_bytes``; see ``from_bytes``.
+        """
+        # Versions before 5 store the player count, current player and winner in single bytes
+        header = _STATE_HEADER if data[3:4] >= bytes([5]) else _LEGACY_STATE_HEADER
+        try:
+            magic, version, num_players, board_size, current_player, game_over, winner, level = \
+                header.unpack_from(data)
+        except struct.error as e:
+            raise ValueError("Data is too short to be a serialized game") from e
+        if magic != STATE_MAGIC:
+            raise ValueError("Data is not a serialized Snake and Ladder game")
+        if not 1 <= version <= STATE_VERSION:
+            raise ValueError(f"Unsupported game state version: {version}")
+        
+        offset = header.size
+        positions = array("B" if board_size <= 255 else "H")
+        positions.frombytes(data[offset:offset + num_players * positions.itemsize])
+        offset += num_players * positions.itemsize
+        
+        def read_chunk(size: int) -> bytes:
+            nonlocal offset
+            (length,) = _LENGTH.unpack_from(data, offset)
+            chunk = data[offset + _LENGTH.size:offset + _LENGTH.size + length * size]
+            if len(chunk) != length * size:
+                raise ValueError("Serialized game is truncated or corrupt")
+            offset += _LENGTH.size + length * size
+            return chunk
+        
+        names, icons = {}, {}
+        for player_id in range(1, num_players + 1):
+            names[player_id] = read_chunk(1).decode("utf-8")
+            icons[player_id] = read_chunk(1).decode("utf-8")
+        
+        snakes, ladders = ({head: tail for head, tail in zip(squares[::2], squares[1::2])}
+                           for squares in (array("H", read_chunk(4)), array("H", read_chunk(4))))
+        board = Board.create(board_size, snakes, ladders)
+        log = MoveLog.from_bytes(read_chunk(1), wide=board_size > 255, limit=history_limit,
+                                 wide_players=num_players > 255)
+        
+        # Version 1 games carry no dice state and continue with fresh dice
+        dice_state = None
+        if version >= 2:
+            dice_state = _DICE_STATE.unpack_from(data, offset)
+            offset += _DICE_STATE.size
+        # Earlier versions did not record the state version or keep moves in global order
+        if version >= 3:
+            state_version, version_base = _VERSION_STATE.unpack_from(data, offset)
+            offset += _VERSION_STATE.size
+        else:
+            state_version = version_base = len(log)
+        # Earlier versions were always played by the classic rules
+        rules, streak = CLASSIC_RULES, 0
+        if version >= 4:
+            overshoot, extra_roll_on_six, sixes_forfeit, streak = _RULES_STATE.unpack_from(data, offset)
+            rules = Rules(OVERSHOOT_RULES[overshoot], bool(extra_roll_on_six), sixes_forfeit)
+            offset += _RULES_STATE.size
+        
+        # Built with its own rules, as a board may only be playable under them
+        game = cls(num_players, names, icons, HISTORY_LEVELS[level], board=board, history_limit=history_limit,
+                   rules=rules)
+        game._positions[1:] = positions
+        game.current_player = current_player
+        game.game_over = bool(game_over)
+        game.winner = winner or None
+        game.version, game._version_base = state_version, version_base
+        game._streak = streak
+        
+        # Moves appended since the save, each run starting at the version the last one ended at
+        record = MoveLog.record_format(board_size > 255, num_players > 255)
+        while version >= 6 and offset < len(data):
+            magic, start, end, current_player, game_over, winner, streak, rolls = \
+                _MOVES_HEADER.unpack_from(data, offset)
+            offset += _MOVES_HEADER.size
+            length = (end - start) * record.size
+            if magic != MOVES_MAGIC or start != game.version or end < start or offset + length > len(data):
+                raise ValueError("Serialized game is truncated or corrupt")
+            for move in record.iter_unpack(data[offset:offset + length]):
+                log.append(*move)
+                game._positions[move[0]] = move[3]
+            offset += length
+            game.version = end
+            game.current_player = current_player
+            game.game_over = bool(game_over)
+            game.winner = winner or None
+            game._streak = streak
+            dice_state = dice_state[:3] + (rolls,)
+        
+        game._index_squares(log.records() if len(log) else ())
+        if game.history_level != HISTORY_OFF:
+            game._move_log = log
+        if game.history_level == HISTORY_FULL:
+            for record in log.records():
+                game._move_history[record[0]].append(MoveLog.to_dict(record, board_size))
+        if dice_state:
+            backend, has_seed, seed, rolls = dice_state
+            game.dice = create_dice(seed if has_seed else None, BACKENDS[backend])
+            game.dice.skip(rolls)
+        return game
@@ -0,0 +1,411 @@
+import mmap
+import struct
+import tempfile
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+# Event codes stored in packed move records (bit flags, a winning ladder sets two)
+EVENT_NONE = 0
+EVENT_SNAKE = 1
+EVENT_LADDER = 2
+EVENT_OUT_OF_BOUNDS = 4
+EVENT_WON = 8
+EVENT_BOUNCE = 16
+EVENT_EXTRA_ROLL = 32
+EVENT_FORFEIT = 64
+# Keys set to True in move dictionaries, per flag
+EVENT_KEYS = (
+    (EVENT_OUT_OF_BOUNDS, "out_of_bounds"),
+    (EVENT_WON, "won"),
+    (EVENT_BOUNCE, "bounced"),
+    (EVENT_EXTRA_ROLL, "extra_roll"),
+    (EVENT_FORFEIT, "forfeit"),
+)
+# Those keys for every event code, so expanding a record needs no per-flag tests
+EVENT_FIELDS = tuple({key: True for flag, key in EVENT_KEYS if event & flag} for event in range(128))
+
+# Packed state delta: flags, version, current player, winner, number of moves or positions that follow
+DELTA_HEADER = struct.Struct("<BIBBI")
+# The same with 16-bit player IDs, for lobbies of more than 255 players
+DELTA_LOBBY_HEADER = struct.Struct("<BIHHI")
+DELTA_POSITIONS = 1
+DELTA_GAME_OVER = 2
+DELTA_WIDE = 4
+DELTA_WIDE_PLAYERS = 8
+
+
+class MoveLog:
+    """
+    Append-only log of moves stored as packed fixed-width records.
+
+    Each record holds (player, dice value, old position, final position, event code)
+    in a preallocated byte buffer that doubles when full, so logging a move costs
+    no per-move objects. Boards with more than 255 squares use wide records with
+    16-bit positions; lobbies of more than 255 players use lobby records, which also
+    widen the player ID to 16 bits.
+
+    With a ``limit``, at most that many records stay in memory: when the buffer is
+    full, its older half is appended to an anonymous temporary segment file, which
+    is memory-mapped for reads. Iterating the log streams the file, then memory.
+    """
+
+    RECORD = struct.Struct("BBBBB")
+    WIDE_RECORD = struct.Struct("<BBHHB")
+    LOBBY_RECORD = struct.Struct("<HBHHB")
+    # Records copied out and decoded at a time by ``records``
+    CHUNK = 4096
+
+    __slots__ = ("_buffer", "_count", "_record", "_limit", "_segment", "_spilled", "_map")
+
+    def __init__(self, capacity: int = 256, wide: bool = False, limit: Optional[int] = None,
+                 wide_players: bool = False):
+        """
+        Create an empty log.
+
+        Args:
+            capacity (int): Number of records to preallocate. Defaults to 256.
+            wide (bool): Use 16-bit positions. Defaults to False.
+            limit (int): Most records kept in memory, at least 2; older records spill
+                to disk. Defaults to None, keeping every record in memory.
+            wide_players (bool): Use 16-bit player IDs and positions. Defaults to False.
+
+        Raises:
+            ValueError: If limit is less than 2.
+        """
+        if limit is not None and limit < 2:
+            raise ValueError("Move log limit must be at least 2")
+        self._record = self.record_format(wide, wide_players)
+        self._limit = limit
+        capacity = max(capacity, 1) if limit is None else min(max(capacity, 1), limit)
+        self._buffer = bytearray(self._record.size * capacity)
+        # Records in memory; the _spilled records before them are in the segment file
+        self._count = 0
+        self._spilled = 0
+        self._segment = None
+        self._map = None
+
+    @classmethod
+    def record_format(cls, wide: bool = False, wide_players: bool = False) -> struct.Struct:
+        """
+        Get the packed record layout for a board and lobby size.
+
+        Args:
+            wide (bool): 16-bit positions. Defaults to False.
+            wide_players (bool): 16-bit player IDs and positions. Defaults to False.
+
+        Returns:
+            struct.Struct: ``LOBBY_RECORD``, ``WIDE_RECORD`` or ``RECORD``.
+        """
+        if wide_players:
+            return cls.LOBBY_RECORD
+        return cls.WIDE_RECORD if wide else cls.RECORD
+
+    @property
+    def limit(self) -> Optional[int]:
+        """
+        Most records kept in memory.
+
+        Returns:
+            Optional[int]: The limit, or None if every record stays in memory.
+        """
+        return self._limit
+
+    def __len__(self) -> int:
+        return self._spilled + self._count
+
+    @property
+    def spilled(self) -> int:
+        """
+        Number of records moved to the segment file.
+
+        Returns:
+            int: Records on disk.
+        """
+        return self._spilled
+
+    def append(self, player: int, dice_value: int, old_position: int, final_position: int, event: int) -> None:
+        """
+        Record a move.
+
+        Args:
+            player (int): ID of the player who moved.
+            dice_value (int): Value rolled.
+            old_position (int): Position before the move.
+            final_position (int): Position after snakes and ladders.
+            event (int): Combination of the ``EVENT_*`` flags.
+        """
+        if self._count == self._limit:
+            self._spill()
+        offset = self._count * self._record.size
+        if offset + self._record.size > len(self._buffer):
+            grow = len(self._buffer)
+            if self._limit is not None:
+                grow = min(grow, self._limit * self._record.size - len(self._buffer))
+            self._buffer.extend(bytes(grow))
+        self._record.pack_into(self._buffer, offset, player, dice_value, old_position, final_position, event)
+        self._count += 1
+
+    def _spill(self) -> None:
+        """
+        Append the older half of the in-memory records to the segment file.
+        """
+        size = self._record.size
+        moved = self._count - self._count // 2
+        if self._segment is None:
+            self._segment = tempfile.TemporaryFile()
+        self._segment.seek(self._spilled * size)
+        self._segment.write(memoryview(self._buffer)[:moved * size])
+        self._buffer[:(self._count - moved) * size] = self._buffer[moved * size:self._count * size]
+        self._count -= moved
+        self._spilled += moved
+
+    def _mapped(self) -> mmap.mmap:
+        """
+        Get a read-only memory map covering every spilled record.
+
+        Returns:
+            mmap.mmap: Map of the segment file.
+        """
+        if self._map is None or len(self._map) < self._spilled * self._record.size:
+            self._segment.flush()
+            # A replaced map stays valid for iterators still reading it
+            self._map = mmap.mmap(self._segment.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def records(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, int, int, int, int]]:
+        """
+        Iterate over the recorded moves in order, streaming spilled records from disk.
+
+        Moves can be appended while the iterator is open: records are copied out a chunk
+        at a time and found by move index, so moves spilled in between are neither
+        skipped nor repeated. Moves appended after the call are not returned.
+
+        Args:
+            start (int): Index of the first move to return. Defaults to 0.
+            stop (int): Index after the last move to return. Defaults to the end of the log.
+
+        Returns:
+            Iterator[Tuple[int, int, int, int, int]]: (player, dice, old position, final position, event).
+        """
+        size = self._record.size
+        stop = len(self) if stop is None else min(stop, len(self))
+        index = start
+        # A cleared log has fewer moves than when the iterator started
+        while index < min(stop, len(self)):
+            if index < self._spilled:
+                end = min(stop, self._spilled, index + self.CHUNK)
+                chunk = self._mapped()[index * size:end * size]
+            else:
+                end = min(stop, len(self), index + self.CHUNK)
+                chunk = self._buffer[(index - self._spilled) * size:(end - self._spilled) * size]
+            yield from self._record.iter_unpack(chunk)
+            index = end
+
+    def to_bytes(self) -> bytes:
+        """
+        Get the recorded moves as contiguous packed records, including spilled ones.
+
+        Returns:
+            bytes: ``len(self)`` records of the log's record size each.
+        """
+        in_memory = bytes(self._buffer[:self._count * self._record.size])
+        if not self._spilled:
+            return in_memory
+        return self._mapped()[:self._spilled * self._record.size] + in_memory
+
+    @classmethod
+    def from_bytes(cls, data: bytes, wide: bool = False, limit: Optional[int] = None,
+                   wide_players: bool = False) -> "MoveLog":
+        """
+        Rebuild a log from packed records produced by ``to_bytes``.
+
+        Args:
+            data (bytes): Packed records.
+            wide (bool): Whether the records use 16-bit positions. Defaults to False.
+            limit (int): Most records kept in memory. Defaults to None, keeping all.
+            wide_players (bool): Whether the records use 16-bit player IDs. Defaults to False.
+
+        Returns:
+            MoveLog: Log holding the records.
+
+        Raises:
+            ValueError: If data is not a whole number of records.
+        """
+        record = cls.record_format(wide, wide_players)
+        count, remainder = divmod(len(data), record.size)
+        if remainder:
+            raise ValueError("Move log data is not a whole number of records")
+        log = cls(count, wide, limit, wide_players)
+        kept = count if limit is None or count <= limit else limit // 2
+        if kept < count:
+            log._segment = tempfile.TemporaryFile()
+            log._segment.write(data[:(count - kept) * record.size])
+            log._spilled = count - kept
+        log._buffer[:kept * record.size] = data[(count - kept) * record.size:]
+        log._count = kept
+        return log
+
+    def clear(self) -> None:
+        """
+        Drop all records, keeping the allocated buffer and releasing the segment file.
+        """
+        self._count = 0
+        self._spilled = 0
+        # Dropping the file instead of truncating it keeps maps held by running iterators valid
+        self._segment = None
+        self._map = None
+
+    @staticmethod
+    def to_dict(record: Tuple[int, int, int, int, int], board_size: Optional[int] = None) -> Dict:
+        """
+        Expand a packed record into the dictionary shape returned by ``move_player``.
+
+        Args:
+            record (Tuple[int, int, int, int, int]): Packed move record.
+            board_size (int): Size of the board, needed to tell where a bounced move
+                landed. Defaults to None.
+
+        Returns:
+            Dict: Movement details.
+        """
+        player, dice_value, old_position, final_position, event = record
+        position_after_roll = old_position + dice_value
+        if event & EVENT_FORFEIT:
+            position_after_roll = old_position
+        elif event & EVENT_BOUNCE and board_size:
+            position_after_roll = max(2 * board_size - position_after_roll, 0)
+        elif event & EVENT_WON and not event & (EVENT_SNAKE | EVENT_LADDER):
+            # A roll past the last square counts as reaching it under the quick finish rule
+            position_after_roll = final_position
+        move = {
+            "player": player,
+            "old_position": old_position,
+            "dice_value": dice_value,
+            "position_after_roll": position_after_roll,
+            "snake_or_ladder": None,
+            "final_position": final_position
+        }
+        if event & EVENT_SNAKE:
+            move["snake_or_ladder"] = f"Snake: {position_after_roll} → {final_position}"
+        elif event & EVENT_LADDER:
+            move["snake_or_ladder"] = f"Ladder: {position_after_roll} → {final_position}"
+        move.update(EVENT_FIELDS[event])
+        return move
+
+    @staticmethod
+    def from_dict(move: Dict) -> Tuple[int, int, int, int, int]:
+        """
+        Pack a move dictionary returned by ``move_player`` into a record.
+
+        Args:
+            move (Dict): Movement details.
+
+        Returns:
+            Tuple[int, int, int, int, int]: (player, dice, old position, final position, event).
+        """
+        event = EVENT_NONE
+        for flag, key in EVENT_KEYS:
+            if move.get(key):
+                event |= flag
+        if move["snake_or_ladder"]:
+            event |= EVENT_SNAKE if move["snake_or_ladder"].startswith("Snake") else EVENT_LADDER
+        return move["player"], move["dice_value"], move["old_position"], move["final_position"], event
+
+
+def pack_delta(delta: Dict, wide: bool = False, wide_players: bool = False) -> bytes:
+    """
+    Encode a delta from ``SnakeAndLadder.events_since`` as bytes.
+
+    A delta of k moves takes 11 + 5k bytes (11 + 7k with wide records, 13 + 8k with
+    lobby records).
+
+    Args:
+        delta (Dict): Delta to encode.
+        wide (bool): Use 16-bit positions, as on boards with more than 255 squares. Defaults to False.
+        wide_players (bool): Use 16-bit player IDs and positions, as in lobbies of more
+            than 255 players. Defaults to False.
+
+    Returns:
+        bytes: Encoded delta, readable by ``unpack_delta``.
+    """
+    wide = wide or wide_players
+    flags = ((DELTA_GAME_OVER if delta["game_over"] else 0) | (DELTA_WIDE if wide else 0)
+             | (DELTA_WIDE_PLAYERS if wide_players else 0))
+    if "positions" in delta:
+        items = delta["positions"]
+        body = array("H" if wide else "B", items).tobytes()
+        flags |= DELTA_POSITIONS
+    else:
+        items = delta["moves"]
+        record = MoveLog.record_format(wide, wide_players)
+        body = b"".join(record.pack(*move) for move in items)
+    header = DELTA_LOBBY_HEADER if wide_players else DELTA_HEADER
+    return header.pack(flags, delta["version"], delta["current_player"], delta["winner"] or 0, len(items)) + body
+
+
+def unpack_delta(data: bytes) -> Dict:
+    """
+    Decode a delta encoded by ``pack_delta``.
+
+    Args:
+        data (bytes): Encoded delta.
+
+    Returns:
+        Dict: The delta, in the shape returned by ``SnakeAndLadder.events_since``.
+
+    Raises:
+        ValueError: If the data is truncated.
+    """
+    header = DELTA_LOBBY_HEADER if data[:1] and data[0] & DELTA_WIDE_PLAYERS else DELTA_HEADER
+    try:
+        flags, version, current_player, winner, count = header.unpack_from(data)
+    except struct.error as e:
+        raise ValueError("Data is too short to be a delta") from e
+    body = data[header.size:]
+    delta = {
+        "version": version,
+        "current_player": current_player,
+        "game_over": bool(flags & DELTA_GAME_OVER),
+        "winner": winner or None
+    }
+    if flags & DELTA_POSITIONS:
+        positions = array("H" if flags & DELTA_WIDE else "B")
+        if len(body) != count * positions.itemsize:
+            raise ValueError("Delta positions are truncated")
+        positions.frombytes(body)
+        delta["positions"] = positions.tolist()
+    else:
+        record = MoveLog.record_format(flags & DELTA_WIDE, flags & DELTA_WIDE_PLAYERS)
+        if len(body) != count * record.size:
+            raise ValueError("Delta moves are truncated")
+        delta["moves"] = list(record.iter_unpack(body))
+    return delta
+
+
+def apply_delta(status: Dict, delta: Dict) -> Dict:
+    """
+    Bring a copy of the game status up to date in place.
+
+    Positions are only updated in statuses that have ``players_position``, so lobby
+    statuses are updated in O(1) whatever the delta.
+
+    Args:
+        status (Dict): Status in the shape returned by ``SnakeAndLadder.get_game_status``.
+        delta (Dict): Delta from ``events_since(status["version"])``.
+
+    Returns:
+        Dict: The updated status.
+    """
+    positions = status.get("players_position")
+    if positions is not None:
+        if "positions" in delta:
+            for player_id, position in enumerate(delta["positions"], 1):
+                positions[player_id] = position
+        else:
+            for player_id, _, _, final_position, _ in delta["moves"]:
+                positions[player_id] = final_position
+    status["version"] = delta["version"]
+    status["current_player"] = delta["current_player"]
+    status["game_over"] = delta["game_over"]
+    status["winner"] = delta["winner"]
+    return status
@@ -0,0 +1,333 @@
+import struct
+import threading
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from board import Board
+from history import EVENT_LADDER, EVENT_SNAKE
+from markov import get_board_analysis
+from rules import CLASSIC_RULES, OVERSHOOT_RULES, Rules
+
+# Binary counters format: magic, version, players, board size, overshoot rule, extra roll on six,
+# sixes forfeit, snakes, ladders; then the snake and ladder squares and the three count arrays
+COUNTERS_MAGIC = b"SNC"
+COUNTERS_VERSION = 1
+_COUNTERS_HEADER = struct.Struct("<3sBHHBBBHH")
+
+
+class LandingCounters:
+    """
+    Running counts of where moves end on one board, for one rule set and player count.
+
+    ``landings[square]`` counts the moves ending on each square, after any snake or
+    ladder and including turns where the player stays put. ``snake_hits[head]`` and
+    ``ladder_climbs[foot]`` count the snakes and ladders taken. The arrays are fixed
+    at one slot per square and only ever incremented, so counters from other processes
+    are simply added in with ``merge``.
+    """
+
+    __slots__ = ("board", "rules", "num_players", "landings", "snake_hits", "ladder_climbs", "_lock")
+
+    def __init__(self, board: Board, rules: Rules, num_players: int):
+        """
+        Create zeroed counters. Prefer ``counters_for``, which shares them across the process.
+
+        Args:
+            board (Board): Board the moves are played on.
+            rules (Rules): Rules the moves are played by.
+            num_players (int): Players per game.
+        """
+        self.board = board
+        self.rules = rules
+        self.num_players = num_players
+        self.landings = array("Q", [0]) * (board.size + 1)
+        self.snake_hits = array("Q", [0]) * (board.size + 1)
+        self.ladder_climbs = array("Q", [0]) * (board.size + 1)
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> Tuple[str, Rules, int]:
+        """
+        Identity of the counters: board content key, rules and player count.
+
+        Returns:
+            Tuple[str, Rules, int]: Key in the process-wide registry.
+        """
+        return self.board.key, self.rules, self.num_players
+
+    @property
+    def moves(self) -> int:
+        """
+        Number of moves counted.
+
+        Returns:
+            int: Sum of the landings.
+        """
+        return sum(self.landings)
+
+    def record(self, landed: int, final: int, event: int) -> None:
+        """
+        Count one move. Called by ``SnakeAndLadder.move_player``.
+
+        Not locked, as a lock would double the cost of a move: two threads counting the
+        same square at once may, very rarely, lose one count, which frequencies can bear.
+
+        Args:
+            landed (int): Square the dice reached, before any snake or ladder.
+            final (int): Square the move ended on.
+            event (int): Combination of the ``EVENT_*`` flags from ``history``.
+        """
+        self.landings[final] += 1
+        if event & EVENT_SNAKE:
+            self.snake_hits[landed] += 1
+        elif event & EVENT_LADDER:
+            self.ladder_climbs[landed] += 1
+
+    def merge(self, other: "LandingCounters") -> None:
+        """
+        Add another set of counters for the same board, rules and player count into these.
+
+        Args:
+            other (LandingCounters): Counters to add, e.g. from another process.
+
+        Raises:
+            ValueError: If the counters are for a different board, rules or player count.
+        """
+        if other.key != self.key:
+            raise ValueError("Counters of different boards, rules or player counts cannot be merged")
+        with self._lock:
+            for counts, extra in ((self.landings, other.landings), (self.snake_hits, other.snake_hits),
+                                  (self.ladder_climbs, other.ladder_climbs)):
+                for square, count in enumerate(extra):
+                    if count:
+                        counts[square] += count
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the counters with their board and rules, so any process can merge them.
+
+        Returns:
+            bytes: Serialized counters, readable by ``from_bytes``.
+        """
+        board, rules = self.board, self.rules
+        counts = self.landings.tobytes() + self.snake_hits.tobytes() + self.ladder_climbs.tobytes()
+        return b"".join([
+            _COUNTERS_HEADER.pack(COUNTERS_MAGIC, COUNTERS_VERSION, self.num_players, board.size,
+                                  OVERSHOOT_RULES.index(rules.overshoot), rules.extra_roll_on_six,
+                                  rules.sixes_forfeit, len(board.snakes), len(board.ladders)),
+            array("H", [square for pair in board.snakes.items() for square in pair]).tobytes(),
+            array("H", [square for pair in board.ladders.items() for square in pair]).tobytes(),
+            counts
+        ])
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> Tuple["LandingCounters", int]:
+        """
+        Restore counters serialized by ``to_bytes``.
+
+        Args:
+            data (bytes): Serialized counters, possibly followed by more.
+            offset (int): Where the counters start in ``data``. Defaults to 0.
+
+        Returns:
+            Tuple[LandingCounters, int]: The counters, not registered with the process,
+            and the offset just past them.
+
+        Raises:
+            ValueError: If the data is not serialized counters or uses an unsupported version.
+        """
+        try:
+            magic, version, num_players, size, overshoot, extra_roll_on_six, sixes_forfeit, snakes, ladders = \
+                _COUNTERS_HEADER.unpack_from(data, offset)
+        except struct.error as e:
+            raise ValueError("Data is too short to be serialized counters") from e
+        if magic != COUNTERS_MAGIC:
+            raise ValueError("Data is not serialized landing counters")
+        if version != COUNTERS_VERSION:
+            raise ValueError(f"Unsupported counters version: {version}")
+        offset += _COUNTERS_HEADER.size
+
+        jumps = []
+        for count in (snakes, ladders):
+            squares = array("H", data[offset:offset + 4 * count])
+            jumps.append(dict(zip(squares[::2], squares[1::2])))
+            offset += 4 * count
+        board = Board.create(size, jumps[0], jumps[1])
+        counters = cls(board, Rules(OVERSHOOT_RULES[overshoot], bool(extra_roll_on_six), sixes_forfeit),
+                       num_players)
+        for counts in (counters.landings, counters.snake_hits, counters.ladder_climbs):
+            end = offset + counts.itemsize * len(counts)
+            if end > len(data):
+                raise ValueError("Data is too short to be serialized counters")
+            counts[:] = array("Q", data[offset:end])
+            offset = end
+        return counters, offset
+
+
+# Process-wide counters by (board content key, rules, player count)
+_counters: Dict[Tuple[str, Rules, int], LandingCounters] = {}
+_counters_lock = threading.Lock()
+
+
+def counters_for(board: Board, rules: Rules, num_players: int) -> LandingCounters:
+    """
+    Get the process-wide counters of a board, rule set and player count, creating them on first use.
+
+    Args:
+        board (Board): Board played on.
+        rules (Rules): Rules played by.
+        num_players (int): Players per game.
+
+    Returns:
+        LandingCounters: Counters shared by every game with this board, rules and player count.
+    """
+    key = (board.key, rules, num_players)
+    counters = _counters.get(key)
+    if counters is None:
+        with _counters_lock:
+            counters = _counters.setdefault(key, LandingCounters(board, rules, num_players))
+    return counters
+
+
+def board_counters(board: Board, rules: Optional[Rules] = None) -> List[LandingCounters]:
+    """
+    Get the process-wide counters of a board for every player count seen so far.
+
+    Args:
+        board (Board): Board played on.
+        rules (Rules): Only counters for these rules. Defaults to every rule set.
+
+    Returns:
+        List[LandingCounters]: Counters ordered by player count.
+    """
+    with _counters_lock:
+        found = [counters for (key, counter_rules, _), counters in _counters.items()
+                 if key == board.key and (rules is None or counter_rules == rules)]
+    return sorted(found, key=lambda counters: counters.num_players)
+
+
+def export_counters() -> bytes:
+    """
+    Serialize every process-wide counter, e.g. to send from a worker process to its parent.
+
+    Returns:
+        bytes: Concatenated ``LandingCounters.to_bytes`` output, readable by ``merge_counters``.
+    """
+    with _counters_lock:
+        everything = list(_counters.values())
+    return b"".join(counters.to_bytes() for counters in everything)
+
+
+def merge_counters(data: bytes) -> int:
+    """
+    Add counters exported by ``export_counters``, e.g. in another process, into this process's counters.
+
+    Args:
+        data (bytes): Exported counters.
+
+    Returns:
+        int: Number of counter sets merged.
+
+    Raises:
+        ValueError: If the data is not exported counters.
+    """
+    offset = merged = 0
+    while offset < len(data):
+        counters, offset = LandingCounters.from_bytes(data, offset)
+        counters_for(counters.board, counters.rules, counters.num_players).merge(counters)
+        merged += 1
+    return merged
+
+
+def landing_frequencies(board: Board, rules: Rules) -> Dict:
+    """
+    Compare the observed share of moves on each square with its exact expected share.
+
+    Counts are added up over every player count seen on the board under these rules.
+    Games end when someone wins, so squares near the start get a larger share of the
+    moves the more players there are; the expected shares mix the exact expectation
+    of each player count, weighted by the moves observed at that count. Only the
+    classic rules have a Markov analysis, so other variants get observed shares only.
+    No move history is read.
+
+    Args:
+        board (Board): Board played on.
+        rules (Rules): Rules played by.
+
+    Returns:
+        Dict: ``moves`` counted and, as arrays of shape (board.size + 1,) holding shares of
+        those moves, ``landings``, ``snake_hits`` and ``ladder_climbs``, with
+        ``expected_landings``, ``expected_snake_hits`` and ``expected_ladder_climbs`` (None
+        unless the rules are classic and moves were counted).
+    """
+    observed = {name: np.zeros(board.size + 1) for name in ("landings", "snake_hits", "ladder_climbs")}
+    expected_landings = np.zeros(board.size + 1)
+    expected_reached = np.zeros(board.size + 1)
+    moves = 0
+    analysis = get_board_analysis(board.snakes, board.ladders, board.size) if rules == CLASSIC_RULES else None
+    for counters in board_counters(board, rules):
+        landings = np.frombuffer(counters.landings, dtype=np.uint64)
+        count = int(landings.sum())
+        if not count:
+            continue
+        moves += count
+        observed["landings"] += landings
+        observed["snake_hits"] += np.frombuffer(counters.snake_hits, dtype=np.uint64)
+        observed["ladder_climbs"] += np.frombuffer(counters.ladder_climbs, dtype=np.uint64)
+        if analysis is not None:
+            # Expected rolls per game, scaled to this player count's share of the moves
+            reached, ended = analysis.expected_landings(counters.num_players)
+            expected_landings += count * ended / ended.sum()
+            expected_reached += count * reached / ended.sum()
+
+    result = {name: counts / max(moves, 1) for name, counts in observed.items()}
+    result["moves"] = moves
+    if analysis is None or not moves:
+        result["expected_landings"] = result["expected_snake_hits"] = result["expected_ladder_climbs"] = None
+        return result
+    heads = np.zeros(board.size + 1, dtype=bool)
+    heads[list(board.snakes)] = True
+    feet = np.zeros(board.size + 1, dtype=bool)
+    feet[list(board.ladders)] = True
+    result["expected_landings"] = expected_landings / moves
+    result["expected_snake_hits"] = np.where(heads, expected_reached / moves, 0.0)
+    result["expected_ladder_climbs"] = np.where(feet, expected_reached / moves, 0.0)
+    return result
+
+
+def square_heat(board: Board, rules: Rules) -> Dict:
+    """
+    Get one share of moves per square for a heatmap, with its expectation where there is one.
+
+    Snake heads and ladder feet get the share of moves taking them, other squares the
+    share of moves ending on them, from ``landing_frequencies``. Heat is
+    log2(observed / expected) clipped to [-1, 1], so +1 means twice as often as
+    expected and -1 half as often or less; without an expectation it is the share
+    relative to the most used square, from 0 to 1.
+
+    Args:
+        board (Board): Board played on.
+        rules (Rules): Rules played by.
+
+    Returns:
+        Dict: ``moves`` counted and arrays of shape (board.size + 1,): ``observed`` and
+        ``expected`` shares (None without an expectation) and ``heat``.
+    """
+    frequencies = landing_frequencies(board, rules)
+    heads, feet = list(board.snakes), list(board.ladders)
+    observed = frequencies["landings"].copy()
+    observed[heads] = frequencies["snake_hits"][heads]
+    observed[feet] = frequencies["ladder_climbs"][feet]
+    expected = frequencies["expected_landings"]
+    if expected is None:
+        heat = observed / max(observed.max(), 1e-12)
+    else:
+        expected = expected.copy()
+        expected[heads] = frequencies["expected_snake_hits"][heads]
+        expected[feet] = frequencies["expected_ladder_climbs"][feet]
+        # Squares neither used nor expected to be are neutral
+        with np.errstate(divide="ignore", invalid="ignore"):
+            heat = np.nan_to_num(np.clip(np.log2(observed / expected), -1.0, 1.0))
+    return {"moves": frequencies["moves"], "observed": observed, "expected": expected, "heat": heat}
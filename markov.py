@@ -0,0 +1,282 @@
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class BoardAnalysis:
+    """
+    Exact Markov-chain analysis of a Snake and Ladder board.
+
+    Each square is a state of an absorbing chain: a roll moves the player forward,
+    snakes and ladders are applied on landing, rolls past the last square leave the
+    player where they are, and the last square is absorbing. Results are exact up to
+    floating-point precision; no games are simulated.
+    """
+
+    # Stop extending the finish-time distribution once the chance of still playing is below this
+    TAIL_TOLERANCE = 1e-15
+    # Larger boards get expected turns from the finish-time distribution instead of a dense solve
+    DENSE_SOLVE_LIMIT = 2000
+    # Give up on boards whose games can outlast this many rolls per square, e.g. when the end is unreachable
+    MAX_ROLLS_PER_SQUARE = 1000
+
+    def __init__(self, snakes: Dict[int, int], ladders: Dict[int, int], board_size: int = 100):
+        """
+        Build the transition table for a board.
+
+        Args:
+            snakes (Dict[int, int]): Snake head to tail squares.
+            ladders (Dict[int, int]): Ladder foot to top squares.
+            board_size (int): Number of squares on the board. Defaults to 100.
+
+        Raises:
+            ValueError: If games can last more than ``MAX_ROLLS_PER_SQUARE`` rolls per square.
+        """
+        self.board_size = board_size
+        jump = np.arange(board_size + 1)
+        for start, end in list(snakes.items()) + list(ladders.items()):
+            jump[start] = end
+
+        # Sparse form of the chain: the square reached from each non-final square with each dice value
+        rolled = np.arange(board_size)[:, None] + np.arange(1, 7)[None, :]
+        self.targets = np.where(rolled > board_size, np.arange(board_size)[:, None],
+                                jump[np.minimum(rolled, board_size)])
+
+        self._finish_pmf = self._compute_finish_pmf()
+        self._win_probabilities = {}
+        self._landings = {}
+
+    @property
+    def transition_matrix(self) -> np.ndarray:
+        """
+        Dense absorbing transition matrix of the chain.
+
+        Returns:
+            np.ndarray: Array of shape (board_size + 1, board_size + 1).
+        """
+        matrix = np.zeros((self.board_size + 1, self.board_size + 1))
+        np.add.at(matrix, (np.repeat(np.arange(self.board_size), 6), self.targets.ravel()), 1 / 6)
+        matrix[self.board_size, self.board_size] = 1.0
+        return matrix
+
+    def step(self, distribution: np.ndarray) -> np.ndarray:
+        """
+        Advance a distribution over squares by one roll.
+
+        Args:
+            distribution (np.ndarray): Probability of being on each square.
+
+        Returns:
+            np.ndarray: Distribution after one more roll.
+        """
+        moved = np.bincount(self.targets.ravel(), weights=np.repeat(distribution[:self.board_size] / 6, 6),
+                            minlength=self.board_size + 1)
+        moved[self.board_size] += distribution[self.board_size]
+        return moved
+
+    def _compute_finish_pmf(self, max_rolls: Optional[int] = None) -> np.ndarray:
+        """
+        Compute the probability of finishing on each of a single player's rolls.
+
+        Args:
+            max_rolls (int): Most rolls to follow. Defaults to ``MAX_ROLLS_PER_SQUARE`` per square.
+
+        Returns:
+            np.ndarray: Entry t is the probability of reaching the last square on roll t.
+
+        Raises:
+            ValueError: If the chance of still playing is above ``TAIL_TOLERANCE`` after ``max_rolls``.
+        """
+        max_rolls = max_rolls or self.MAX_ROLLS_PER_SQUARE * self.board_size
+        distribution = np.zeros(self.board_size + 1)
+        distribution[0] = 1.0
+        finished = [0.0]
+        while distribution[:self.board_size].sum() > self.TAIL_TOLERANCE:
+            if len(finished) > max_rolls:
+                raise ValueError(f"Games on this board can last more than {max_rolls} rolls; "
+                                 f"the last square may be unreachable")
+            distribution = self.step(distribution)
+            finished.append(distribution[self.board_size])
+        return np.diff(finished, prepend=0.0)
+
+    @property
+    def expected_turns(self) -> float:
+        """
+        Expected number of rolls for a single player to reach the last square.
+
+        Returns:
+            float: Expected rolls from square 0, from the chain's fundamental matrix.
+        """
+        if self.board_size > self.DENSE_SOLVE_LIMIT:
+            # E[T] is the sum of P(T > t), already known to within TAIL_TOLERANCE
+            return float((1.0 - np.cumsum(self._finish_pmf)).sum())
+        transient = self.transition_matrix[:self.board_size, :self.board_size]
+        steps = np.linalg.solve(np.eye(self.board_size) - transient, np.ones(self.board_size))
+        return float(steps[0])
+
+    def finish_time_cdf(self, max_turns: int) -> List[float]:
+        """
+        Get the probability that a single player has finished within each number of rolls.
+
+        Args:
+            max_turns (int): Largest number of rolls to report.
+
+        Returns:
+            List[float]: Entry t is the probability of having finished within t rolls.
+        """
+        cdf = np.cumsum(self._finish_pmf)
+        if max_turns >= len(cdf):
+            cdf = np.concatenate([cdf, np.full(max_turns + 1 - len(cdf), cdf[-1])])
+        return cdf[:max_turns + 1].tolist()
+
+    def _seat_outcomes(self, num_players: int) -> np.ndarray:
+        """
+        Probability that seat k wins on its t-th roll, for every seat and roll.
+
+        Seat k wins on its t-th roll if it finishes then, every earlier seat has
+        survived t rolls and every later seat has survived t - 1 rolls.
+
+        Args:
+            num_players (int): Number of players in the game.
+
+        Returns:
+            np.ndarray: Array of shape (num_players, rolls).
+        """
+        pmf = self._finish_pmf
+        survival = 1.0 - np.cumsum(pmf)
+        survival_before = np.concatenate([[1.0], survival[:-1]])
+        seats = np.arange(num_players)[:, None]
+        return pmf * survival ** seats * survival_before ** (num_players - 1 - seats)
+
+    def win_probabilities(self, num_players: int) -> Dict[int, float]:
+        """
+        Get the probability of each seat winning a game.
+
+        Args:
+            num_players (int): Number of players (2-4).
+
+        Returns:
+            Dict[int, float]: Player ID (seat order) to win probability.
+
+        Raises:
+            ValueError: If num_players is not between 2 and 4.
+        """
+        if num_players < 2 or num_players > 4:
+            raise ValueError("Number of players must be between 2 and 4")
+        if num_players not in self._win_probabilities:
+            wins = self._seat_outcomes(num_players).sum(axis=1)
+            self._win_probabilities[num_players] = {seat + 1: float(p) for seat, p in enumerate(wins)}
+        return dict(self._win_probabilities[num_players])
+
+    def expected_landings(self, num_players: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Expected number of rolls reaching and ending on each square in one game, over all players.
+
+        A seat's t-th roll is only played while the game is still going: every earlier
+        seat has survived t rolls and every later seat t - 1, so each roll's landing
+        distribution is weighted by that chance. Results are cached per player count.
+
+        Args:
+            num_players (int): Number of players, from 1.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Two arrays of shape (board_size + 1,): rolls
+            reaching each square before any snake or ladder, and rolls ending on each
+            square after them. Rolls past the last square reach nothing and end where
+            they started.
+
+        Raises:
+            ValueError: If num_players is less than 1.
+        """
+        if num_players < 1:
+            raise ValueError("Number of players must be at least 1")
+        if num_players not in self._landings:
+            size = self.board_size
+            survival = np.maximum(1.0 - np.cumsum(self._finish_pmf), 0.0)
+            survival_before = np.concatenate([[1.0], survival[:-1]])
+            # Chance that the t-th roll of a seat is played, summed over the seats
+            played = np.zeros(len(survival))
+            for seat in range(num_players):
+                played += survival ** seat * survival_before ** (num_players - 1 - seat)
+
+            rolled = np.arange(size)[:, None] + np.arange(1, 7)[None, :]
+            in_bounds = (rolled <= size).ravel()
+            reached_squares = rolled.ravel()[in_bounds]
+            reached = np.zeros(size + 1)
+            ended = np.zeros(size + 1)
+            distribution = np.zeros(size + 1)
+            distribution[0] = 1.0
+            for t in range(1, len(survival)):
+                weights = np.repeat(distribution[:size] / 6, 6)
+                moved = np.bincount(self.targets.ravel(), weights=weights, minlength=size + 1)
+                ended += played[t] * moved
+                reached += played[t] * np.bincount(reached_squares, weights=weights[in_bounds], minlength=size + 1)
+                distribution = moved
+            self._landings[num_players] = (reached, ended)
+        reached, ended = self._landings[num_players]
+        return reached.copy(), ended.copy()
+
+    def expected_game_length(self, num_players: int) -> float:
+        """
+        Expected total number of rolls, across all players, until someone wins.
+
+        Args:
+            num_players (int): Number of players (2-4).
+
+        Returns:
+            float: Expected rolls in a game.
+
+        Raises:
+            ValueError: If num_players is not between 2 and 4.
+        """
+        if num_players < 2 or num_players > 4:
+            raise ValueError("Number of players must be between 2 and 4")
+        outcomes = self._seat_outcomes(num_players)
+        rounds = np.arange(outcomes.shape[1])
+        # Seat k winning on its t-th roll ends the game after (t - 1) * n + k rolls
+        rolls = (rounds - 1)[None, :] * num_players + np.arange(1, num_players + 1)[:, None]
+        return float((outcomes * rolls).sum())
+
+    def game_length_quantile(self, num_players: int, fraction: float = 0.5) -> int:
+        """
+        Get a quantile of the total number of rolls, across all players, until someone wins.
+
+        Args:
+            num_players (int): Number of players (2-4).
+            fraction (float): Quantile to get. Defaults to 0.5, the median.
+
+        Returns:
+            int: Smallest number of rolls within which a game ends with probability ``fraction``.
+
+        Raises:
+            ValueError: If num_players is not between 2 and 4.
+        """
+        if num_players < 2 or num_players > 4:
+            raise ValueError("Number of players must be between 2 and 4")
+        outcomes = self._seat_outcomes(num_players)[:, 1:]
+        rounds = np.arange(1, outcomes.shape[1] + 1)
+        rolls = (rounds - 1)[None, :] * num_players + np.arange(1, num_players + 1)[:, None]
+        cdf = np.cumsum(np.bincount(rolls.ravel(), weights=outcomes.ravel()))
+        return int(np.searchsorted(cdf, fraction * cdf[-1]))
+
+
+@lru_cache(maxsize=32)
+def _cached_analysis(board_size: int, snakes: Tuple[Tuple[int, int], ...],
+                     ladders: Tuple[Tuple[int, int], ...]) -> BoardAnalysis:
+    return BoardAnalysis(dict(snakes), dict(ladders), board_size)
+
+
+def get_board_analysis(snakes: Dict[int, int], ladders: Dict[int, int], board_size: int = 100) -> BoardAnalysis:
+    """
+    Get the analysis of a board, reusing the cached result for identical boards.
+
+    Args:
+        snakes (Dict[int, int]): Snake head to tail squares.
+        ladders (Dict[int, int]): Ladder foot to top squares.
+        board_size (int): Number of squares on the board. Defaults to 100.
+
+    Returns:
+        BoardAnalysis: Shared analysis object for the board.
+    """
+    return _cached_analysis(board_size, tuple(sorted(snakes.items())), tuple(sorted(ladders.items())))
@@ -0,0 +1,328 @@
+"""
+Opt-in timers, counters and a sampling profiler for the game engine and app.
+
+Instrumentation is configured from the environment when this module is imported, except
+for the exporter, which entry points start with ``serve`` so worker processes that import
+the engine do not bind the port again:
+
+    SNL_METRICS=1               record latency histograms and counters
+    SNL_METRICS_PORT=9464       serve them in Prometheus text format on /metrics (see ``serve``)
+    SNL_METRICS_DUMP=path.prom  write them to a file at exit
+    SNL_PROFILE=1               sample every thread's stack in the background
+    SNL_PROFILE_DUMP=path.txt   where to write collapsed stacks at exit (default profile.txt)
+
+When metrics are disabled, ``timed`` returns functions unchanged and ``timer`` returns a
+shared no-op context manager, so instrumented code runs at full speed.
+"""
+import atexit
+import bisect
+import contextlib
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+ENABLED = os.environ.get("SNL_METRICS", "") not in ("", "0")
+
+# Upper bounds of the latency buckets, in seconds
+BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0)
+
+
+class Histogram:
+    """
+    Cumulative latency histogram with fixed buckets.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        """
+        Record one measurement.
+
+        Args:
+            seconds (float): Measured latency.
+        """
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+class Registry:
+    """
+    Process-wide store of histograms and counters.
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def render_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Metrics text.
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name, histogram in sorted(self.histograms.items()):
+                metric = f"snl_{name}_seconds"
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(BUCKETS + (float("inf"),), histogram.counts):
+                    cumulative += count
+                    label = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{metric}_bucket{{le="{label}"}} {cumulative}')
+                lines.append(f"{metric}_sum {histogram.sum}")
+                lines.append(f"{metric}_count {histogram.count}")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE snl_{name}_total counter")
+                lines.append(f"snl_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> None:
+        """
+        Write all metrics to a file in Prometheus text format.
+
+        Args:
+            path (str): Output file.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.render_prometheus())
+
+
+REGISTRY = Registry()
+_NULL_TIMER = contextlib.nullcontext()
+
+
+def timed(name: str) -> Callable:
+    """
+    Decorate a function to record its latency under ``name``.
+
+    Args:
+        name (str): Metric name.
+
+    Returns:
+        Callable: Decorator; returns the function unchanged when metrics are disabled.
+    """
+    def decorator(func: Callable) -> Callable:
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                REGISTRY.observe(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        REGISTRY.observe(self.name, time.perf_counter() - self.start)
+
+
+def timer(name: str):
+    """
+    Context manager recording the latency of a block under ``name``.
+
+    Args:
+        name (str): Metric name.
+
+    Returns:
+        A context manager; a shared no-op one when metrics are disabled.
+    """
+    return _Timer(name) if ENABLED else _NULL_TIMER
+
+
+def start_timer() -> Optional[float]:
+    """
+    Start timing a span that cannot be wrapped in a block, such as a script run.
+
+    Returns:
+        Optional[float]: Token for ``stop_timer``, or None when metrics are disabled.
+    """
+    return time.perf_counter() if ENABLED else None
+
+
+def stop_timer(name: str, token: Optional[float]) -> None:
+    """
+    Record a span started with ``start_timer``.
+
+    Args:
+        name (str): Metric name.
+        token (Optional[float]): Value returned by ``start_timer``.
+    """
+    if token is not None:
+        REGISTRY.observe(name, time.perf_counter() - token)
+
+
+def increment(name: str, amount: int = 1) -> None:
+    """
+    Add to a counter.
+
+    Args:
+        name (str): Counter name.
+        amount (int): Amount to add. Defaults to 1.
+    """
+    if ENABLED:
+        REGISTRY.increment(name, amount)
+
+
+def start_http_server(port: int) -> "ThreadingHTTPServer":
+    """
+    Serve the metrics on ``/metrics`` from a background thread.
+
+    Args:
+        port (int): Port to listen on.
+
+    Returns:
+        ThreadingHTTPServer: The running server.
+    """
+    # Imported here: http.server pulls in the email package, which slows every cold start
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = REGISTRY.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("", port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+_server: Optional["ThreadingHTTPServer"] = None
+_server_lock = threading.Lock()
+
+
+def serve() -> Optional["ThreadingHTTPServer"]:
+    """
+    Start the exporter configured by SNL_METRICS and SNL_METRICS_PORT, once per process.
+
+    Called by the app and server entry points; safe to call on every app rerun.
+
+    Returns:
+        Optional[ThreadingHTTPServer]: The running server, or None when no port is configured.
+    """
+    global _server
+    if not ENABLED or not os.environ.get("SNL_METRICS_PORT"):
+        return None
+    with _server_lock:
+        if _server is None:
+            _server = start_http_server(int(os.environ["SNL_METRICS_PORT"]))
+    return _server
+
+
+class SamplingProfiler:
+    """
+    Low-overhead profiler that periodically samples the stacks of all threads.
+
+    Samples are aggregated as collapsed stacks ("outer;inner;leaf count"), the
+    input format of common flame graph tools.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Create a stopped profiler.
+
+        Args:
+            interval (float): Seconds between samples. Defaults to 5 ms.
+        """
+        self.interval = interval
+        self.samples = Counter()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """
+        Start sampling in a background thread.
+        """
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop sampling.
+        """
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+    def dump(self, path: str) -> None:
+        """
+        Write the samples as collapsed stacks.
+
+        Args:
+            path (str): Output file.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+PROFILER: Optional[SamplingProfiler] = None
+
+if ENABLED and os.environ.get("SNL_METRICS_DUMP"):
+    atexit.register(REGISTRY.dump, os.environ["SNL_METRICS_DUMP"])
+if os.environ.get("SNL_PROFILE", "") not in ("", "0"):
+    PROFILER = SamplingProfiler()
+    PROFILER.start()
+    atexit.register(lambda: (PROFILER.stop(), PROFILER.dump(os.environ.get("SNL_PROFILE_DUMP", "profile.txt"))))
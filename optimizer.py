@@ -0,0 +1,338 @@
+"""
+Search snake and ladder layouts for boards that hit target game-length and fairness metrics.
+
+Usage:
+    python optimizer.py --median-turns 40 --max-advantage 0.02 --players 2 --output board.json
+"""
+import argparse
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from board import Board
+from markov import BoardAnalysis
+
+# Annealing temperatures at the first and last iteration, in units of score
+START_TEMPERATURE = 0.05
+END_TEMPERATURE = 1e-4
+# Largest distance a jump end moves in one step
+MAX_SHIFT = 12
+# Layouts whose games can outlast this many times the board size or turn targets, in rolls, rank last
+MAX_ROLLS_FACTOR = 20
+
+
+class LayoutAnalysis(BoardAnalysis):
+    """
+    Board analysis that can be edited in place while searching layouts.
+
+    Moving one jump rewrites only the transition targets of the (at most six) squares
+    that can roll onto its old and new start, instead of rebuilding the chain. Only
+    the finish-time distribution is recomputed, to a looser tolerance that is still
+    far below the differences that rank candidates, and for at most ``max_rolls``
+    rolls; slower layouts are flagged ``too_long`` rather than analysed.
+    """
+
+    TAIL_TOLERANCE = 1e-9
+
+    def __init__(self, board: Board, max_rolls: Optional[int] = None):
+        """
+        Analyse a starting layout.
+
+        Args:
+            board (Board): Layout to start from.
+            max_rolls (int): Most rolls of the finish-time distribution. Defaults to the
+                ``BoardAnalysis`` limit.
+        """
+        self.max_rolls = max_rolls
+        self.too_long = False
+        super().__init__(board.snakes, board.ladders, board.size)
+        self.jumps = {**board.snakes, **board.ladders}
+
+    def _compute_finish_pmf(self, max_rolls: Optional[int] = None) -> np.ndarray:
+        try:
+            finish_pmf = super()._compute_finish_pmf(max_rolls or self.max_rolls)
+        except ValueError:
+            # Never scored: a certain finish on the first roll keeps the other metrics defined
+            self.too_long = True
+            return np.array([0.0, 1.0])
+        self.too_long = False
+        return finish_pmf
+
+    def _set_landing(self, square: int, end: int) -> None:
+        for row in range(max(0, square - 6), square):
+            self.targets[row, square - row - 1] = end
+
+    def move_jump(self, start: int, new_start: int, new_end: int) -> Tuple:
+        """
+        Replace one jump and rescore the chain.
+
+        Args:
+            start (int): Start square of the jump to move.
+            new_start (int): Its new start square.
+            new_end (int): Its new end square.
+
+        Returns:
+            Tuple: Token for ``undo``.
+        """
+        token = (new_start, start, self.jumps.pop(start), self._finish_pmf, self.too_long)
+        self._set_landing(start, start)
+        self.jumps[new_start] = new_end
+        self._set_landing(new_start, new_end)
+        self._finish_pmf = self._compute_finish_pmf()
+        self._win_probabilities = {}
+        self._landings = {}
+        return token
+
+    def undo(self, token: Tuple) -> None:
+        """
+        Revert a ``move_jump`` without rescoring.
+
+        Args:
+            token (Tuple): Value returned by ``move_jump``.
+        """
+        start, old_start, old_end, finish_pmf, too_long = token
+        del self.jumps[start]
+        self._set_landing(start, start)
+        self.jumps[old_start] = old_end
+        self._set_landing(old_start, old_end)
+        self._finish_pmf = finish_pmf
+        self.too_long = too_long
+        self._win_probabilities = {}
+        self._landings = {}
+
+    def to_dict(self) -> Dict:
+        """
+        Get the current layout as a board definition.
+
+        Returns:
+            Dict: ``size``, ``snakes`` and ``ladders``, as accepted by ``Board.from_dict``.
+        """
+        return {
+            "size": self.board_size,
+            "snakes": {start: end for start, end in sorted(self.jumps.items()) if end < start},
+            "ladders": {start: end for start, end in sorted(self.jumps.items()) if end > start}
+        }
+
+
+class Target:
+    """
+    Metrics a board should reach, and how far a layout is from them.
+    """
+
+    def __init__(self, num_players: int = 2, median_turns: Optional[float] = None,
+                 expected_turns: Optional[float] = None, max_first_seat_advantage: Optional[float] = None):
+        """
+        Define the targets; metrics left as None are not scored.
+
+        Args:
+            num_players (int): Players per game (2-4). Defaults to 2.
+            median_turns (float): Median number of rolls, across all players, in a game.
+            expected_turns (float): Mean number of rolls, across all players, in a game.
+            max_first_seat_advantage (float): Largest allowed excess of the first seat's
+                win probability over a fair 1 / num_players.
+
+        Raises:
+            ValueError: If num_players is not between 2 and 4 or no target is set.
+        """
+        if num_players < 2 or num_players > 4:
+            raise ValueError("Number of players must be between 2 and 4")
+        if median_turns is None and expected_turns is None and max_first_seat_advantage is None:
+            raise ValueError("At least one target must be set")
+        self.num_players = num_players
+        self.median_turns = median_turns
+        self.expected_turns = expected_turns
+        self.max_first_seat_advantage = max_first_seat_advantage
+
+    def metrics(self, analysis: BoardAnalysis) -> Dict:
+        """
+        Compute every targeted metric of a layout.
+
+        Args:
+            analysis (BoardAnalysis): Analysis of the layout.
+
+        Returns:
+            Dict: ``median_turns``, ``expected_turns`` and ``first_seat_advantage``.
+        """
+        return {
+            "median_turns": analysis.game_length_quantile(self.num_players),
+            "expected_turns": analysis.expected_game_length(self.num_players),
+            "first_seat_advantage": analysis.win_probabilities(self.num_players)[1] - 1 / self.num_players
+        }
+
+    def score(self, analysis: BoardAnalysis) -> float:
+        """
+        Score a layout: 0 when every target is met, growing with the squared relative misses.
+
+        Layouts too slow to analyse (see ``LayoutAnalysis``) score infinity.
+
+        Args:
+            analysis (BoardAnalysis): Analysis of the layout.
+
+        Returns:
+            float: Score to minimize.
+        """
+        if getattr(analysis, "too_long", False):
+            return math.inf
+        score = 0.0
+        if self.median_turns is not None:
+            score += ((analysis.game_length_quantile(self.num_players) - self.median_turns) / self.median_turns) ** 2
+        if self.expected_turns is not None:
+            score += ((analysis.expected_game_length(self.num_players) - self.expected_turns)
+                      / self.expected_turns) ** 2
+        if self.max_first_seat_advantage is not None:
+            advantage = analysis.win_probabilities(self.num_players)[1] - 1 / self.num_players
+            excess = max(0.0, advantage - self.max_first_seat_advantage)
+            score += (excess / max(self.max_first_seat_advantage, 0.01)) ** 2
+        return score
+
+
+def propose_move(jumps: Dict[int, int], size: int, rng: random.Random) -> Optional[Tuple[int, int, int]]:
+    """
+    Propose moving one jump: shifting it whole, or shifting one of its ends.
+
+    Starts and ends never share a square, so proposals never create chains.
+
+    Args:
+        jumps (Dict[int, int]): Current jumps, start to end.
+        size (int): Board size.
+        rng (random.Random): Random source.
+
+    Returns:
+        Optional[Tuple[int, int, int]]: (start, new start, new end), or None if the
+        proposal is invalid.
+    """
+    start = rng.choice(list(jumps))
+    end = jumps[start]
+    shift = rng.randint(-MAX_SHIFT, MAX_SHIFT)
+    kind = rng.randrange(3)
+    new_start = start + shift if kind != 2 else start
+    new_end = end + shift if kind != 1 else end
+    if end < start:
+        valid = 1 <= new_end < new_start < size
+    else:
+        valid = 1 <= new_start < new_end < size
+    if not valid or (new_start, new_end) == (start, end):
+        return None
+    used = set(jumps) | set(jumps.values())
+    used.difference_update((start, end))
+    if new_start in used or new_end in used:
+        return None
+    return start, new_start, new_end
+
+
+def anneal(board: Board, target: Target, iterations: int, seed: int) -> Tuple[float, Dict]:
+    """
+    Run one simulated-annealing chain from a starting layout.
+
+    Args:
+        board (Board): Starting layout.
+        target (Target): Metrics to reach.
+        iterations (int): Proposals to evaluate.
+        seed (int): Seed of the chain.
+
+    Returns:
+        Tuple[float, Dict]: Best score found and its board definition.
+    """
+    rng = random.Random(seed)
+    turns = max(board.size, target.median_turns or 0, target.expected_turns or 0)
+    analysis = LayoutAnalysis(board, max_rolls=int(MAX_ROLLS_FACTOR * turns))
+    score = target.score(analysis)
+    best = (score, analysis.to_dict())
+
+    for iteration in range(iterations):
+        if best[0] == 0.0:
+            break
+        move = propose_move(analysis.jumps, analysis.board_size, rng)
+        if move is None:
+            continue
+        token = analysis.move_jump(*move)
+        new_score = target.score(analysis)
+        temperature = START_TEMPERATURE * (END_TEMPERATURE / START_TEMPERATURE) ** (iteration / iterations)
+        if new_score <= score or rng.random() < math.exp((score - new_score) / temperature):
+            score = new_score
+            if score < best[0]:
+                best = (score, analysis.to_dict())
+        else:
+            analysis.undo(token)
+    return best
+
+
+def optimize(target: Target, size: int = 100, num_snakes: int = 10, num_ladders: int = 8,
+             board: Optional[Board] = None, iterations: int = 2000, chains: int = 8,
+             workers: Optional[int] = None, seed: int = 0) -> Tuple[Board, float]:
+    """
+    Search for a layout that meets the target with independent annealing chains in parallel.
+
+    Chain seeds depend only on ``seed`` and the chain index, so the result does not
+    depend on the number of workers. Moves never create chains, but a starting layout
+    with chains, such as the classic board, keeps them.
+
+    Args:
+        target (Target): Metrics to reach.
+        size (int): Board size for generated starting layouts. Defaults to 100.
+        num_snakes (int): Snakes in generated starting layouts. Defaults to 10.
+        num_ladders (int): Ladders in generated starting layouts. Defaults to 8.
+        board (Board): Starting layout for every chain instead of a random one per chain.
+        iterations (int): Proposals per chain. Defaults to 2000.
+        chains (int): Independent chains. Defaults to 8.
+        workers (int): Worker processes; 0 runs in this process. Defaults to the CPU count.
+        seed (int): Seed of the whole search. Defaults to 0.
+
+    Returns:
+        Tuple[Board, float]: Best board found and its score (0 when every target is met).
+    """
+    seeds = [int(s.generate_state(1, np.uint64)[0]) for s in np.random.SeedSequence(seed).spawn(chains)]
+    starts = [board or Board.generate(size, num_snakes, num_ladders, seed=chain_seed) for chain_seed in seeds]
+
+    if workers == 0:
+        results = [anneal(start, target, iterations, chain_seed) for start, chain_seed in zip(starts, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+            results = list(executor.map(anneal, starts, [target] * chains, [iterations] * chains, seeds))
+
+    score, definition = min(results, key=lambda result: result[0])
+    # Moves never create chains, so only the chains of a starting layout can remain
+    jumps = {**board.snakes, **board.ladders} if board is not None else {}
+    chained = bool(jumps.keys() & set(jumps.values()))
+    best = Board.create(definition["size"], definition["snakes"], definition["ladders"], strict=not chained)
+    return best, score
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--players", type=int, default=2, help="Players per game")
+    parser.add_argument("--median-turns", type=float, help="Target median rolls per game, across all players")
+    parser.add_argument("--expected-turns", type=float, help="Target mean rolls per game, across all players")
+    parser.add_argument("--max-advantage", type=float, help="Largest first-seat win probability above fair")
+    parser.add_argument("--size", type=int, default=100, help="Board size of generated starting layouts")
+    parser.add_argument("--snakes", type=int, default=10, help="Snakes in generated starting layouts")
+    parser.add_argument("--ladders", type=int, default=8, help="Ladders in generated starting layouts")
+    parser.add_argument("--board", help="Start every chain from this board file (.json or .toml)")
+    parser.add_argument("--iterations", type=int, default=2000, help="Proposals per chain")
+    parser.add_argument("--chains", type=int, default=8, help="Independent annealing chains")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 = in-process)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the search")
+    parser.add_argument("--output", help="Write the best board here as JSON instead of printing it")
+    args = parser.parse_args()
+
+    target = Target(args.players, args.median_turns, args.expected_turns, args.max_advantage)
+    start = Board.load(args.board) if args.board else None
+    board, score = optimize(target, args.size, args.snakes, args.ladders, start, args.iterations,
+                            args.chains, args.workers, args.seed)
+
+    metrics = target.metrics(BoardAnalysis(board.snakes, board.ladders, board.size))
+    print(json.dumps({"score": score, **metrics}, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(board.to_json())
+    else:
+        print(board.to_json())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import streamlit as st
+
+from stats import LEADERBOARD_ORDERS, StatsStore, open_stats_store
+
+st.set_page_config(
+    page_title="🏆 Leaderboard",
+    page_icon="🏆",
+    layout="wide"
+)
+
+
+@st.cache_resource
+def get_stats_store() -> StatsStore:
+    """
+    Get the process-wide leaderboard database, configured by the SNL_STATS_DB environment variable.
+
+    Returns:
+        StatsStore: SQLite statistics store, "stats.db" by default.
+    """
+    return open_stats_store()
+
+
+def table_cell(text: str) -> str:
+    """
+    Escape text for a cell of a Markdown table, so names containing "|" keep the columns intact.
+
+    Args:
+        text (str): Cell text, e.g. a player name.
+
+    Returns:
+        str: Text with backslashes and pipes escaped.
+    """
+    return text.replace("\\", "\\\\").replace("|", "\\|")
+
+
+stats = get_stats_store()
+
+st.markdown("<h1 style='text-align: center; color: #2ecc71;'>🏆 LEADERBOARD</h1>", unsafe_allow_html=True)
+st.markdown("<p style='text-align: center; color: #27ae60; font-size: 16px;'>"
+            "Every finished game, added up per player name</p>", unsafe_allow_html=True)
+
+col1, col2 = st.columns([1, 3])
+with col1:
+    order = st.radio("Rank by:", options=list(LEADERBOARD_ORDERS), format_func=str.capitalize, key="order")
+    limit = st.slider("Players shown:", min_value=5, max_value=100, value=10, step=5, key="limit")
+
+with col2:
+    # Read from the pre-aggregated counters through an index, whatever the number of games
+    top = stats.top_players(limit, order)
+    if top:
+        rows = ["| # | Player | Games | Wins | Win rate | Avg. turns | 🐍 Snakes | 🪜 Ladders |",
+                "|---:|---|---:|---:|---:|---:|---:|---:|"]
+        for rank, player in enumerate(top, 1):
+            rows.append(f"| {rank} | {table_cell(player['name'])} | {player['games']} | {player['wins']} | "
+                        f"{player['win_rate']:.0%} | {player['average_turns']:.1f} | {player['snakes']} | "
+                        f"{player['ladders']} |")
+        st.markdown("\n".join(rows))
+    else:
+        st.info("No finished games yet. Play a game to the end to appear here!")
+
+st.markdown("---")
+st.markdown("<h3 style='color: #2ecc71;'>👤 PLAYER STATS</h3>", unsafe_allow_html=True)
+name = st.text_input("Player name:", key="player_name", placeholder="Enter a player name")
+if name:
+    player = stats.player(name)
+    if player:
+        cols = st.columns(5)
+        cols[0].metric("🎮 Games", player["games"])
+        cols[1].metric("🏆 Wins", player["wins"], f"{player['win_rate']:.0%}", delta_color="off")
+        cols[2].metric("🎲 Avg. turns", f"{player['average_turns']:.1f}")
+        cols[3].metric("🐍 Snakes per game", f"{player['snakes'] / player['games']:.1f}")
+        cols[4].metric("🪜 Ladders per game", f"{player['ladders'] / player['games']:.1f}")
+        st.caption(f"Last played {datetime.fromtimestamp(player['last_played']):%Y-%m-%d %H:%M}")
+    else:
+        st.warning(f"No finished games for {name}.")
+
+st.markdown("---")
+st.markdown("<h3 style='color: #2ecc71;'>🕑 RECENT GAMES</h3>", unsafe_allow_html=True)
+recent = stats.recent_games(10)
+if recent:
+    rows = ["| Finished | Players | Moves | Winner |", "|---|---:|---:|---|"]
+    for game in recent:
+        rows.append(f"| {datetime.fromtimestamp(game['finished']):%Y-%m-%d %H:%M} | {game['players']} | "
+                    f"{game['moves']} | {table_cell(game['winner'] or '-')} |")
+    st.markdown("\n".join(rows))
@@ -0,0 +1,171 @@
+import threading
+import weakref
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import metrics
+from board import DEFAULT_BOARD, Board
+from game import HISTORY_FULL, SnakeAndLadder
+from rules import CLASSIC_RULES, Rules
+
+
+class PoolLease:
+    """
+    Token tying a pooled game to its owner, e.g. a Streamlit session.
+
+    Keep it wherever the owner keeps its state; when the token is garbage collected,
+    for instance because the session expired, its game goes back to the pool.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+class GamePool:
+    """
+    Process-wide pool of reset games, reused instead of building a new game per session.
+
+    Idle games are grouped by what cannot change without rebuilding them: player
+    count, board (shared, never copied), history level and history limit. Reusing one
+    resets it in place with ``reset_game``, keeping its position array, move-log buffer
+    and dice buffer, and gives it new names, icons, rules and a fresh dice seed.
+    """
+
+    def __init__(self, max_idle: int = 256):
+        """
+        Create an empty pool.
+
+        Args:
+            max_idle (int): Most idle games kept; games released beyond it are left to
+                the garbage collector. Defaults to 256.
+        """
+        self.max_idle = max_idle
+        self._idle: Dict[Tuple, List[SnakeAndLadder]] = {}
+        self._idle_ids = set()
+        self._live = weakref.WeakSet()
+        # Lease finalizers by game ID, detached when the game is returned another way
+        self._finalizers: Dict[int, weakref.finalize] = {}
+        # Games of collected leases. Finalizers may run inside any allocation, even
+        # while this pool holds its lock, so they only append here.
+        self._expired = deque()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reclaimed = 0
+        self.discarded = 0
+
+    @staticmethod
+    def _key(game: SnakeAndLadder) -> Tuple:
+        return game.num_players, game.board, game.history_level, game.history_limit
+
+    def acquire(self, num_players: int = 2, player_names: Optional[Dict[int, str]] = None,
+                player_icons: Optional[Dict[int, str]] = None, history_level: str = HISTORY_FULL,
+                seed: Optional[int] = None, board: Board = DEFAULT_BOARD, history_limit: Optional[int] = None,
+                rules: Rules = CLASSIC_RULES, lease: Optional[PoolLease] = None) -> SnakeAndLadder:
+        """
+        Get a game in its initial state, reusing an idle one when possible.
+
+        Takes the arguments of the ``SnakeAndLadder`` constructor, except custom dice.
+
+        Args:
+            num_players (int): Number of players. Defaults to 2.
+            player_names (Dict[int, str]): Player ID to name. Defaults to "Player <ID>".
+            player_icons (Dict[int, str]): Player ID to icon. Defaults to 🔵.
+            history_level (str): "full", "packed" or "off". Defaults to "full".
+            seed (int): Dice seed. Defaults to a freshly drawn one.
+            board (Board): Board layout. Defaults to the classic board.
+            history_limit (int): Most packed moves kept in memory. Defaults to None.
+            rules (Rules): Rule variant. Defaults to the classic rules.
+            lease (PoolLease): Token whose collection releases the game. Defaults to None,
+                the game is only returned by ``release``.
+
+        Returns:
+            SnakeAndLadder: A game nobody else holds.
+        """
+        with self._lock:
+            self._reclaim_expired()
+            idle = self._idle.get((num_players, board, history_level, history_limit))
+            game = idle.pop() if idle else None
+            if game is not None:
+                self._idle_ids.discard(id(game))
+                self.hits += 1
+            else:
+                self.misses += 1
+        metrics.increment("game_pool_hits" if game is not None else "game_pool_misses")
+
+        if game is None:
+            game = SnakeAndLadder(num_players, player_names, player_icons, history_level, seed=seed, board=board,
+                                  history_limit=history_limit, rules=rules)
+        else:
+            # Idle games were reset on release; only the rules may still differ
+            if game.rules != rules:
+                game.reset_game(rules)
+            game.dice.reseed(seed)
+            game.player_names = player_names or {i: f"Player {i}" for i in range(1, num_players + 1)}
+            game.player_icons = player_icons or {i: "🔵" for i in range(1, num_players + 1)}
+
+        with self._lock:
+            self._live.add(game)
+            if lease is not None:
+                self._finalizers[id(game)] = weakref.finalize(lease, self._expired.append, game)
+        return game
+
+    def release(self, game: SnakeAndLadder) -> None:
+        """
+        Return a game to the pool, e.g. on NEW GAME. The caller must not use it afterwards.
+
+        Games not acquired from this pool are accepted too. Releasing an idle game has no effect.
+
+        Args:
+            game (SnakeAndLadder): Game to reuse.
+        """
+        with self._lock:
+            self._reclaim_expired()
+            self._store(game)
+
+    def _reclaim_expired(self) -> None:
+        """
+        Return the games of collected leases. Called with the lock held.
+        """
+        while self._expired:
+            if self._store(self._expired.popleft()):
+                self.reclaimed += 1
+
+    def _store(self, game: SnakeAndLadder) -> bool:
+        """
+        Reset a game and keep it idle, unless the pool is full. Called with the lock held.
+
+        Args:
+            game (SnakeAndLadder): Game to reuse.
+
+        Returns:
+            bool: False if the game was already idle.
+        """
+        if id(game) in self._idle_ids:
+            return False
+        finalizer = self._finalizers.pop(id(game), None)
+        if finalizer is not None:
+            finalizer.detach()
+        self._live.discard(game)
+        if len(self._idle_ids) >= self.max_idle:
+            self.discarded += 1
+            return True
+        # Reset now so an idle game holds no history
+        game.reset_game()
+        self._idle.setdefault(self._key(game), []).append(game)
+        self._idle_ids.add(id(game))
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the pool counters.
+
+        Returns:
+            Dict[str, int]: ``hits`` and ``misses`` of ``acquire``, ``live`` games handed
+            out and still in use, ``idle`` games ready for reuse, ``reclaimed`` games
+            returned by collected leases and ``discarded`` games left to the garbage
+            collector because the pool was full.
+        """
+        with self._lock:
+            self._reclaim_expired()
+            return {"hits": self.hits, "misses": self.misses, "live": len(self._live),
+                    "idle": len(self._idle_ids), "reclaimed": self.reclaimed, "discarded": self.discarded}
@@ -0,0 +1,214 @@
+import json
+import struct
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from board import DEFAULT_BOARD, Board
+from game import SnakeAndLadder
+from history import EVENT_EXTRA_ROLL, EVENT_WON, MoveLog
+
+# Replay file: magic, version, players, checkpoint interval, moves, board definition length
+REPLAY_MAGIC = b"SNR"
+REPLAY_VERSION = 2
+_REPLAY_HEADER = struct.Struct("<3sBHHII")
+# Header of version 1, which held at most 4 players
+_LEGACY_REPLAY_HEADER = struct.Struct("<3sBBHII")
+
+
+class Replay:
+    """
+    Globally ordered move stream of one game with periodic position checkpoints.
+
+    Positions are checkpointed every ``interval`` moves, so the state at any turn is
+    rebuilt from the nearest earlier checkpoint by applying at most ``interval - 1``
+    packed records, whatever the length of the game.
+    """
+
+    def __init__(self, num_players: int, board: Board = DEFAULT_BOARD, interval: int = 64,
+                 records: Iterable[Tuple[int, int, int, int, int]] = ()):
+        """
+        Create a replay, optionally from existing move records.
+
+        Args:
+            num_players (int): Players in the game.
+            board (Board): Board the game was played on. Defaults to the classic board.
+            interval (int): Moves between checkpoints. Defaults to 64.
+            records (Iterable[Tuple[int, int, int, int, int]]): Moves in play order.
+
+        Raises:
+            ValueError: If interval is not positive.
+        """
+        if interval < 1:
+            raise ValueError("Checkpoint interval must be positive")
+        self.num_players = num_players
+        self.board = board
+        self.interval = interval
+        self._log = MoveLog(wide=board.size > 255, wide_players=num_players > 255)
+        # Positions after every interval-th move, one row of num_players squares per checkpoint
+        self._positions = array("B" if board.size <= 255 else "H", [0]) * num_players
+        self._checkpoints = array(self._positions.typecode, self._positions)
+        for record in records:
+            self.append(record)
+
+    @classmethod
+    def from_game(cls, game: SnakeAndLadder, interval: int = 64) -> "Replay":
+        """
+        Build the replay of a game played with history level "full" or "packed".
+
+        Args:
+            game (SnakeAndLadder): Game to replay, from its start or last reset.
+            interval (int): Moves between checkpoints. Defaults to 64.
+
+        Returns:
+            Replay: Replay of every move so far.
+        """
+        return cls(game.num_players, game.board, interval, game.move_records())
+
+    def __len__(self) -> int:
+        return len(self._log)
+
+    def append(self, record: Tuple[int, int, int, int, int]) -> None:
+        """
+        Add the next move, checkpointing positions when an interval is complete.
+
+        Args:
+            record (Tuple[int, int, int, int, int]): (player, dice, old position, final position, event).
+        """
+        self._log.append(*record)
+        self._positions[record[0] - 1] = record[3]
+        if len(self._log) % self.interval == 0:
+            self._checkpoints.extend(self._positions)
+
+    def state_at(self, turn: int) -> Dict:
+        """
+        Get the game state after a number of moves.
+
+        Args:
+            turn (int): Moves played, from 0 (start) to ``len(self)``.
+
+        Returns:
+            Dict: ``players_position``, ``current_player``, ``game_over`` and ``winner``
+            in the shape returned by ``SnakeAndLadder.get_game_status``.
+
+        Raises:
+            IndexError: If turn is out of range.
+        """
+        if not 0 <= turn <= len(self):
+            raise IndexError(f"Turn must be between 0 and {len(self)}")
+        checkpoint = turn // self.interval
+        row = checkpoint * self.num_players
+        positions = self._checkpoints[row:row + self.num_players].tolist()
+        last = None
+        for last in self._log.records(checkpoint * self.interval, turn):
+            positions[last[0] - 1] = last[3]
+        if last is None and turn:
+            last = next(self._log.records(turn - 1, turn))
+
+        winner = last[0] if last and last[4] & EVENT_WON else None
+        if turn < len(self):
+            # The next record says whose turn it is, whatever the turn rules
+            current_player = next(self._log.records(turn, turn + 1))[0]
+        else:
+            rolls_again = last and last[4] & (EVENT_WON | EVENT_EXTRA_ROLL)
+            current_player = last[0] if rolls_again else (last[0] % self.num_players + 1 if last else 1)
+        return {
+            "players_position": {player_id: position for player_id, position in enumerate(positions, 1)},
+            "current_player": current_player,
+            "game_over": winner is not None,
+            "winner": winner
+        }
+
+    def stream(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[Tuple[int, ...], List[int]]]:
+        """
+        Replay moves one at a time, seeking to ``start`` first.
+
+        Args:
+            start (int): Moves to skip before streaming. Defaults to 0.
+            stop (int): Moves played when streaming ends. Defaults to the end of the game.
+
+        Returns:
+            Iterator[Tuple[Tuple[int, ...], List[int]]]: Each move record with the positions of
+            every player, in seat order, after it. The positions list is updated in place.
+        """
+        state = self.state_at(start)
+        positions = list(state["players_position"].values())
+        for record in self._log.records(start, stop):
+            positions[record[0] - 1] = record[3]
+            yield record, positions
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the replay, including its checkpoints, so loading it needs no replaying.
+
+        Returns:
+            bytes: Serialized replay, readable by ``from_bytes``.
+        """
+        board = json.dumps(self.board.to_dict(), separators=(",", ":")).encode("utf-8")
+        return b"".join([
+            _REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.num_players, self.interval, len(self), len(board)),
+            board,
+            self._checkpoints.tobytes(),
+            self._log.to_bytes()
+        ])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """
+        Restore a replay serialized by ``to_bytes``.
+
+        Args:
+            data (bytes): Serialized replay.
+
+        Returns:
+            Replay: The replay.
+
+        Raises:
+            ValueError: If the data is not a serialized replay or uses an unsupported version.
+        """
+        header = _LEGACY_REPLAY_HEADER if data[3:4] == b"\x01" else _REPLAY_HEADER
+        try:
+            magic, version, num_players, interval, count, board_length = header.unpack_from(data)
+        except struct.error as e:
+            raise ValueError("Data is too short to be a replay") from e
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Data is not a Snake and Ladder replay")
+        if not 1 <= version <= REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {version}")
+
+        offset = header.size
+        board = Board.from_dict(json.loads(data[offset:offset + board_length]))
+        offset += board_length
+        replay = cls(num_players, board, interval)
+        checkpoints = array(replay._checkpoints.typecode)
+        size = (count // interval + 1) * num_players * checkpoints.itemsize
+        checkpoints.frombytes(data[offset:offset + size])
+        replay._checkpoints = checkpoints
+        replay._log = MoveLog.from_bytes(data[offset + size:], wide=board.size > 255, wide_players=num_players > 255)
+        if len(replay._log) != count:
+            raise ValueError("Replay moves are truncated")
+        replay._positions = array(checkpoints.typecode, replay.state_at(count)["players_position"].values())
+        return replay
+
+    def save(self, path: str) -> None:
+        """
+        Write the replay to a file.
+
+        Args:
+            path (str): Output file.
+        """
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        """
+        Read a replay written by ``save``.
+
+        Args:
+            path (str): Replay file.
+
+        Returns:
+            Replay: The replay.
+        """
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
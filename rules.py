@@ -0,0 +1,244 @@
+from functools import lru_cache
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+from board import Board
+from history import (EVENT_BOUNCE, EVENT_EXTRA_ROLL, EVENT_FORFEIT, EVENT_LADDER, EVENT_NONE,
+                     EVENT_OUT_OF_BOUNDS, EVENT_SNAKE, EVENT_WON)
+
+# What happens to a roll that goes past the last square
+OVERSHOOT_SKIP = "skip"      # exact finish: the player does not move
+OVERSHOOT_BOUNCE = "bounce"  # the excess is counted back down from the last square
+OVERSHOOT_FINISH = "finish"  # reaching or passing the last square wins
+OVERSHOOT_RULES = (OVERSHOOT_SKIP, OVERSHOOT_BOUNCE, OVERSHOOT_FINISH)
+# Longest run of sixes that can forfeit; compiled tables hold one block of outcomes per six in a run
+MAX_SIXES_FORFEIT = 6
+
+
+class Rules:
+    """
+    Immutable rule variant, declared as configuration.
+
+    A game compiles its rules once, with its board, into a ``CompiledRules`` table,
+    so variants cost nothing per move.
+    """
+
+    __slots__ = ("overshoot", "extra_roll_on_six", "sixes_forfeit")
+
+    def __init__(self, overshoot: str = OVERSHOOT_SKIP, extra_roll_on_six: bool = False, sixes_forfeit: int = 0):
+        """
+        Declare a rule variant; the defaults are the classic rules.
+
+        Args:
+            overshoot (str): "skip", "bounce" or "finish", see ``OVERSHOOT_RULES``. Defaults to "skip".
+            extra_roll_on_six (bool): A six gives the same player another roll. Defaults to False.
+            sixes_forfeit (int): This many sixes in a row forfeit the last roll, which is not
+                moved, and pass the turn; 0 disables it, otherwise 2 to ``MAX_SIXES_FORFEIT``.
+                Needs ``extra_roll_on_six``. Defaults to 0.
+
+        Raises:
+            ValueError: If overshoot is unknown or sixes_forfeit is out of range or set without extra rolls.
+        """
+        if overshoot not in OVERSHOOT_RULES:
+            raise ValueError(f"Overshoot rule must be one of {', '.join(OVERSHOOT_RULES)}")
+        if sixes_forfeit < 0 or sixes_forfeit == 1 or sixes_forfeit > MAX_SIXES_FORFEIT:
+            raise ValueError(f"Sixes forfeit must be 0 (off) or between 2 and {MAX_SIXES_FORFEIT}")
+        if sixes_forfeit and not extra_roll_on_six:
+            raise ValueError("Forfeiting on sixes needs extra rolls on six")
+        self.overshoot = overshoot
+        self.extra_roll_on_six = bool(extra_roll_on_six)
+        self.sixes_forfeit = sixes_forfeit
+
+    def _key(self) -> Tuple[str, bool, int]:
+        return self.overshoot, self.extra_roll_on_six, self.sixes_forfeit
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Rules) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (f"Rules(overshoot={self.overshoot!r}, extra_roll_on_six={self.extra_roll_on_six}, "
+                f"sixes_forfeit={self.sixes_forfeit})")
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Rules":
+        """
+        Build rules from a configuration mapping, e.g. parsed JSON or TOML.
+
+        Args:
+            data (Mapping): Any of ``overshoot``, ``extra_roll_on_six`` and ``sixes_forfeit``.
+
+        Returns:
+            Rules: The rules.
+
+        Raises:
+            ValueError: If a key is unknown or a value is invalid.
+        """
+        unknown = set(data) - set(cls.__slots__)
+        if unknown:
+            raise ValueError(f"Unknown rule settings: {', '.join(sorted(unknown))}")
+        return cls(**data)
+
+    def to_dict(self) -> Dict:
+        """
+        Get the rules as a configuration mapping.
+
+        Returns:
+            Dict: ``overshoot``, ``extra_roll_on_six`` and ``sixes_forfeit``, as accepted by ``from_dict``.
+        """
+        return {"overshoot": self.overshoot, "extra_roll_on_six": self.extra_roll_on_six,
+                "sixes_forfeit": self.sixes_forfeit}
+
+    def compile(self, board: Board) -> "CompiledRules":
+        """
+        Get the move table of these rules on a board, built once per board and rules.
+
+        Args:
+            board (Board): Board to play on.
+
+        Returns:
+            CompiledRules: Shared move table.
+        """
+        return _compile(board, self)
+
+
+CLASSIC_RULES = Rules()
+
+# Named variants offered by the app and the command-line tools
+RULE_PRESETS = {
+    "classic": CLASSIC_RULES,
+    "bounce": Rules(overshoot=OVERSHOOT_BOUNCE),
+    "quick finish": Rules(overshoot=OVERSHOOT_FINISH),
+    "sixes": Rules(extra_roll_on_six=True, sixes_forfeit=3),
+    "bounce and sixes": Rules(overshoot=OVERSHOOT_BOUNCE, extra_roll_on_six=True, sixes_forfeit=3),
+}
+
+
+class CompiledRules:
+    """
+    Precomputed outcome of every (sixes rolled so far, position, dice value) for one board and rule set.
+
+    Entry ``outcomes[streak * stride + position * 7 + dice]`` is (square landed on,
+    final square, event flags, sixes rolled so far after the move, snake or ladder
+    label), so playing a move under any variant is a single tuple index.
+
+    Compiling also checks that the board cannot trap players under these rules: with
+    exact finishes, for instance, snakes covering every square within a roll of the end
+    would keep a game going forever, while bouncing back might still get players home.
+    """
+
+    __slots__ = ("board", "rules", "stride", "outcomes", "_array")
+
+    def __init__(self, board: Board, rules: Rules):
+        """
+        Build the table. Prefer ``Rules.compile``, which reuses tables.
+
+        Args:
+            board (Board): Board to play on.
+            rules (Rules): Rules to play by.
+
+        Raises:
+            ValueError: If players can reach a square from which they can never finish.
+        """
+        size = board.size
+        # Sixes in a row only matter when they can forfeit a roll
+        streaks = rules.sixes_forfeit or 1
+        outcomes = []
+        for streak in range(streaks):
+            for position in range(size + 1):
+                # Column 0 is never played; it keeps the index arithmetic to one multiply
+                outcomes.append((position, position, EVENT_NONE, 0, None))
+                for dice in range(1, 7):
+                    outcomes.append(self._outcome(board, rules, streak, position, dice))
+
+        self._check_finishable(size, outcomes)
+        self.board = board
+        self.rules = rules
+        self.stride = (size + 1) * 7
+        self.outcomes = tuple(outcomes)
+        self._array = None
+
+    @staticmethod
+    def _check_finishable(size: int, outcomes: list) -> None:
+        """
+        Check that every square a player can reach still leads to the last one.
+
+        Sixes in a row never change where a roll goes, only whether it is played, so the
+        moves without a streak cover every square that can be reached.
+        """
+        moves = [{outcomes[position * 7 + dice][1] for dice in range(1, 7)} for position in range(size)]
+        arrivals = [[] for _ in range(size + 1)]
+        for position, finals in enumerate(moves):
+            for final in finals:
+                arrivals[final].append(position)
+        finishing = {size}
+        pending = [size]
+        while pending:
+            for position in arrivals[pending.pop()]:
+                if position not in finishing:
+                    finishing.add(position)
+                    pending.append(position)
+        reached = {0}
+        pending = [0]
+        while pending:
+            position = pending.pop()
+            if position not in finishing:
+                raise ValueError(f"Square {position} can be reached but never leads to square {size} "
+                                 f"under these rules")
+            for final in moves[position] if position < size else ():
+                if final not in reached:
+                    reached.add(final)
+                    pending.append(final)
+
+    def array(self) -> np.ndarray:
+        """
+        Get the table as a NumPy array for vectorized simulation, built on first use.
+
+        Returns:
+            np.ndarray: One row per entry of ``outcomes``: landed square, final square,
+            event flags and sixes rolled so far, without the labels.
+        """
+        if self._array is None:
+            self._array = np.array([outcome[:4] for outcome in self.outcomes], dtype=np.int64)
+        return self._array
+
+    @staticmethod
+    def _outcome(board: Board, rules: Rules, streak: int, position: int,
+                 dice: int) -> Tuple[int, int, int, int, Optional[str]]:
+        size = board.size
+        if dice == 6 and rules.sixes_forfeit and streak == rules.sixes_forfeit - 1:
+            return position, position, EVENT_FORFEIT, 0, None
+
+        landed = position + dice
+        event = EVENT_NONE
+        if landed > size:
+            if rules.overshoot == OVERSHOOT_SKIP:
+                return landed, position, EVENT_OUT_OF_BOUNDS, 0, None
+            if rules.overshoot == OVERSHOOT_BOUNCE:
+                landed = max(2 * size - landed, 0)
+                event = EVENT_BOUNCE
+            else:
+                landed = size
+
+        final = board.jump[landed]
+        label = None
+        if final < landed:
+            event |= EVENT_SNAKE
+            label = f"Snake: {landed} → {final}"
+        elif final > landed:
+            event |= EVENT_LADDER
+            label = f"Ladder: {landed} → {final}"
+        if final == size:
+            event |= EVENT_WON
+        elif dice == 6 and rules.extra_roll_on_six:
+            event |= EVENT_EXTRA_ROLL
+            return landed, final, event, min(streak + 1, (rules.sixes_forfeit or 1) - 1), label
+        return landed, final, event, 0, label
+
+
+@lru_cache(maxsize=128)
+def _compile(board: Board, rules: Rules) -> CompiledRules:
+    return CompiledRules(board, rules)
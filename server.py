@@ -0,0 +1,362 @@
+"""
+Serve multiplayer Snake and Ladder games over WebSockets from a single asyncio event loop.
+
+Usage:
+    python server.py --host 0.0.0.0 --port 8765 [--board my_board.json] [--rules sixes]
+
+Clients exchange JSON text messages:
+
+    → {"type": "join", "room": "abc", "players": 2, "name": "Ann", "icon": "🐍"}
+    ← {"type": "joined", "room": "abc", "player": 1, "state": {...}}     to the joining client
+    ← {"type": "player_joined", "player": 1, "name": "Ann", "icon": "🐍"} to everyone else in the room
+    → {"type": "roll"}
+    ← {"type": "move", "player": 1, "dice": 4, "from": 0, "to": 14, "event": 2, "next": 2, "winner": null,
+       "version": 7}
+    → {"type": "sync", "version": 5}
+    ← {"type": "delta", "version": 7, "moves": [[2, 3, 10, 13, 0], [1, 4, 0, 14, 2]], "current_player": 2, ...}
+    ← {"type": "player_left", "player": 2}
+    ← {"type": "error", "message": "..."}
+
+The first join creates the room with the requested number of seats; rolling starts once
+every seat is taken. Dice are rolled on the server, and only the seat whose turn it is
+may roll. Moves are broadcast as diffs; ``event`` uses the ``EVENT_*`` flags of ``history``.
+A client that missed messages sends ``sync`` with the last version it applied and gets
+the moves since then (see ``SnakeAndLadder.events_since``); with ``"binary": true`` the
+delta arrives as a binary message packed by ``history.pack_delta``.
+"""
+import argparse
+import asyncio
+import json
+from typing import Dict, Iterable, Optional, Tuple
+
+import metrics
+from board import DEFAULT_BOARD, Board
+from game import HISTORY_PACKED, SnakeAndLadder
+from history import MoveLog, pack_delta
+from rules import CLASSIC_RULES, RULE_PRESETS, Rules
+
+try:
+    from websockets.asyncio.server import serve as websocket_serve
+    from websockets.exceptions import ConnectionClosed
+except ImportError:  # websockets < 13 or not installed
+    websocket_serve = None
+    ConnectionClosed = ()
+
+# Longest room ID and player name accepted from clients
+MAX_ROOM_ID = 64
+MAX_NAME = 32
+
+
+class Room:
+    """
+    One game and the connections seated at it.
+    """
+
+    __slots__ = ("room_id", "game", "seats")
+
+    def __init__(self, room_id: str, game: SnakeAndLadder):
+        self.room_id = room_id
+        self.game = game
+        # Player ID to connection; a seat is free again when its player disconnects
+        self.seats: Dict[int, object] = {}
+
+    @property
+    def full(self) -> bool:
+        return len(self.seats) == self.game.num_players
+
+    def free_seat(self) -> Optional[int]:
+        """
+        Get the lowest free seat.
+
+        Returns:
+            Optional[int]: Player ID, or None if the room is full.
+        """
+        for player_id in range(1, self.game.num_players + 1):
+            if player_id not in self.seats:
+                return player_id
+        return None
+
+    def state(self) -> Dict:
+        """
+        Full snapshot of the room sent to a joining client.
+
+        Returns:
+            Dict: Game status plus board layout, rules, player names and icons and taken seats.
+        """
+        game = self.game
+        status = game.get_game_status()
+        # The seed would let clients predict the server's dice
+        del status["seed"]
+        status.update(
+            players_position=game.players_position,
+            board=game.board.to_dict(),
+            rules=game.rules.to_dict(),
+            players={player_id: {"name": game.get_player_name(player_id), "icon": game.get_player_icon(player_id)}
+                     for player_id in range(1, game.num_players + 1)},
+            seated=sorted(self.seats)
+        )
+        return status
+
+
+class GameServer:
+    """
+    Holds every room in memory and applies client messages to them.
+
+    The server is transport-agnostic: a connection is any object with an async
+    ``send(text)`` method that can be iterated asynchronously for incoming text
+    messages, which is the interface of a ``websockets`` connection. All rooms live
+    in one event loop, so game state needs no locks.
+    """
+
+    def __init__(self, board: Board = DEFAULT_BOARD, rules: Rules = CLASSIC_RULES):
+        """
+        Create a server with no rooms.
+
+        Args:
+            board (Board): Board used by every room. Defaults to the classic board.
+            rules (Rules): Rule variant used by every room. Defaults to the classic rules.
+
+        Raises:
+            ValueError: If players could get stuck on the board under these rules.
+        """
+        # Compiled now, so a board that traps players fails at startup rather than on the first join
+        rules.compile(board)
+        self.board = board
+        self.rules = rules
+        self.rooms: Dict[str, Room] = {}
+        # Connection to (room, player ID) for every seated connection
+        self.sessions: Dict[object, Tuple[Room, int]] = {}
+
+    async def handle_connection(self, connection) -> None:
+        """
+        Process a connection's messages until it closes, then free its seat.
+
+        Args:
+            connection: Connection to serve.
+        """
+        try:
+            async for text in connection:
+                await self.handle_message(connection, text)
+        finally:
+            await self.leave(connection)
+
+    async def handle_message(self, connection, text: str) -> None:
+        """
+        Apply one client message.
+
+        Invalid messages are answered with an ``error`` message to the sender only.
+
+        Args:
+            connection: Connection the message came from.
+            text (str): JSON message.
+        """
+        try:
+            message = json.loads(text)
+            kind = message.get("type") if isinstance(message, dict) else None
+        except ValueError:
+            kind = None
+        if kind == "join":
+            await self.join(connection, message)
+        elif kind == "roll":
+            await self.roll(connection)
+        elif kind == "sync":
+            await self.sync(connection, message)
+        else:
+            await self.send_error(connection, "Unknown message")
+
+    async def join(self, connection, message: Dict) -> None:
+        """
+        Seat a connection in a room, creating the room on first join.
+
+        Args:
+            connection: Joining connection.
+            message (Dict): ``join`` message with ``room`` and optional ``players``, ``name`` and ``icon``.
+        """
+        if connection in self.sessions:
+            await self.send_error(connection, "Already in a room")
+            return
+        room_id = message.get("room")
+        if not isinstance(room_id, str) or not 0 < len(room_id) <= MAX_ROOM_ID:
+            await self.send_error(connection, f"Room must be a string of 1 to {MAX_ROOM_ID} characters")
+            return
+
+        room = self.rooms.get(room_id)
+        if room is None:
+            num_players = message.get("players", 2)
+            if not isinstance(num_players, int) or not 2 <= num_players <= 4:
+                await self.send_error(connection, "Number of players must be between 2 and 4")
+                return
+            room = self.rooms[room_id] = Room(
+                room_id, SnakeAndLadder(num_players, history_level=HISTORY_PACKED, board=self.board,
+                                        rules=self.rules)
+            )
+            metrics.increment("server_rooms_created")
+
+        player_id = room.free_seat()
+        if player_id is None:
+            await self.send_error(connection, "Room is full")
+            return
+        game = room.game
+        game.set_player_info(
+            player_id,
+            str(message.get("name") or f"Player {player_id}")[:MAX_NAME],
+            str(message.get("icon") or game.get_player_icon(player_id))[:MAX_NAME]
+        )
+        others = list(room.seats.values())
+        room.seats[player_id] = connection
+        self.sessions[connection] = (room, player_id)
+
+        await self.send(connection, {"type": "joined", "room": room_id, "player": player_id, "state": room.state()})
+        await self.broadcast(others, {
+            "type": "player_joined", "player": player_id,
+            "name": game.get_player_name(player_id), "icon": game.get_player_icon(player_id)
+        })
+
+    async def roll(self, connection) -> None:
+        """
+        Roll and move for the connection's seat if it is that seat's turn, then broadcast the move.
+
+        Args:
+            connection: Rolling connection.
+        """
+        session = self.sessions.get(connection)
+        if session is None:
+            await self.send_error(connection, "Join a room first")
+            return
+        room, player_id = session
+        game = room.game
+        if game.game_over:
+            await self.send_error(connection, "Game is already over")
+            return
+        if not room.full:
+            await self.send_error(connection, "Waiting for players")
+            return
+        if game.current_player != player_id:
+            await self.send_error(connection, "Not your turn")
+            return
+
+        with metrics.timer("server_move"):
+            move = game.move_player(game.roll_dice())
+        await self.broadcast(room.seats.values(), {
+            "type": "move",
+            "player": player_id,
+            "dice": move["dice_value"],
+            "from": move["old_position"],
+            "to": move["final_position"],
+            "event": MoveLog.from_dict(move)[4],
+            "next": game.current_player,
+            "winner": game.winner,
+            "version": game.version
+        })
+
+    async def sync(self, connection, message: Dict) -> None:
+        """
+        Send a connection the changes to its room's game since the version it last applied.
+
+        Args:
+            connection: Syncing connection.
+            message (Dict): ``sync`` message with ``version`` and optional ``binary``.
+        """
+        session = self.sessions.get(connection)
+        if session is None:
+            await self.send_error(connection, "Join a room first")
+            return
+        version = message.get("version")
+        if not isinstance(version, int):
+            await self.send_error(connection, "Version must be an integer")
+            return
+        game = session[0].game
+        delta = game.events_since(version)
+        if message.get("binary"):
+            try:
+                await connection.send(pack_delta(delta, wide=game.board_size > 255,
+                                                 wide_players=game.num_players > 255))
+            except ConnectionClosed:
+                pass
+        else:
+            await self.send(connection, {"type": "delta", **delta})
+
+    async def leave(self, connection) -> None:
+        """
+        Free a connection's seat, dropping the room once nobody is seated.
+
+        Args:
+            connection: Departing connection.
+        """
+        session = self.sessions.pop(connection, None)
+        if session is None:
+            return
+        room, player_id = session
+        del room.seats[player_id]
+        if room.seats:
+            await self.broadcast(room.seats.values(), {"type": "player_left", "player": player_id})
+        else:
+            del self.rooms[room.room_id]
+
+    async def send(self, connection, payload: Dict) -> None:
+        await self.broadcast((connection,), payload)
+
+    async def send_error(self, connection, message: str) -> None:
+        await self.send(connection, {"type": "error", "message": message})
+
+    async def broadcast(self, connections: Iterable, payload: Dict) -> None:
+        """
+        Send one message to several connections, encoding it once.
+
+        Sends are awaited one at a time rather than gathered: a send normally completes
+        without suspending, and wrapping each in a task costs more than the send itself.
+        A connection that fails to receive the message is left to its own handler to clean up.
+
+        Args:
+            connections (Iterable): Recipients.
+            payload (Dict): Message.
+        """
+        text = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        for connection in connections:
+            try:
+                await connection.send(text)
+            except ConnectionClosed:
+                pass
+
+
+async def serve(host: str = "localhost", port: int = 8765, server: Optional[GameServer] = None) -> None:
+    """
+    Run a game server on a WebSocket endpoint until cancelled.
+
+    Args:
+        host (str): Interface to listen on. Defaults to localhost.
+        port (int): Port to listen on. Defaults to 8765.
+        server (GameServer): Server to expose. Defaults to a new one on the classic board.
+
+    Raises:
+        ImportError: If the websockets package (13 or later) is not installed.
+    """
+    if websocket_serve is None:
+        raise ImportError("Serving games over WebSockets needs the websockets package (13 or later)")
+    server = server or GameServer()
+
+    async def handler(connection) -> None:
+        try:
+            await server.handle_connection(connection)
+        except ConnectionClosed:
+            pass
+
+    async with websocket_serve(handler, host, port):
+        await asyncio.get_running_loop().create_future()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="localhost", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--board", help="Board definition file (.json or .toml)")
+    parser.add_argument("--rules", choices=sorted(RULE_PRESETS), default="classic", help="Rule variant")
+    args = parser.parse_args()
+
+    board = Board.load(args.board) if args.board else DEFAULT_BOARD
+    metrics.serve()
+    asyncio.run(serve(args.host, args.port, GameServer(board, RULE_PRESETS[args.rules])))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+import atexit
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+
+class SessionStore:
+    """
+    Interface for storing serialized games by key.
+
+    Implementations keep opaque bytes (see ``SnakeAndLadder.to_bytes``) so games
+    survive restarts and can be shared by several app processes. Moves made since a
+    save are appended to it (see ``SnakeAndLadder.to_bytes_since``) without rewriting it.
+    """
+
+    def load(self, key: str) -> Optional[bytes]:
+        """
+        Get the stored game for a key.
+
+        Args:
+            key (str): Game key.
+
+        Returns:
+            Optional[bytes]: Serialized game, or None if the key is unknown.
+        """
+        raise NotImplementedError
+
+    def save(self, key: str, data: bytes) -> None:
+        """
+        Store a game, replacing any previous value for the key.
+
+        Args:
+            key (str): Game key.
+            data (bytes): Serialized game.
+        """
+        self.save_many({key: data})
+
+    def save_many(self, items: Dict[str, bytes]) -> None:
+        """
+        Store several games at once.
+
+        Args:
+            items (Dict[str, bytes]): Game key to serialized game.
+        """
+        raise NotImplementedError
+
+    def append(self, key: str, data: bytes) -> None:
+        """
+        Add bytes to the end of a stored game. Unknown keys are ignored.
+
+        Args:
+            key (str): Game key.
+            data (bytes): Bytes to append, e.g. the moves made since the game was saved.
+        """
+        self.append_many({key: data})
+
+    def append_many(self, items: Dict[str, bytes]) -> None:
+        """
+        Add bytes to the end of several stored games at once. Unknown keys are ignored.
+
+        Args:
+            items (Dict[str, bytes]): Game key to bytes to append.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a stored game. Unknown keys are ignored.
+
+        Args:
+            key (str): Game key.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Release any resources held by the store.
+        """
+
+
+class MemoryStore(SessionStore):
+    """
+    Store games in a dictionary. Shared by all sessions of one process, lost on restart.
+    """
+
+    def __init__(self):
+        self._games = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._games.get(key)
+            return bytes(data) if data is not None else None
+
+    def save_many(self, items: Dict[str, bytes]) -> None:
+        with self._lock:
+            self._games.update((key, bytearray(data)) for key, data in items.items())
+
+    def append_many(self, items: Dict[str, bytes]) -> None:
+        with self._lock:
+            for key, data in items.items():
+                if key in self._games:
+                    self._games[key] += data
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._games.pop(key, None)
+
+
+class SQLiteStore(SessionStore):
+    """
+    Store games in a SQLite database file, usable by several processes on one host.
+
+    Appended bytes are kept as rows of their own until the game is saved again, so an
+    append writes only the new bytes.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) the database.
+
+        Args:
+            path (str): Path to the database file.
+        """
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS games (key TEXT PRIMARY KEY, data BLOB NOT NULL, updated REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE TABLE IF NOT EXISTS appended (key TEXT NOT NULL, data BLOB NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS appended_key ON appended (key)")
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            self._connection.execute("BEGIN")
+            row = self._connection.execute("SELECT data FROM games WHERE key = ?", (key,)).fetchone()
+            appended = self._connection.execute(
+                "SELECT data FROM appended WHERE key = ? ORDER BY rowid", (key,)
+            ).fetchall()
+            self._connection.execute("COMMIT")
+        return row[0] + b"".join(data for data, in appended) if row else None
+
+    def save_many(self, items: Dict[str, bytes]) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO games (key, data, updated) VALUES (?, ?, ?)",
+                [(key, data, now) for key, data in items.items()]
+            )
+            self._connection.executemany("DELETE FROM appended WHERE key = ?", [(key,) for key in items])
+            self._connection.execute("COMMIT")
+
+    def append_many(self, items: Dict[str, bytes]) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT INTO appended (key, data) SELECT ?, ? WHERE EXISTS (SELECT 1 FROM games WHERE key = ?)",
+                [(key, data, key) for key, data in items.items()]
+            )
+            self._connection.executemany("UPDATE games SET updated = ? WHERE key = ?",
+                                         [(now, key) for key in items])
+            self._connection.execute("COMMIT")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("BEGIN")
+            self._connection.execute("DELETE FROM games WHERE key = ?", (key,))
+            self._connection.execute("DELETE FROM appended WHERE key = ?", (key,))
+            self._connection.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class FileStore(SessionStore):
+    """
+    Store each game as a file in a directory, e.g. on a volume shared by replicas.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Create the directory if needed.
+
+        Args:
+            directory (str): Directory holding one file per game.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        if not key.isalnum():
+            raise ValueError("Game keys must be alphanumeric")
+        return os.path.join(self.directory, f"{key}.snl")
+
+    def load(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def save_many(self, items: Dict[str, bytes]) -> None:
+        for key, data in items.items():
+            # Write to a temporary file first so readers never see a partial game
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self._path(key))
+
+    def append_many(self, items: Dict[str, bytes]) -> None:
+        for key, data in items.items():
+            try:
+                # Opened without creating, so bytes for a deleted game are dropped. Appends are small
+                # but not atomic: a reader racing one fails to parse the game and starts a new one
+                with open(self._path(key), "r+b") as f:
+                    f.seek(0, os.SEEK_END)
+                    f.write(data)
+            except FileNotFoundError:
+                pass
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class WriteBehindStore(SessionStore):
+    """
+    Buffer saves in memory and write them to another store in batches.
+
+    Only the latest value per key is kept, and appends are joined until written, so a
+    burst of moves in one game costs a single backend write. Pending saves are flushed
+    when ``batch_size`` keys are waiting, every ``flush_interval`` seconds, and at
+    process exit.
+    """
+
+    def __init__(self, backend: SessionStore, batch_size: int = 64, flush_interval: float = 1.0):
+        """
+        Wrap a store.
+
+        Args:
+            backend (SessionStore): Store that receives the batched writes.
+            batch_size (int): Pending keys that trigger an immediate flush. Defaults to 64.
+            flush_interval (float): Seconds between background flushes. Defaults to 1.0.
+        """
+        self.backend = backend
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = {}
+        self._appends = {}
+        self._lock = threading.Lock()
+        # Serializes backend writes so a delete cannot be overwritten by an in-flight flush
+        self._write_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="session-store-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write all pending saves to the backend now.
+        """
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                appends, self._appends = self._appends, {}
+            # Saves first: appends to a game saved in this batch go after the saved value
+            if pending:
+                self.backend.save_many(pending)
+            if appends:
+                self.backend.append_many({key: bytes(data) for key, data in appends.items()})
+
+    def load(self, key: str) -> Optional[bytes]:
+        # Waits for a running flush, so appends being written are not read from both memory and the backend
+        with self._write_lock:
+            with self._lock:
+                data = self._pending.get(key)
+                appended = bytes(self._appends.get(key, b""))
+            if data is None:
+                data = self.backend.load(key)
+        return data + appended if data is not None else None
+
+    def save_many(self, items: Dict[str, bytes]) -> None:
+        with self._lock:
+            self._pending.update(items)
+            for key in items:
+                self._appends.pop(key, None)
+            full = len(self._pending) + len(self._appends) >= self.batch_size
+        if full:
+            self.flush()
+
+    def append_many(self, items: Dict[str, bytes]) -> None:
+        with self._lock:
+            for key, data in items.items():
+                self._appends.setdefault(key, bytearray()).extend(data)
+            full = len(self._pending) + len(self._appends) >= self.batch_size
+        if full:
+            self.flush()
+
+    def delete(self, key: str) -> None:
+        with self._write_lock:
+            with self._lock:
+                self._pending.pop(key, None)
+                self._appends.pop(key, None)
+            self.backend.delete(key)
+
+    def close(self) -> None:
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self.flush()
+            self.backend.close()
+
+
+def create_store(url: str) -> SessionStore:
+    """
+    Create a store from a URL-like description.
+
+    Args:
+        url (str): "memory", "sqlite:<path>" or "file:<directory>".
+
+    Returns:
+        SessionStore: The configured store.
+
+    Raises:
+        ValueError: If the scheme is unknown.
+    """
+    scheme, _, location = url.partition(":")
+    if scheme == "memory":
+        return MemoryStore()
+    if scheme == "sqlite" and location:
+        return SQLiteStore(location)
+    if scheme == "file" and location:
+        return FileStore(location)
+    raise ValueError(f"Unknown session store: {url!r} (use memory, sqlite:<path> or file:<directory>)")
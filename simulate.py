@@ -0,0 +1,253 @@
+"""
+Play Snake and Ladder games headlessly and stream one result row per finished game.
+
+Rows are written in batches as JSON lines, or as columnar Parquet or Arrow IPC
+batches when pyarrow is installed, so memory stays constant however many games are
+played. Game ``i`` of a run uses dice seed ``--seed + i``; the row records it, so any
+game can be replayed exactly. Streamlit is never imported.
+
+Usage:
+    python -m simulate --games 100000 --players 2 3 4 --seed 0 --output results.jsonl
+    python -m simulate --games 1000000 --output results.parquet --board my_board.json
+    python -m simulate --games 10 --records            # per-move detail, JSON lines on stdout
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from board import DEFAULT_BOARD, Board
+from bots import play_game
+from game import HISTORY_OFF, HISTORY_PACKED, SnakeAndLadder
+from rules import RULE_PRESETS
+
+FORMATS = ("jsonl", "parquet", "arrow")
+
+# Output format implied by a file extension; anything else is JSON lines
+_EXTENSIONS = {".parquet": "parquet", ".arrow": "arrow", ".arrows": "arrow", ".ipc": "arrow"}
+
+
+def iter_games(games: int, players: Sequence[int] = (2,),
+               boards: Sequence[Tuple[str, Board]] = (("classic", DEFAULT_BOARD),), seed: int = 0,
+               rules: str = "classic", records: bool = False) -> Iterator[Dict]:
+    """
+    Play games one at a time and yield their results as they finish.
+
+    Args:
+        games (int): Games per board and player count.
+        players (Sequence[int]): Player counts to play. Defaults to 2 players.
+        boards (Sequence[Tuple[str, Board]]): (label, board) pairs to play on. Defaults to the classic board.
+        seed (int): Dice seed of the first game; later games count up from it. Defaults to 0.
+        rules (str): Rule preset from ``rules.RULE_PRESETS``. Defaults to "classic".
+        records (bool): Include every move as a (player, dice, old position, final position,
+            event) record. Defaults to False.
+
+    Yields:
+        Dict: ``game`` index, ``board`` label, ``rules``, ``players``, ``seed``, ``winner``,
+        ``moves`` in total and, per seat, ``positions``, ``snakes``, ``ladders`` and
+        ``skipped``; with ``records``, also ``records``.
+    """
+    index = 0
+    for label, board in boards:
+        for num_players in players:
+            for _ in range(games):
+                game = SnakeAndLadder(num_players, history_level=HISTORY_PACKED if records else HISTORY_OFF,
+                                      seed=seed + index, board=board, rules=RULE_PRESETS[rules])
+                summary = play_game(game)
+                seats = summary["players"].values()
+                row = {
+                    "game": index,
+                    "board": label,
+                    "rules": rules,
+                    "players": num_players,
+                    "seed": seed + index,
+                    "winner": summary["winner"],
+                    "moves": summary["moves"],
+                    "positions": [seat["position"] for seat in seats],
+                    "snakes": [seat["snakes"] for seat in seats],
+                    "ladders": [seat["ladders"] for seat in seats],
+                    "skipped": [seat["skipped"] for seat in seats]
+                }
+                if records:
+                    row["records"] = list(game.move_records())
+                yield row
+                index += 1
+
+
+class ResultWriter:
+    """
+    Buffer result rows and write them in batches.
+    """
+
+    def __init__(self, batch_size: int = 1000):
+        """
+        Create an empty buffer.
+
+        Args:
+            batch_size (int): Rows per write. Defaults to 1000.
+        """
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._rows: List[Dict] = []
+
+    def write(self, row: Dict) -> None:
+        """
+        Add a row, writing the batch once it is full.
+
+        Args:
+            row (Dict): Result row from ``iter_games``.
+        """
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the buffered rows now.
+        """
+        if self._rows:
+            self._write_batch(self._rows)
+            self.rows_written += len(self._rows)
+            self._rows = []
+
+    def _write_batch(self, rows: List[Dict]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Write the remaining rows and finish the output.
+        """
+        self.flush()
+
+
+class JsonLinesWriter(ResultWriter):
+    """
+    Write rows as JSON lines, one ``write`` call per batch.
+    """
+
+    def __init__(self, sink: IO[str], batch_size: int = 1000):
+        """
+        Write to a text stream.
+
+        Args:
+            sink (IO[str]): Open text file or stdout.
+            batch_size (int): Rows per write. Defaults to 1000.
+        """
+        super().__init__(batch_size)
+        self.sink = sink
+
+    def _write_batch(self, rows: List[Dict]) -> None:
+        self.sink.write("".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows))
+
+    def close(self) -> None:
+        super().close()
+        self.sink.flush()
+
+
+class ArrowWriter(ResultWriter):
+    """
+    Write rows as columnar record batches to a Parquet file or an Arrow IPC stream.
+    """
+
+    def __init__(self, sink: IO[bytes], output_format: str = "parquet", records: bool = False,
+                 batch_size: int = 1000):
+        """
+        Start the output with a fixed schema.
+
+        Args:
+            sink (IO[bytes]): Open binary file or stdout.
+            output_format (str): "parquet" or "arrow". Defaults to "parquet".
+            records (bool): Rows carry per-move ``records``. Defaults to False.
+            batch_size (int): Rows per record batch (a Parquet row group). Defaults to 1000.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        super().__init__(batch_size)
+        # Imported here so JSON-lines runs start without loading pyarrow
+        try:
+            import pyarrow as pa
+            import pyarrow.ipc
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("Parquet and Arrow output need the pyarrow package; use JSON lines instead") from e
+        seats = pa.list_(pa.int16())
+        fields = [("game", pa.int64()), ("board", pa.string()), ("rules", pa.string()), ("players", pa.int16()),
+                  ("seed", pa.int64()), ("winner", pa.int16()), ("moves", pa.int32()), ("positions", seats),
+                  ("snakes", seats), ("ladders", seats), ("skipped", seats)]
+        if records:
+            fields.append(("records", pa.list_(pa.struct([
+                ("player", pa.int16()), ("dice", pa.int8()), ("old_position", pa.int16()),
+                ("final_position", pa.int16()), ("event", pa.uint8())
+            ]))))
+        self._pa = pa
+        self.schema = pa.schema(fields)
+        if output_format == "parquet":
+            self._writer = pyarrow.parquet.ParquetWriter(sink, self.schema)
+        else:
+            self._writer = pyarrow.ipc.new_stream(sink, self.schema)
+
+    def _write_batch(self, rows: List[Dict]) -> None:
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self.schema))
+
+    def close(self) -> None:
+        super().close()
+        self._writer.close()
+
+
+def output_format_for(path: str, output_format: Optional[str] = None) -> str:
+    """
+    Choose the output format, from the option or else the file extension.
+
+    Args:
+        path (str): Output path; "-" is stdout.
+        output_format (str): Explicit format from ``FORMATS``. Defaults to None.
+
+    Returns:
+        str: "jsonl", "parquet" or "arrow".
+    """
+    return output_format or _EXTENSIONS.get(Path(path).suffix.lower(), "jsonl")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=1000, help="Games per board and player count")
+    parser.add_argument("--players", type=int, nargs="+", default=[2], help="Player counts to play")
+    parser.add_argument("--seed", type=int, default=0, help="Dice seed of the first game")
+    parser.add_argument("--board", nargs="+", default=[], help="Board definition files (.json or .toml)")
+    parser.add_argument("--rules", choices=sorted(RULE_PRESETS), default="classic", help="Rule variant")
+    parser.add_argument("--records", action="store_true", help="Include every move of every game")
+    parser.add_argument("--output", default="-", help="Output file, or - for stdout")
+    parser.add_argument("--format", choices=FORMATS, help="Output format. Defaults to the output file's extension")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per write")
+    args = parser.parse_args()
+
+    boards = [(Path(path).stem, Board.load(path)) for path in args.board] or [("classic", DEFAULT_BOARD)]
+    output_format = output_format_for(args.output, args.format)
+    binary = output_format != "jsonl"
+    if args.output == "-":
+        sink = sys.stdout.buffer if binary else sys.stdout
+    else:
+        sink = open(args.output, "wb" if binary else "w", encoding=None if binary else "utf-8")
+
+    start = time.perf_counter()
+    try:
+        if binary:
+            writer = ArrowWriter(sink, output_format, args.records, args.batch_size)
+        else:
+            writer = JsonLinesWriter(sink, args.batch_size)
+        for row in iter_games(args.games, args.players, boards, args.seed, args.rules, args.records):
+            writer.write(row)
+        writer.close()
+    finally:
+        if sink not in (sys.stdout, sys.stdout.buffer):
+            sink.close()
+    elapsed = time.perf_counter() - start
+    print(f"{writer.rows_written:,} games in {elapsed:.1f} s ({writer.rows_written / elapsed:,.0f} games/s)",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from history import EVENT_FORFEIT, EVENT_LADDER, EVENT_OUT_OF_BOUNDS, EVENT_SNAKE
+
+if TYPE_CHECKING:
+    from game import SnakeAndLadder
+
+# Database used by the app and the leaderboard page unless SNL_STATS_DB names another
+DEFAULT_STATS_PATH = "stats.db"
+
+# Names a seat has until a player picks one, e.g. "Player 17"
+DEFAULT_NAME = re.compile(r"Player \d+")
+
+# Orders offered by ``top_players``, each served by an index
+LEADERBOARD_ORDERS = {
+    "wins": "wins DESC, games ASC",
+    "games": "games DESC, wins DESC",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    finished REAL NOT NULL,
+    players INTEGER NOT NULL,
+    moves INTEGER NOT NULL,
+    winner TEXT
+);
+CREATE TABLE IF NOT EXISTS player_stats (
+    name TEXT PRIMARY KEY,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    turns INTEGER NOT NULL,
+    snakes INTEGER NOT NULL,
+    ladders INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    last_played REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS player_stats_wins ON player_stats (wins DESC, games ASC);
+CREATE INDEX IF NOT EXISTS player_stats_games ON player_stats (games DESC, wins DESC);
+"""
+
+_UPSERT_PLAYER = """
+INSERT INTO player_stats (name, games, wins, turns, snakes, ladders, skipped, last_played)
+VALUES (?, 1, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (name) DO UPDATE SET
+    games = games + 1,
+    wins = wins + excluded.wins,
+    turns = turns + excluded.turns,
+    snakes = snakes + excluded.snakes,
+    ladders = ladders + excluded.ladders,
+    skipped = skipped + excluded.skipped,
+    last_played = excluded.last_played
+"""
+
+_PLAYER_COLUMNS = ("name", "games", "wins", "turns", "snakes", "ladders", "skipped", "last_played")
+
+
+def game_summary(game: "SnakeAndLadder") -> Dict:
+    """
+    Build the compact summary of a finished game, in one pass over its move records.
+
+    Args:
+        game (SnakeAndLadder): Game played with history level "full" or "packed".
+
+    Returns:
+        Dict: ``moves`` in total, ``winner`` name (None if nobody won) and, per player
+        name, ``turns``, ``snakes``, ``ladders``, ``skipped`` and ``won`` (0 or 1).
+        Players sharing a name are added together.
+    """
+    # Turns, snake hits, ladder climbs and skipped turns per player ID
+    counts = [[0, 0, 0, 0] for _ in range(game.num_players + 1)]
+    moves = 0
+    for player_id, _, _, _, event in game.move_records():
+        moves += 1
+        row = counts[player_id]
+        row[0] += 1
+        if event & (EVENT_OUT_OF_BOUNDS | EVENT_FORFEIT):
+            row[3] += 1
+        elif event & EVENT_SNAKE:
+            row[1] += 1
+        elif event & EVENT_LADDER:
+            row[2] += 1
+
+    winner = game.get_player_name(game.winner) if game.winner else None
+    players = {}
+    for player_id in range(1, game.num_players + 1):
+        turns, snakes, ladders, skipped = counts[player_id]
+        name = game.get_player_name(player_id)
+        player = players.setdefault(name, {"turns": 0, "snakes": 0, "ladders": 0, "skipped": 0, "won": 0})
+        player["turns"] += turns
+        player["snakes"] += snakes
+        player["ladders"] += ladders
+        player["skipped"] += skipped
+        player["won"] |= player_id == game.winner
+    return {"moves": moves, "winner": winner, "players": players}
+
+
+def is_ranked(game: "SnakeAndLadder") -> bool:
+    """
+    Check whether a finished game belongs on the leaderboard.
+
+    Seats still named like "Player 17" are not people the leaderboard can tell apart,
+    so games with any of them are left out.
+
+    Args:
+        game (SnakeAndLadder): Finished game.
+
+    Returns:
+        bool: True if every seat has a name of its own.
+    """
+    return not any(DEFAULT_NAME.fullmatch(game.get_player_name(player_id))
+                   for player_id in range(1, game.num_players + 1))
+
+
+class StatsStore:
+    """
+    Cross-game leaderboard and per-player statistics in a SQLite database.
+
+    Every finished game adds one summary row and updates pre-aggregated counters per
+    player name with an UPSERT, so reading the leaderboard never scans the games:
+    the top players come from an index and a player's totals from the primary key,
+    in milliseconds however many games were recorded.
+    """
+
+    def __init__(self, path: str = DEFAULT_STATS_PATH):
+        """
+        Open (and create if needed) the database.
+
+        Args:
+            path (str): Path to the database file, or ":memory:". Defaults to "stats.db".
+        """
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def record_game(self, key: str, summary: Dict, finished: Optional[float] = None) -> bool:
+        """
+        Record a finished game and add it to its players' counters.
+
+        Args:
+            key (str): Unique key of this finished game; recording a key again does nothing.
+            summary (Dict): Summary returned by ``game_summary``.
+            finished (float): Time the game ended. Defaults to now.
+
+        Returns:
+            bool: True if the game was recorded, False if the key was already recorded.
+        """
+        return self.record_games([(key, summary)], finished) == 1
+
+    def record_games(self, games: Iterable[Tuple[str, Dict]], finished: Optional[float] = None) -> int:
+        """
+        Record several finished games in one transaction.
+
+        Args:
+            games (Iterable[Tuple[str, Dict]]): (key, summary) pairs, as for ``record_game``.
+            finished (float): Time the games ended. Defaults to now.
+
+        Returns:
+            int: Number of games recorded; already recorded keys are skipped.
+        """
+        finished = time.time() if finished is None else finished
+        recorded = 0
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN")
+            try:
+                for key, summary in games:
+                    players = summary["players"]
+                    cursor.execute(
+                        "INSERT OR IGNORE INTO games (key, finished, players, moves, winner) VALUES (?, ?, ?, ?, ?)",
+                        (key, finished, len(players), summary["moves"], summary["winner"])
+                    )
+                    # The counters are only updated the first time a game is recorded
+                    if cursor.rowcount != 1:
+                        continue
+                    recorded += 1
+                    cursor.executemany(_UPSERT_PLAYER, [
+                        (name, player["won"], player["turns"], player["snakes"], player["ladders"],
+                         player["skipped"], finished)
+                        for name, player in players.items()
+                    ])
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+        return recorded
+
+    def top_players(self, limit: int = 10, order: str = "wins") -> List[Dict]:
+        """
+        Get the leaderboard.
+
+        Args:
+            limit (int): Players to return. Defaults to 10.
+            order (str): "wins" or "games", see ``LEADERBOARD_ORDERS``. Defaults to "wins".
+
+        Returns:
+            List[Dict]: Player statistics, see ``player``, best first.
+
+        Raises:
+            ValueError: If order is unknown.
+        """
+        if order not in LEADERBOARD_ORDERS:
+            raise ValueError(f"Leaderboard order must be one of {', '.join(LEADERBOARD_ORDERS)}")
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {', '.join(_PLAYER_COLUMNS)} FROM player_stats "
+                f"ORDER BY {LEADERBOARD_ORDERS[order]} LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._player_dict(row) for row in rows]
+
+    def player(self, name: str) -> Optional[Dict]:
+        """
+        Get one player's totals.
+
+        Args:
+            name (str): Player name.
+
+        Returns:
+            Optional[Dict]: ``name``, ``games``, ``wins``, ``turns``, ``snakes``, ``ladders``,
+            ``skipped``, ``last_played``, ``win_rate`` and ``average_turns``, or None if the
+            player has not finished a game.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {', '.join(_PLAYER_COLUMNS)} FROM player_stats WHERE name = ?", (name,)
+            ).fetchone()
+        return self._player_dict(row) if row else None
+
+    def recent_games(self, limit: int = 10) -> List[Dict]:
+        """
+        Get the most recently recorded games.
+
+        Args:
+            limit (int): Games to return. Defaults to 10.
+
+        Returns:
+            List[Dict]: ``key``, ``finished``, ``players``, ``moves`` and ``winner``, newest first.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, finished, players, moves, winner FROM games ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(zip(("key", "finished", "players", "moves", "winner"), row)) for row in rows]
+
+    @staticmethod
+    def _player_dict(row: Tuple) -> Dict:
+        player = dict(zip(_PLAYER_COLUMNS, row))
+        player["win_rate"] = player["wins"] / player["games"]
+        player["average_turns"] = player["turns"] / player["games"]
+        return player
+
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+def open_stats_store(path: Optional[str] = None) -> StatsStore:
+    """
+    Open the statistics database.
+
+    Args:
+        path (str): Database file. Defaults to the SNL_STATS_DB environment variable, else "stats.db".
+
+    Returns:
+        StatsStore: The store.
+    """
+    return StatsStore(path or os.environ.get("SNL_STATS_DB", DEFAULT_STATS_PATH))
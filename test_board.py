@@ -0,0 +1,19 @@
+import gc
+
+from board import Board
+from rules import CLASSIC_RULES
+
+
+def test_boards_are_shared_while_in_use_and_dropped_after():
+    board = Board.create(50, {20: 3}, {4: 30})
+    assert Board.create(50, {20: 3}, {4: 30}) is board
+    cached = len(Board._cache)
+    for size in range(60, 160):
+        Board.create(size, {}, {})
+    gc.collect()
+    assert len(Board._cache) == cached
+
+
+def test_generated_boards_can_be_played_by_the_classic_rules():
+    for seed in range(20):
+        CLASSIC_RULES.compile(Board.generate(seed=seed))
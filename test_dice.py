@@ -0,0 +1,36 @@
+from dice import BufferedDice
+from game import HISTORY_PACKED, SnakeAndLadder
+
+
+def play(game, moves):
+    for _ in range(moves):
+        if game.game_over:
+            break
+        game.move_player(game.roll_dice())
+
+
+def test_seeded_games_replay_the_same_history():
+    first, second = SnakeAndLadder(3, seed=42), SnakeAndLadder(3, seed=42)
+    play(first, 200)
+    play(second, 200)
+    assert first.move_history == second.move_history
+    assert first.move_history != {1: [], 2: [], 3: []}
+
+
+def test_round_trip_continues_the_roll_stream():
+    game = SnakeAndLadder(2, history_level=HISTORY_PACKED, seed=7)
+    play(game, 25)
+    restored = SnakeAndLadder.from_bytes(game.to_bytes())
+    assert restored.seed == game.seed
+    assert [restored.roll_dice() for _ in range(100)] == [game.roll_dice() for _ in range(100)]
+
+
+def test_skip_lines_up_across_block_boundary():
+    dice = BufferedDice(seed=5, block_size=16)
+    rolls = [dice.roll() for _ in range(40)]
+    for skipped in (0, 15, 16, 17, 33):
+        resumed = BufferedDice(seed=5, block_size=16)
+        resumed.skip(skipped)
+        assert resumed.rolls == skipped
+        assert [resumed.roll() for _ in range(40 - skipped)] == rolls[skipped:]
+
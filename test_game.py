@@ -0,0 +1,51 @@
+import pytest
+
+from game import HISTORY_OFF, HISTORY_PACKED, SnakeAndLadder
+from rules import RULE_PRESETS
+
+
+def play(game, moves):
+    for _ in range(moves):
+        if game.game_over:
+            break
+        game.move_player(game.roll_dice())
+
+
+def test_truncated_state_raises_value_error():
+    game = SnakeAndLadder(3, history_level=HISTORY_PACKED, seed=3)
+    play(game, 30)
+    data = game.to_bytes()
+    for cut in range(len(data)):
+        with pytest.raises(ValueError):
+            SnakeAndLadder.from_bytes(data[:cut])
+
+
+def test_appended_moves_restore_the_current_game():
+    game = SnakeAndLadder(3, history_level=HISTORY_PACKED, seed=4, rules=RULE_PRESETS["sixes"], history_limit=16)
+    data, version = game.to_bytes(), game.version
+    for moves in (1, 0, 5, 40):
+        play(game, moves)
+        data += game.to_bytes_since(version)
+        version = game.version
+        restored = SnakeAndLadder.from_bytes(data, history_limit=16)
+        assert restored.to_bytes() == game.to_bytes()
+        assert [restored.roll_dice() for _ in range(10)] == [game.roll_dice() for _ in range(10)]
+
+
+def test_moves_cannot_be_appended_across_a_reset_or_without_history():
+    game = SnakeAndLadder(2, history_level=HISTORY_PACKED, seed=5)
+    play(game, 5)
+    version = game.version
+    game.reset_game()
+    assert game.to_bytes_since(version) is None
+    assert SnakeAndLadder(2, history_level=HISTORY_OFF).to_bytes_since(0) is None
+
+
+def test_appended_moves_out_of_order_are_rejected():
+    game = SnakeAndLadder(2, history_level=HISTORY_PACKED, seed=6)
+    data = game.to_bytes()
+    play(game, 3)
+    first = game.to_bytes_since(0)
+    play(game, 3)
+    with pytest.raises(ValueError):
+        SnakeAndLadder.from_bytes(data + game.to_bytes_since(3) + first)
@@ -0,0 +1,68 @@
+from board import Board
+from game import HISTORY_PACKED, LOBBY_MIN_PLAYERS, SnakeAndLadder
+from history import MoveLog, apply_delta, pack_delta, unpack_delta
+
+
+def play(game, moves):
+    for _ in range(moves):
+        if game.game_over:
+            break
+        game.move_player(game.roll_dice())
+
+
+def test_history_iterator_survives_moves():
+    game = SnakeAndLadder(2, history_level=HISTORY_PACKED, seed=3)
+    play(game, 10)
+    expected = list(game.move_records())
+    records = game.move_records()
+    first = next(records)
+    play(game, 50)
+    assert [first, *records] == expected
+
+
+def test_history_iterator_survives_growth():
+    log = MoveLog(capacity=2)
+    log.append(1, 1, 0, 1, 0)
+    log.append(1, 1, 1, 2, 0)
+    records = log.records()
+    first = next(records)
+    for i in range(2, 20):
+        log.append(1, 1, i, i + 1, 0)
+    assert [first[2], *(record[2] for record in records)] == [0, 1]
+
+
+def test_history_iterator_survives_spills():
+    log = MoveLog(limit=4)
+    for i in range(6):
+        log.append(1, 1, i, i + 1, 0)
+    records = log.records()
+    seen = [next(records)]
+    for i in range(6, 40):
+        log.append(1, 1, i, i + 1, 0)
+    seen.extend(records)
+    assert [record[2] for record in seen] == list(range(6))
+    assert [record[2] for record in log.records()] == list(range(40))
+
+
+def test_delta_of_more_than_65535_moves_round_trips():
+    game = SnakeAndLadder(40, history_level=HISTORY_PACKED, seed=11, board=Board.create(10000, {}, {}))
+    version, positions = game.version, game.players_position
+    play(game, 70000)
+    delta = game.events_since(version)
+    assert len(delta["moves"]) > 0xFFFF
+    for wide_players in (False, True):
+        unpacked = unpack_delta(pack_delta(delta, wide=True, wide_players=wide_players))
+        assert unpacked["moves"] == delta["moves"]
+        status = apply_delta({"version": version, "players_position": dict(positions)}, unpacked)
+        assert status["players_position"] == game.players_position
+        assert status["version"] == game.version
+
+
+def test_lobby_status_has_no_position_map():
+    game = SnakeAndLadder(LOBBY_MIN_PLAYERS, history_level=HISTORY_PACKED, seed=2)
+    status = game.get_game_status()
+    assert "players_position" not in status
+    play(game, 30)
+    apply_delta(status, game.events_since(status["version"]))
+    game.reset_game()
+    assert apply_delta(status, game.events_since(status["version"])) == game.get_game_status()
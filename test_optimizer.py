@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from board import DEFAULT_BOARD, Board
+from optimizer import LayoutAnalysis, Target
+
+
+def assert_same_analysis(analysis, board, target):
+    fresh = LayoutAnalysis(board)
+    assert target.score(analysis) == pytest.approx(target.score(fresh))
+    for expected, actual in zip(fresh.expected_landings(2), analysis.expected_landings(2)):
+        np.testing.assert_allclose(actual, expected, atol=1e-9)
+
+
+def test_move_and_undo_match_a_fresh_analysis():
+    target = Target(2, median_turns=40, expected_turns=50, max_first_seat_advantage=0.01)
+    analysis = LayoutAnalysis(DEFAULT_BOARD)
+    target.score(analysis)
+    analysis.expected_landings(2)
+
+    start = next(iter(DEFAULT_BOARD.ladders))
+    free = next(square for square in range(2, DEFAULT_BOARD.size)
+                if square not in analysis.jumps and square not in analysis.jumps.values())
+    end = DEFAULT_BOARD.ladders[start]
+    token = analysis.move_jump(start, free, end)
+    moved = Board.create(DEFAULT_BOARD.size, dict(DEFAULT_BOARD.snakes),
+                         {**{foot: top for foot, top in DEFAULT_BOARD.ladders.items() if foot != start}, free: end})
+    assert_same_analysis(analysis, moved, target)
+
+    analysis.undo(token)
+    assert_same_analysis(analysis, DEFAULT_BOARD, target)
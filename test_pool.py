@@ -0,0 +1,41 @@
+import gc
+
+from game import HISTORY_PACKED
+from pool import GamePool, PoolLease
+
+
+def test_released_game_is_reused():
+    pool = GamePool()
+    game = pool.acquire(2, seed=1)
+    game.move_player(game.roll_dice())
+    pool.release(game)
+    reused = pool.acquire(2, {1: "Ann", 2: "Bob"}, seed=2)
+    assert reused is game
+    assert reused.players_position == {1: 0, 2: 0}
+    assert reused.get_player_name(1) == "Ann"
+    assert pool.stats()["hits"] == 1
+
+
+def test_collected_lease_returns_game():
+    pool = GamePool()
+    lease = PoolLease()
+    game = pool.acquire(2, history_level=HISTORY_PACKED, history_limit=64, lease=lease)
+    assert pool.stats()["live"] == 1
+    del lease
+    gc.collect()
+    stats = pool.stats()
+    assert stats["reclaimed"] == 1
+    assert stats["idle"] == 1
+    assert pool.acquire(2, history_level=HISTORY_PACKED, history_limit=64) is game
+
+
+def test_stale_lease_does_not_return_reacquired_game():
+    pool = GamePool()
+    lease = PoolLease()
+    game = pool.acquire(2, lease=lease)
+    pool.release(game)
+    assert pool.acquire(2) is game
+    del lease
+    gc.collect()
+    assert pool.stats()["reclaimed"] == 0
+    assert pool.stats()["idle"] == 0
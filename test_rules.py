@@ -0,0 +1,33 @@
+import pytest
+
+from board import Board
+from game import SnakeAndLadder
+from rules import (CLASSIC_RULES, MAX_SIXES_FORFEIT, OVERSHOOT_BOUNCE, OVERSHOOT_RULES, RULE_PRESETS,
+                   Rules)
+
+
+def test_sixes_forfeit_is_capped():
+    assert Rules(extra_roll_on_six=True, sixes_forfeit=MAX_SIXES_FORFEIT).sixes_forfeit == MAX_SIXES_FORFEIT
+    with pytest.raises(ValueError):
+        Rules.from_dict({"extra_roll_on_six": True, "sixes_forfeit": MAX_SIXES_FORFEIT + 1})
+    with pytest.raises(ValueError):
+        Rules.from_dict({"extra_roll_on_six": True, "sixes_forfeit": 255})
+
+
+def test_boards_that_trap_players_only_when_bouncing_are_rejected_for_bounce():
+    # Every opening roll climbs to 39; only a bounce lands on the snake at 35, whose tail is walled in by snakes
+    board = Board.create(40, {35: 10, **{head: 10 for head in range(11, 17)}}, {foot: 39 for foot in range(1, 7)})
+    CLASSIC_RULES.compile(board)
+    SnakeAndLadder(2, board=board)
+    with pytest.raises(ValueError, match="never leads"):
+        Rules(overshoot=OVERSHOOT_BOUNCE).compile(board)
+    with pytest.raises(ValueError):
+        SnakeAndLadder(2, board=board, rules=RULE_PRESETS["bounce"])
+
+
+def test_boards_that_trap_players_are_rejected_when_compiled():
+    # Snakes on every square within a roll of 10 send players back there
+    board = Board.create(20, {head: 10 for head in range(11, 17)}, {})
+    for overshoot in OVERSHOOT_RULES:
+        with pytest.raises(ValueError, match="never leads"):
+            Rules(overshoot=overshoot).compile(board)
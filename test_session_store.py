@@ -0,0 +1,39 @@
+import pytest
+
+from game import HISTORY_PACKED, SnakeAndLadder
+from session_store import FileStore, MemoryStore, SQLiteStore, WriteBehindStore
+
+
+@pytest.fixture(params=["memory", "sqlite", "file", "write-behind"])
+def store(request, tmp_path):
+    stores = {
+        "memory": lambda: MemoryStore(),
+        "sqlite": lambda: SQLiteStore(str(tmp_path / "games.db")),
+        "file": lambda: FileStore(str(tmp_path / "games")),
+        "write-behind": lambda: WriteBehindStore(SQLiteStore(str(tmp_path / "games.db")), batch_size=4),
+    }
+    store = stores[request.param]()
+    yield store
+    store.close()
+
+
+def test_appends_follow_the_latest_save(store):
+    game = SnakeAndLadder(2, history_level=HISTORY_PACKED, seed=1)
+    store.save("game1", game.to_bytes())
+    version = game.version
+    for move in range(30):
+        game.move_player(game.roll_dice())
+        store.append("game1", game.to_bytes_since(version))
+        version = game.version
+        if move == 10:
+            store.save("game1", game.to_bytes())
+    assert SnakeAndLadder.from_bytes(store.load("game1")).to_bytes() == game.to_bytes()
+
+
+def test_appends_to_unknown_or_deleted_games_are_dropped(store):
+    store.append("game2", b"moves")
+    assert store.load("game2") is None
+    store.save("game2", b"saved")
+    store.delete("game2")
+    store.append("game2", b"moves")
+    assert store.load("game2") is None
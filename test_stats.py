@@ -0,0 +1,11 @@
+from game import SnakeAndLadder
+from stats import is_ranked
+
+
+def test_games_with_default_names_are_not_ranked():
+    assert is_ranked(SnakeAndLadder(2, {1: "Ann", 2: "Bob"}))
+    assert not is_ranked(SnakeAndLadder(2))
+    assert not is_ranked(SnakeAndLadder(2, {1: "Ann", 2: "Player 2"}))
+    # Another seat's default name is no more telling than the seat's own
+    assert not is_ranked(SnakeAndLadder(2, {1: "Player 17", 2: "Bob"}))
+    assert is_ranked(SnakeAndLadder(2, {1: "Player One", 2: "Bob"}))
@@ -0,0 +1,24 @@
+import pytest
+
+from tournament import TournamentStats, run_tournament
+
+
+def test_empty_stats_summarize_to_zeros():
+    summary = TournamentStats(3).summary()
+    assert summary["games"] == 0
+    assert summary["win_rate"] == {1: 0.0, 2: 0.0, 3: 0.0}
+    assert summary["turns"]["mean"] == 0.0
+    assert summary["turns"]["max"] == 0
+
+
+@pytest.mark.parametrize("n_games, shard_size", [(0, 100), (-5, 100), (10, 0), (10, -1)])
+def test_run_tournament_rejects_empty_games_and_shards(n_games, shard_size):
+    with pytest.raises(ValueError):
+        run_tournament(n_games, (2,), workers=0, shard_size=shard_size)
+
+
+def test_run_tournament_summary():
+    stats = run_tournament(50, (2,), root_seed=1, workers=0, shard_size=20)
+    summary = stats[2].summary()
+    assert summary["games"] == 50
+    assert sum(summary["win_rate"].values()) == pytest.approx(1.0)
@@ -0,0 +1,221 @@
+"""
+Run large offline Snake and Ladder tournaments across several processes.
+
+Usage:
+    python tournament.py --games 1000000 --players 2 3 4 --seed 0 --workers 8
+"""
+import argparse
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from board import DEFAULT_BOARD, Board
+from game import SnakeAndLadder
+
+
+def shard_seed(root_seed: int, num_players: int, shard: int) -> int:
+    """
+    Derive the seed of one shard from the tournament's root seed.
+
+    Seeds depend only on the shard's position, never on which worker runs it, so a
+    fixed root seed gives the same tournament for any number of workers.
+
+    Args:
+        root_seed (int): Seed of the whole tournament.
+        num_players (int): Player count of the shard.
+        shard (int): Index of the shard among those with this player count.
+
+    Returns:
+        int: Seed for ``SnakeAndLadder.simulate_batch``.
+    """
+    sequence = np.random.SeedSequence(root_seed, spawn_key=(num_players, shard))
+    return int(sequence.generate_state(1, np.uint64)[0])
+
+
+def play_shard(num_players: int, n_games: int, seed: int, board: Board = DEFAULT_BOARD) -> Dict:
+    """
+    Play one shard of games and reduce it to compact aggregates.
+
+    Args:
+        num_players (int): Players per game.
+        n_games (int): Games in the shard.
+        seed (int): Seed of the shard.
+        board (Board): Board to play on. Defaults to the classic board.
+
+    Returns:
+        Dict: ``num_players``, ``games``, ``wins`` per seat, ``turns`` histogram
+        and ``snake_hits``/``ladder_hits`` per square.
+    """
+    game = SnakeAndLadder(num_players, history_level="off", board=board)
+    result = game.simulate_batch(n_games, seed=seed, count_jumps=True)
+    return {
+        "num_players": num_players,
+        "games": n_games,
+        "wins": np.bincount(result["winner"], minlength=num_players + 1)[1:],
+        "turns": np.bincount(result["turns"]),
+        "snake_hits": result["snake_hits"],
+        "ladder_hits": result["ladder_hits"]
+    }
+
+
+class TournamentStats:
+    """
+    Running aggregates for all games with one player count.
+
+    Memory depends on the board size and the longest game seen, not on the number
+    of games merged.
+    """
+
+    def __init__(self, num_players: int, board_size: int = 100):
+        """
+        Create empty aggregates.
+
+        Args:
+            num_players (int): Players per game.
+            board_size (int): Number of squares on the board. Defaults to 100.
+        """
+        self.num_players = num_players
+        self.games = 0
+        self.wins = np.zeros(num_players, dtype=np.int64)
+        self.turns = np.zeros(1, dtype=np.int64)
+        self.snake_hits = np.zeros(board_size + 1, dtype=np.int64)
+        self.ladder_hits = np.zeros(board_size + 1, dtype=np.int64)
+
+    def merge(self, shard: Dict) -> None:
+        """
+        Add the aggregates of one shard.
+
+        Args:
+            shard (Dict): Result of ``play_shard``.
+        """
+        self.games += shard["games"]
+        self.wins += shard["wins"]
+        if len(shard["turns"]) > len(self.turns):
+            self.turns = np.concatenate([self.turns, np.zeros(len(shard["turns"]) - len(self.turns), dtype=np.int64)])
+        self.turns[:len(shard["turns"])] += shard["turns"]
+        self.snake_hits += shard["snake_hits"]
+        self.ladder_hits += shard["ladder_hits"]
+
+    def summary(self) -> Dict:
+        """
+        Summarize the aggregates for publishing.
+
+        Returns:
+            Dict: Win rate per seat, turn statistics and hit counts per square, all zero
+            before any game is merged.
+        """
+        cumulative = np.cumsum(self.turns)
+        rolls = np.arange(len(self.turns))
+        games = max(self.games, 1)
+
+        def percentile(fraction: float) -> int:
+            return int(np.searchsorted(cumulative, fraction * self.games))
+
+        return {
+            "games": self.games,
+            "win_rate": {seat + 1: float(wins / games) for seat, wins in enumerate(self.wins)},
+            "turns": {
+                "mean": float((self.turns * rolls).sum() / games),
+                "median": percentile(0.5),
+                "p99": percentile(0.99),
+                "max": int(rolls[self.turns > 0].max()) if self.games else 0,
+                "histogram": self.turns.tolist()
+            },
+            "snake_hits": {square: int(hits) for square, hits in enumerate(self.snake_hits) if hits},
+            "ladder_hits": {square: int(hits) for square, hits in enumerate(self.ladder_hits) if hits}
+        }
+
+
+def iter_shards(n_games: int, player_counts: Iterable[int], root_seed: int,
+                shard_size: int) -> Iterator[Tuple[int, int, int]]:
+    """
+    Split a tournament into shards.
+
+    Args:
+        n_games (int): Games per player count.
+        player_counts (Iterable[int]): Player counts to play.
+        root_seed (int): Seed of the whole tournament.
+        shard_size (int): Games per shard.
+
+    Returns:
+        Iterator[Tuple[int, int, int]]: (num_players, games, seed) for each shard.
+    """
+    for num_players in player_counts:
+        for shard, start in enumerate(range(0, n_games, shard_size)):
+            yield num_players, min(shard_size, n_games - start), shard_seed(root_seed, num_players, shard)
+
+
+def run_tournament(n_games: int, player_counts: Iterable[int] = (2, 3, 4), root_seed: int = 0,
+                   workers: Optional[int] = None, shard_size: int = 20_000,
+                   board: Board = DEFAULT_BOARD) -> Dict[int, TournamentStats]:
+    """
+    Play a tournament, merging shard results into running aggregates as they arrive.
+
+    At most two shards per worker are in flight, so memory stays constant however
+    many games are played. Aggregates are integer sums, so the result for a fixed
+    root seed does not depend on the worker count or completion order.
+
+    Args:
+        n_games (int): Games per player count.
+        player_counts (Iterable[int]): Player counts to play. Defaults to 2, 3 and 4.
+        root_seed (int): Seed of the whole tournament. Defaults to 0.
+        workers (int): Worker processes; 0 plays in this process. Defaults to the CPU count.
+        shard_size (int): Games per shard. Defaults to 20,000.
+        board (Board): Board to play on. Defaults to the classic board.
+
+    Returns:
+        Dict[int, TournamentStats]: Aggregates per player count.
+
+    Raises:
+        ValueError: If n_games or shard_size is less than 1.
+    """
+    if n_games < 1:
+        raise ValueError("A tournament needs at least one game per player count")
+    if shard_size < 1:
+        raise ValueError("Shards need at least one game")
+    player_counts = list(player_counts)
+    stats = {num_players: TournamentStats(num_players, board.size) for num_players in player_counts}
+    shards = iter_shards(n_games, player_counts, root_seed, shard_size)
+
+    if workers == 0:
+        for shard in shards:
+            result = play_shard(*shard, board)
+            stats[result["num_players"]].merge(result)
+        return stats
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for shard in shards:
+            pending.add(executor.submit(play_shard, *shard, board))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    stats[result["num_players"]].merge(result)
+        for future in wait(pending).done:
+            result = future.result()
+            stats[result["num_players"]].merge(result)
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=100_000, help="Games per player count")
+    parser.add_argument("--players", type=int, nargs="+", default=[2, 3, 4], help="Player counts to play")
+    parser.add_argument("--seed", type=int, default=0, help="Root seed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 = in-process)")
+    parser.add_argument("--shard-size", type=int, default=20_000, help="Games per shard")
+    parser.add_argument("--board", help="Board definition file (.json or .toml)")
+    args = parser.parse_args()
+
+    board = Board.load(args.board) if args.board else DEFAULT_BOARD
+    stats = run_tournament(args.games, args.players, args.seed, args.workers, args.shard_size, board)
+    print(json.dumps({num_players: s.summary() for num_players, s in stats.items()}, indent=2))
+
+
+if __name__ == "__main__":
+    main()